@@ -1,11 +1,29 @@
+from concurrent.futures import ThreadPoolExecutor
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from pathlib import Path
 import json
+import os
 import yaml
 
 from core.orchestration.interview_orchestrator import InterviewOrchestrator
+from core.orchestration.pipeline_builder import load_pipeline_config
+from core.orchestration.session_manager import SessionManager
+from core.models.audio.dsp_pool import DSPProcessPool
+from core.models.audio.asr_pool import ASRWorkerPool
+from core.models.remote.inference_client import InferenceClient, RemoteASR, load_authkey
+from core.utils.audio_cache import AudioResultCache
+from core.utils import audio_utils
+from core.utils.metrics import CACHE_HIT_RATIO, MODEL_LOAD_SECONDS, PROCESS_MEMORY_BYTES, REGISTRY
+from core.utils.process_memory import read_smaps_rollup
+from core.utils.profiling import ProfilingController
+from api.middleware import RequestMetricsMiddleware, UploadSizeLimitMiddleware
 from api.routes.submit_text import router as submit_text_router
 from api.routes.submit_audio import router as submit_audio_router
+from api.routes.live import router as live_router
+from api.routes.admin import router as admin_router
+from api.routes.sessions import router as sessions_router
+from api.routes.reports import router as reports_router
 
 # =====================================================
 # PATH SETUP
@@ -16,6 +34,59 @@ QUESTIONS_PATH = BASE_DIR / "data" / "questions" / "questions.json"
 CORPUS_CHUNKS_PATH = BASE_DIR / "data" / "corpus" / "processed_chunks" / "corpus_chunks.json"
 FAISS_INDEX_PATH = BASE_DIR / "data" / "embeddings" / "faiss_index.bin"
 WEIGHTS_PATH = BASE_DIR / "config" / "weights.yaml"
+CONFIG_PATH = BASE_DIR / "config" / "default.yaml"
+
+with open(CONFIG_PATH, "r") as f:
+    system_cfg = yaml.safe_load(f)
+
+# Enabled modules, retrieval top_k and short-circuit rules
+PIPELINE_CONFIG_PATH = BASE_DIR / "config" / f"{system_cfg['system']['pipeline']}.yaml"
+
+# Candidate answers are only written to disk (result cache disk
+# tier, audio transcript cache) when privacy.store_responses is set
+STORE_RESPONSES = bool(system_cfg["privacy"]["store_responses"])
+
+# Interview sessions are process-local: with several workers a
+# session's requests would reach different state, so startup
+# refuses that combination (see check_serving_workers)
+SESSIONS_ENABLED = bool(system_cfg["orchestration"]["sessions"]["enabled"])
+
+
+def serving_workers() -> int:
+    """
+    Worker processes serving this app. api.prefork sets
+    WEB_CONCURRENCY (uvicorn and gunicorn also default --workers
+    from it); otherwise the worker count is read from the
+    supervising uvicorn / gunicorn command line on Linux.
+    """
+    if "WEB_CONCURRENCY" in os.environ:
+        return int(os.environ["WEB_CONCURRENCY"])
+
+    try:
+        with open(f"/proc/{os.getppid()}/cmdline", "rb") as f:
+            args = f.read().decode("utf-8", "replace").split("\0")
+    except OSError:
+        return 1
+
+    # uvicorn ..., python -m uvicorn ..., gunicorn ...
+    if not any(Path(arg).name in ("uvicorn", "gunicorn") for arg in args[:3]):
+        return 1
+
+    for i, arg in enumerate(args):
+        if arg.startswith("--workers="):
+            return int(arg.split("=", 1)[1])
+        if arg in ("--workers", "-w") and i + 1 < len(args):
+            return int(args[i + 1])
+    return 1
+
+
+def check_serving_workers():
+    workers = serving_workers()
+    if SESSIONS_ENABLED and workers > 1:
+        raise RuntimeError(
+            f"Interview sessions are per process and {workers} workers would serve them: "
+            f"serve with one worker or set orchestration.sessions.enabled: false"
+        )
 
 # =====================================================
 # FASTAPI APP
@@ -24,32 +95,221 @@ app = FastAPI(
     title="Interview Evaluation System API",
     version="0.1.0"
 )
+app.state.config = system_cfg
+app.state.sessions_enabled = SESSIONS_ENABLED
+
+# Sampling profiler: idle unless armed (admin) or forced (header).
+# The admin routes are unauthenticated: enable them only where the
+# API is not reachable by untrusted clients
+profiling_cfg = system_cfg["profiling"]
+app.state.profiler = ProfilingController(
+    output_dir=str(BASE_DIR / profiling_cfg["dir"]),
+    interval_ms=profiling_cfg["interval_ms"],
+    allow_header=profiling_cfg["allow_header"],
+    max_profiles=profiling_cfg["max_profiles"],
+    max_concurrent=profiling_cfg["max_concurrent"]
+)
+
+# Oversized audio uploads are refused before they are buffered
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    max_bytes=int(system_cfg["audio"]["max_upload_mb"] * 1024 * 1024),
+    path_prefix="/submit_audio"
+)
+
+# Outermost, so rejected uploads are counted too
+app.add_middleware(RequestMetricsMiddleware)
 
 # =====================================================
-# STARTUP: LOAD ORCHESTRATOR ONCE
+# STARTUP
 # =====================================================
-@app.on_event("startup")
-def load_system():
+def load_shared_state(compile_question_bank: bool = True):
+    """
+    Read-only state: question bank, corpus, encoders and FAISS
+    index. Loaded once per process, or once in the parent before
+    forking when served by api.prefork (a no-op in its workers),
+    which passes compile_question_bank=False: the parent must not
+    run inference, so a stale question bank fails startup.
+    """
+    if getattr(app.state, "orchestrator", None) is not None:
+        return
+
+    check_serving_workers()
+
     with open(CORPUS_CHUNKS_PATH, "r", encoding="utf-8") as f:
         corpus_chunks = json.load(f)
 
     with open(WEIGHTS_PATH, "r") as f:
         weights_cfg = yaml.safe_load(f)
 
+    pipeline = load_pipeline_config(str(PIPELINE_CONFIG_PATH))
+    app.state.pipeline = pipeline
+
+    orchestration_cfg = system_cfg["orchestration"]
+    result_cache_cfg = orchestration_cfg["result_cache"]
+
+    # Encoders and Whisper may live in a shared inference server
+    server_cfg = system_cfg["inference_server"]
+    inference_client = None
+    if server_cfg["enabled"]:
+        address = str(BASE_DIR / server_cfg["address"])
+        inference_client = app.state.inference_client = InferenceClient(
+            address,
+            authkey=load_authkey(address, server_cfg["authkey_env"]),
+            timeout_sec=server_cfg["timeout_sec"]
+        )
+
     app.state.orchestrator = InterviewOrchestrator(
         question_data_path=str(QUESTIONS_PATH),
         faiss_index_path=str(FAISS_INDEX_PATH),
         corpus_chunks=corpus_chunks,
-        fusion_weights=weights_cfg["fusion_weights"]
+        fusion_weights=weights_cfg["fusion_weights"],
+        concurrent_stages=orchestration_cfg["concurrent_stages"],
+        max_workers=orchestration_cfg["max_workers"],
+        stage_timeouts=orchestration_cfg["stage_timeouts_sec"],
+        result_cache={
+            "max_entries": result_cache_cfg["max_entries"],
+            "ttl_sec": result_cache_cfg["ttl_sec"],
+            "disk_dir": (
+                str(BASE_DIR / result_cache_cfg["disk_dir"])
+                if result_cache_cfg["disk_dir"] and STORE_RESPONSES else None
+            ),
+            "max_disk_mb": result_cache_cfg["max_disk_mb"]
+        } if result_cache_cfg["enabled"] else None,
+        pipeline=pipeline,
+        inference_client=inference_client,
+        compile_question_bank=compile_question_bank
+    )
+
+    print(
+        f"[STARTUP] Interview Orchestrator loaded successfully "
+        f"({pipeline.get_mode()}: {', '.join(app.state.orchestrator.active_stages)})"
+    )
+
+    # Audio needs both DSP and ASR; otherwise nothing audio is loaded
+    app.state.audio_enabled = pipeline.dsp_enabled and pipeline.asr_enabled
+
+
+def start_worker_state():
+    """
+    Per-process state: Whisper, sessions, executors, the DSP
+    process pool and caches. Never shared across a fork.
+    """
+    orchestrator = app.state.orchestrator
+
+    # Built after the fork: CTranslate2 starts its worker threads
+    # when the model is constructed, and a forked child has none
+    app.state.asr = None
+    if app.state.audio_enabled and getattr(app.state, "inference_client", None) is not None:
+        app.state.asr = RemoteASR(
+            app.state.inference_client,
+            timeout_per_audio_sec=system_cfg["inference_server"]["asr_timeout_per_audio_sec"]
+        )
+    elif app.state.audio_enabled:
+        with MODEL_LOAD_SECONDS.time(model="whisper"):
+            app.state.asr = ASRWorkerPool(**system_cfg["audio"]["asr"])
+
+    if orchestrator.result_cache is not None:
+        CACHE_HIT_RATIO.set_function(
+            lambda: app.state.orchestrator.result_cache.stats()["hit_ratio"],
+            cache="evaluation"
+        )
+
+    # Every worker serves its own metrics: with several, label
+    # each series with the worker (api.prefork number) and pid
+    if serving_workers() > 1:
+        worker_labels = {"pid": os.getpid()}
+        if "PREFORK_WORKER" in os.environ:
+            worker_labels = {"worker": os.environ["PREFORK_WORKER"], **worker_labels}
+        REGISTRY.set_const_labels(**worker_labels)
+
+    for kind in ("uss", "pss", "rss"):
+        PROCESS_MEMORY_BYTES.set_function(
+            lambda kind=kind: read_smaps_rollup()[kind],
+            kind=kind
+        )
+
+    # Per-interview state and prefetched question assets
+    app.state.sessions = SessionManager(
+        orchestrator,
+        **{k: v for k, v in system_cfg["orchestration"]["sessions"].items() if k != "enabled"}
+    ) if SESSIONS_ENABLED else None
+
+    # Audio DSP runs in its own processes, isolated from text requests
+    app.state.dsp_pool = None
+    dsp_workers = system_cfg["audio"]["dsp_pool"]["workers"]
+    if app.state.audio_enabled and dsp_workers > 0:
+        app.state.dsp_pool = DSPProcessPool(workers=dsp_workers)
+
+    # Blocking audio steps of async routes; bounded separately
+    # from Starlette's threadpool
+    app.state.audio_executor = ThreadPoolExecutor(
+        max_workers=system_cfg["audio"]["request_threads"],
+        thread_name_prefix="audio-request"
     )
 
-    print("[STARTUP] Interview Orchestrator loaded successfully")
+    # Keyed by audio bytes + everything that changes DSP/ASR output.
+    # Entries hold transcripts, so the cache is off unless
+    # privacy.store_responses allows answers on disk
+    cache_cfg = system_cfg["audio"]["cache"]
+    app.state.audio_cache = AudioResultCache(
+        cache_dir=str(BASE_DIR / cache_cfg["dir"]),
+        max_bytes=int(cache_cfg["max_mb"] * 1024 * 1024),
+        config_fingerprint={
+            "dsp": {
+                "sample_rate": audio_utils.SAMPLE_RATE,
+                "top_db": audio_utils.SILENCE_TOP_DB,
+                "frames": [
+                    audio_utils.FRAME_LENGTH,
+                    audio_utils.HOP_LENGTH,
+                    audio_utils.VAD_FRAME_LENGTH,
+                    audio_utils.VAD_HOP_LENGTH
+                ]
+            },
+            "asr": {
+                k: system_cfg["audio"]["asr"][k]
+                for k in ("compute_type", "profiles")
+            }
+        }
+    ) if cache_cfg["enabled"] and STORE_RESPONSES else None
+
+    if app.state.audio_cache is not None:
+        CACHE_HIT_RATIO.set_function(
+            lambda: app.state.audio_cache.stats()["hit_ratio"],
+            cache="audio"
+        )
+
+
+@app.on_event("startup")
+def load_system():
+    load_shared_state()
+    start_worker_state()
+
+
+@app.on_event("shutdown")
+def release_system():
+    if getattr(app.state, "orchestrator", None) is not None:
+        app.state.orchestrator.close()
+
+    if getattr(app.state, "audio_executor", None) is not None:
+        app.state.audio_executor.shutdown(wait=False)
+
+    if getattr(app.state, "dsp_pool", None) is not None:
+        app.state.dsp_pool.shutdown()
+
+    app.state.profiler.close()
 
 # =====================================================
 # ROUTES
 # =====================================================
 app.include_router(submit_text_router)
 app.include_router(submit_audio_router)
+app.include_router(live_router)
+app.include_router(sessions_router)
+app.include_router(reports_router)
+
+if profiling_cfg["admin_endpoint"]:
+    app.include_router(admin_router)
 
 
 # =====================================================
@@ -58,3 +318,14 @@ app.include_router(submit_audio_router)
 @app.get("/health")
 def health():
     return {"status": "ok"}
+
+
+# =====================================================
+# METRICS (Prometheus text format)
+# =====================================================
+@app.get("/metrics", response_class=PlainTextResponse)
+def metrics():
+    return PlainTextResponse(
+        REGISTRY.render(),
+        media_type="text/plain; version=0.0.4"
+    )
@@ -0,0 +1,103 @@
+import time
+
+from fastapi import HTTPException
+from starlette.responses import JSONResponse
+
+from core.utils.metrics import REQUEST_SECONDS, REQUESTS_TOTAL
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Rejects oversized request bodies on the given path prefix
+    while they are still arriving.
+
+    A declared Content-Length over the limit is refused before
+    any body is read; otherwise bytes are counted as they stream
+    in and the request is aborted as soon as the limit is crossed.
+    """
+
+    def __init__(self, app, max_bytes: int, path_prefix: str):
+        self.app = app
+        self.max_bytes = max_bytes
+        self.path_prefix = path_prefix
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        declared = headers.get(b"content-length")
+
+        if declared is not None and declared.isdigit() and int(declared) > self.max_bytes:
+            response = JSONResponse(
+                status_code=413,
+                content={"detail": self._detail()}
+            )
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    # Re-raised untouched by FastAPI's body parsing
+                    raise HTTPException(status_code=413, detail=self._detail())
+
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    def _detail(self) -> str:
+        return f"Upload exceeds {self.max_bytes / (1024 * 1024):g} MB limit"
+
+
+class RequestMetricsMiddleware:
+    """
+    Counts HTTP requests by route template and outcome and
+    records their latency.
+
+    Routes are labelled by their template (e.g. /submit_text/),
+    read from the matched route after routing, so label
+    cardinality stays bounded; unmatched paths share one label.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            route = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+
+            REQUESTS_TOTAL.inc(route=route, method=method, outcome=self._outcome(status))
+            REQUEST_SECONDS.observe(time.perf_counter() - started, route=route, method=method)
+
+    @staticmethod
+    def _outcome(status: int) -> str:
+        if status < 400:
+            return "success"
+        if status < 500:
+            return "client_error"
+        return "server_error"
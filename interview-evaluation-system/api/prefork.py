@@ -0,0 +1,241 @@
+import argparse
+import gc
+import os
+import signal
+import socket
+import time
+import traceback
+
+# No collections while loading: the freed gaps they leave would be
+# refilled by worker allocations, dirtying shared pages (see the
+# gc.freeze documentation)
+gc.disable()
+
+from pathlib import Path
+
+import uvicorn
+import yaml
+
+from core.utils.process_memory import format_memory, read_smaps_rollup
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "config" / "default.yaml"
+
+# First memory report once workers have finished their startup
+FIRST_REPORT_DELAY_SEC = 30.0
+
+# A worker dying sooner than this after its fork is restarted
+# with a delay, so a broken worker does not fork in a tight loop
+MIN_WORKER_LIFETIME_SEC = 1.0
+
+# =====================================================
+# PRE-FORK SERVER
+# =====================================================
+# python -m api.prefork [--workers N] [--host H] [--port P]
+#
+# The parent loads the read-only state once (question bank,
+# corpus, encoders, FAISS index), moves every object
+# it created into the GC's permanent generation (gc.freeze) and
+# forks the workers on one shared listening socket. Workers
+# share the loaded pages copy-on-write; collections in a worker
+# never touch frozen objects, so those pages stay shared.
+#
+# Per-process state (sessions, executors, DSP pool, caches) is
+# created in each worker by the startup hook. Interview sessions
+# would live in one worker, so with more than one worker startup
+# fails unless orchestration.sessions.enabled is false.
+#
+# The parent never runs inference: thread pools started before
+# fork (OpenMP, CTranslate2) do not survive it in the children.
+# The question bank must be compiled beforehand
+# (python -m scripts.compile_question_bank); a stale one fails
+# startup instead of being encoded here.
+# Whisper therefore loads in each worker; to keep a single copy,
+# enable the inference server (inference_server.enabled).
+
+
+class PreforkServer:
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        workers: int,
+        backlog: int = 2048,
+        memory_report_sec: float = 300.0
+    ):
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.backlog = backlog
+        self.memory_report_sec = memory_report_sec
+
+        self.api_main = None
+        self.socket = None
+        self.children = {}  # pid -> (worker number, fork time)
+        self.stopping = False
+
+    # --------------------------------------------------
+    # PARENT
+    # --------------------------------------------------
+    def run(self):
+        # Read by api.main (sessions need a single worker)
+        os.environ["WEB_CONCURRENCY"] = str(self.workers)
+        from api import main as api_main
+        self.api_main = api_main
+
+        started = time.perf_counter()
+        # Never compiles the question bank here (that encodes):
+        # a stale one fails with a pointer to the compile script
+        api_main.load_shared_state(compile_question_bank=False)
+        print(
+            f"[PREFORK] Shared state loaded in {time.perf_counter() - started:.1f}s "
+            f"(parent {format_memory(read_smaps_rollup())})"
+        )
+
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind((self.host, self.port))
+        self.socket.listen(self.backlog)
+        self.socket.set_inheritable(True)
+
+        gc.freeze()
+
+        for number in range(self.workers):
+            self._spawn(number)
+
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        print(f"[PREFORK] {self.workers} workers serving on http://{self.host}:{self.port}")
+        self._supervise()
+
+    def _supervise(self):
+        """
+        Restart workers that die (a fork is cheap: nothing is
+        reloaded) and log per-worker memory until stopped.
+        """
+        next_report = time.monotonic() + FIRST_REPORT_DELAY_SEC
+
+        while self.children:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+
+            if pid:
+                number, forked_at = self.children.pop(pid)
+                if not self.stopping:
+                    print(f"[PREFORK] worker {number} (pid {pid}) exited with status {status}; restarting")
+                    if time.monotonic() - forked_at < MIN_WORKER_LIFETIME_SEC:
+                        time.sleep(MIN_WORKER_LIFETIME_SEC)
+                    self._spawn(number)
+                continue
+
+            if self.stopping:
+                time.sleep(0.1)
+                continue
+
+            if next_report is not None and time.monotonic() >= next_report:
+                self.report_memory()
+                next_report = (
+                    time.monotonic() + self.memory_report_sec
+                    if self.memory_report_sec > 0 else None
+                )
+
+            time.sleep(0.5)
+
+        self.socket.close()
+
+    def report_memory(self):
+        """
+        USS is what each worker costs on its own; shared pages are
+        counted once across the parent and all workers.
+        """
+        total_uss = 0
+        for pid, (number, _) in sorted(self.children.items(), key=lambda item: item[1]):
+            memory = read_smaps_rollup(pid)
+            total_uss += memory.get("uss", 0)
+            print(f"[PREFORK] worker {number} pid {pid}: {format_memory(memory)}")
+
+        parent = read_smaps_rollup()
+        print(
+            f"[PREFORK] parent: {format_memory(parent)}; "
+            f"workers' unique total {total_uss / (1024 * 1024):.1f} MB"
+        )
+        if self.whisper_per_worker():
+            print(
+                f"[PREFORK] note: Whisper is loaded in each of the {len(self.children)} workers "
+                f"(inference_server.enabled is false), so its weights are counted in every "
+                f"worker's USS; enable the inference server to keep one copy"
+            )
+
+    def whisper_per_worker(self) -> bool:
+        """
+        Whisper cannot be shared across the fork (see above), so
+        without the inference server every worker holds a copy.
+        """
+        return (
+            getattr(self.api_main.app.state, "audio_enabled", False)
+            and not self.api_main.system_cfg["inference_server"]["enabled"]
+        )
+
+    def _stop(self, signum, frame):
+        self.stopping = True
+        for pid in list(self.children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    # --------------------------------------------------
+    # WORKER
+    # --------------------------------------------------
+    def _spawn(self, number: int):
+        pid = os.fork()
+        if pid:
+            self.children[pid] = (number, time.monotonic())
+            return
+
+        # Child: never returns to the parent's loop
+        status = 0
+        try:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            gc.enable()
+
+            # Metrics label (api.main.start_worker_state)
+            os.environ["PREFORK_WORKER"] = str(number)
+
+            config = uvicorn.Config(
+                self.api_main.app,
+                log_level=self.api_main.system_cfg["logging"]["level"].lower()
+            )
+            uvicorn.Server(config).run(sockets=[self.socket])
+        except BaseException:
+            traceback.print_exc()
+            status = 1
+        finally:
+            os._exit(status)
+
+
+# =====================================================
+# ENTRY POINT
+# =====================================================
+if __name__ == "__main__":
+    with open(CONFIG_PATH, "r") as f:
+        serving_cfg = yaml.safe_load(f)["serving"]
+
+    parser = argparse.ArgumentParser(
+        description="Serve the API from workers forked after loading the models once"
+    )
+    parser.add_argument("--host", default=serving_cfg["host"])
+    parser.add_argument("--port", type=int, default=serving_cfg["port"])
+    parser.add_argument("--workers", type=int, default=serving_cfg["workers"])
+    args = parser.parse_args()
+
+    PreforkServer(
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        backlog=serving_cfg["backlog"],
+        memory_report_sec=serving_cfg["memory_report_sec"]
+    ).run()
@@ -0,0 +1,34 @@
+from fastapi import APIRouter, HTTPException, Request
+from pydantic import BaseModel, Field
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+class ProfilingRequest(BaseModel):
+    count: int = Field(0, ge=0, description="Profile the next N evaluations")
+    fraction: float = Field(0.0, ge=0.0, le=1.0, description="Profile this random fraction of evaluations")
+
+
+@router.get("/profiling")
+def profiling_status(http_request: Request):
+    return http_request.app.state.profiler.status()
+
+
+@router.post("/profiling")
+def arm_profiling(request: ProfilingRequest, http_request: Request):
+    """
+    Arm the sampling profiler; folded stacks and JSON sidecars
+    are written to the configured profiling directory.
+    """
+    try:
+        http_request.app.state.profiler.arm(request.count, request.fraction)
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+
+    return http_request.app.state.profiler.status()
+
+
+@router.delete("/profiling")
+def disarm_profiling(http_request: Request):
+    http_request.app.state.profiler.disarm()
+    return http_request.app.state.profiler.status()
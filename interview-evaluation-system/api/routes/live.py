@@ -0,0 +1,161 @@
+import asyncio
+import json
+
+import numpy as np
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi.encoders import jsonable_encoder
+
+from core.models.audio.streaming_asr import IncrementalTranscriber
+from core.models.keyword.regex_concept_scorer import RegexConceptScorer
+from api.schemas.response_models import TextEvaluationResponse
+
+router = APIRouter(prefix="/live", tags=["Live Evaluation"])
+
+SAMPLE_RATE = 16000
+
+
+@router.websocket("/{question_id}")
+async def live_answer(websocket: WebSocket, question_id: str):
+    """
+    Live interview answer over WebSocket.
+
+    Client → server:
+        binary frames: 16 kHz mono PCM16 (little-endian)
+        text frame:    {"event": "end"} when the candidate stops
+    Server → client:
+        {"type": "partial", "committed", "provisional",
+         "concept_hits", "keyword_score"}
+        {"type": "final", "result": <TextEvaluationResponse>}
+        {"type": "error", "detail"}
+    """
+    await websocket.accept()
+
+    app_state = websocket.app.state
+    orchestrator = getattr(app_state, "orchestrator", None)
+    question = orchestrator.question_map.get(question_id) if orchestrator else None
+
+    if question is None:
+        await _close_with_error(websocket, f"Invalid question_id: {question_id}", code=1008)
+        return
+
+    if getattr(app_state, "asr", None) is None:
+        await _close_with_error(websocket, "Audio evaluation is disabled in the pipeline config", code=1013)
+        return
+
+    audio_cfg = app_state.config["audio"]
+
+    # Decodes run on the bounded audio executor, like submit_audio,
+    # so live sockets cannot take Starlette's threadpool from sync routes
+    loop = asyncio.get_running_loop()
+    audio_executor = app_state.audio_executor
+    live_cfg = audio_cfg["live"]
+    max_samples = int(audio_cfg["max_duration_sec"] * SAMPLE_RATE)
+
+    key_concepts = [kc.concept for kc in question.ideal_answers[0].key_concepts]
+    # Live concept hits are shown even if keyword scoring is disabled
+    concept_scorer = orchestrator.concept_scorer or RegexConceptScorer()
+
+    transcriber = IncrementalTranscriber(
+        app_state.asr,
+        sample_rate=SAMPLE_RATE,
+        step_seconds=live_cfg["step_seconds"],
+        holdback_seconds=live_cfg["holdback_seconds"],
+        window_seconds=live_cfg["window_seconds"]
+    )
+
+    try:
+        while True:
+            message = await websocket.receive()
+
+            if message["type"] == "websocket.disconnect":
+                return
+
+            if message.get("text") is not None:
+                try:
+                    event = json.loads(message["text"])
+                except ValueError:
+                    event = None
+                if not isinstance(event, dict):
+                    # Ignored; the audio received so far stays valid
+                    await websocket.send_json({"type": "error", "detail": "Text frames must be JSON objects"})
+                    continue
+                if event.get("event") == "end":
+                    break
+                continue
+
+            data = message.get("bytes") or b""
+            if len(data) % 2:
+                # Every later sample would be misaligned
+                await _close_with_error(websocket, "Binary frames must hold whole PCM16 samples", code=1003)
+                return
+
+            frame = np.frombuffer(data, dtype="<i2").astype(np.float32) / 32768.0
+
+            if transcriber.num_samples + len(frame) > max_samples:
+                await _close_with_error(
+                    websocket,
+                    f"Audio longer than {audio_cfg['max_duration_sec']} seconds",
+                    code=1009
+                )
+                return
+
+            update = await loop.run_in_executor(audio_executor, transcriber.feed, frame)
+
+            if update is not None:
+                # Concept hits update as words arrive
+                hits = concept_scorer.matched_concepts(transcriber.transcript, key_concepts)
+                await websocket.send_json({
+                    "type": "partial",
+                    "committed": update.committed,
+                    "provisional": update.provisional,
+                    "concept_hits": hits,
+                    "keyword_score": len(hits) / len(key_concepts) if key_concepts else 0.0
+                })
+
+            end_silence = live_cfg["end_silence_seconds"]
+            if end_silence and transcriber.transcript and transcriber.trailing_silence >= end_silence:
+                break
+
+        # --------------------------------------------------
+        # End of speech: decode the short tail, then score
+        # --------------------------------------------------
+        transcript, audio, features = await loop.run_in_executor(audio_executor, transcriber.finish)
+
+        if not transcript:
+            await _close_with_error(websocket, "Could not transcribe audio")
+            return
+
+        start, end = features.trim_bounds()
+        result = await orchestrator.evaluate_async(
+            question_id=question_id,
+            student_answer=transcript,
+            audio_signal=audio[start:end],
+            audio_features=features.slice(start, end)
+        )
+
+        await websocket.send_json({
+            "type": "final",
+            "result": jsonable_encoder(TextEvaluationResponse.from_result(result))
+        })
+        await websocket.close()
+
+    except WebSocketDisconnect:
+        return
+
+    # Same mapping as the HTTP routes (400 / 504 / 500)
+    except ValueError as ve:
+        await _close_with_error(websocket, str(ve), code=1008)
+
+    except TimeoutError as te:
+        await _close_with_error(websocket, str(te), code=1013)
+
+    except Exception as e:
+        await _close_with_error(websocket, f"Live evaluation failed: {str(e)}", code=1011)
+
+
+async def _close_with_error(websocket: WebSocket, detail: str, code: int = 1000):
+    try:
+        await websocket.send_json({"type": "error", "detail": detail})
+        await websocket.close(code=code)
+    except (WebSocketDisconnect, RuntimeError):
+        pass  # client already gone
@@ -0,0 +1,37 @@
+from fastapi import APIRouter, HTTPException, Request
+
+from api.schemas.response_models import SessionReportResponse, TextEvaluationResponse
+
+router = APIRouter(prefix="/reports", tags=["Reports"])
+
+
+@router.get("/{session_id}", response_model=SessionReportResponse)
+def session_report(session_id: str, http_request: Request):
+    """
+    Final report of an interview: every answered question in
+    serving order, the average score and verdict counts.
+    """
+    sessions = getattr(http_request.app.state, "sessions", None)
+
+    if sessions is None and not getattr(http_request.app.state, "sessions_enabled", True):
+        raise HTTPException(
+            status_code=503,
+            detail="Interview sessions are disabled (orchestration.sessions.enabled)"
+        )
+
+    if sessions is None:
+        raise HTTPException(
+            status_code=500,
+            detail="Evaluation system not initialized"
+        )
+
+    try:
+        report = sessions.report(session_id)
+    except KeyError as ke:
+        raise HTTPException(status_code=404, detail=str(ke.args[0]))
+
+    report["results"] = [
+        TextEvaluationResponse.from_result(result)
+        for result in report["results"]
+    ]
+    return SessionReportResponse(**report)
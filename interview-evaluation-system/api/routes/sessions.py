@@ -0,0 +1,134 @@
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Request
+
+from api.schemas.request_models import SessionCreateRequest, TextEvaluationRequest
+from api.schemas.response_models import SessionResponse, TextEvaluationResponse
+
+router = APIRouter(prefix="/sessions", tags=["Sessions"])
+
+
+def _session_response(session) -> SessionResponse:
+    return SessionResponse(
+        session_id=session.session_id,
+        candidate_id=session.candidate_id,
+        served=list(session.served),
+        answered=list(session.results)
+    )
+
+
+def _get_sessions(http_request: Request):
+    sessions = getattr(http_request.app.state, "sessions", None)
+
+    if sessions is None and not getattr(http_request.app.state, "sessions_enabled", True):
+        raise HTTPException(
+            status_code=503,
+            detail="Interview sessions are disabled (orchestration.sessions.enabled)"
+        )
+
+    if sessions is None:
+        raise HTTPException(
+            status_code=500,
+            detail="Evaluation system not initialized"
+        )
+
+    return sessions
+
+
+@router.post("/", response_model=SessionResponse)
+def create_session(request: SessionCreateRequest, http_request: Request):
+    """
+    Start a multi-question interview.
+    """
+    session = _get_sessions(http_request).create(request.candidate_id)
+    return _session_response(session)
+
+
+@router.post("/{session_id}/questions/{question_id}", response_model=SessionResponse)
+def serve_question(session_id: str, question_id: str, http_request: Request):
+    """
+    Record that a question was put to the candidate and warm its
+    assets in the background, ahead of the answer.
+    """
+    try:
+        session = _get_sessions(http_request).serve_question(session_id, question_id)
+    except KeyError as ke:
+        raise HTTPException(status_code=404, detail=str(ke.args[0]))
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+
+    return _session_response(session)
+
+
+@router.post("/{session_id}/answers", response_model=TextEvaluationResponse)
+async def submit_session_answer(
+    session_id: str,
+    request: TextEvaluationRequest,
+    http_request: Request
+):
+    """
+    Evaluate an answer within an interview and keep its result
+    for the session report.
+    """
+    sessions = _get_sessions(http_request)
+    orchestrator = sessions.orchestrator
+
+    try:
+        sessions.get(session_id)
+    except KeyError as ke:
+        raise HTTPException(status_code=404, detail=str(ke.args[0]))
+
+    if request.question_id not in orchestrator.question_map:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid question_id: {request.question_id}"
+        )
+
+    # Usually already done (prefetched when the question was served);
+    # a failed prefetch only costs the speed-up, not the answer
+    try:
+        assets = await asyncio.wrap_future(sessions.assets(request.question_id))
+    except Exception:
+        assets = None
+
+    profiler = http_request.app.state.profiler
+
+    try:
+        with profiler.profile(
+            request.question_id,
+            force=http_request.headers.get("X-Profile") == "1"
+        ) as profile_tags:
+            result = await orchestrator.evaluate_async(
+                question_id=request.question_id,
+                student_answer=request.student_answer,
+                assets=assets
+            )
+            profile_tags["stage_timings_ms"] = result.get("stage_timings_ms")
+
+        sessions.record(session_id, result)
+        return TextEvaluationResponse.from_result(result)
+
+    except KeyError as ke:
+        raise HTTPException(status_code=404, detail=str(ke.args[0]))
+
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+
+    except TimeoutError as te:
+        raise HTTPException(status_code=504, detail=str(te))
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal evaluation error: {str(e)}"
+        )
+
+
+@router.delete("/{session_id}", response_model=SessionResponse)
+def close_session(session_id: str, http_request: Request):
+    try:
+        session = _get_sessions(http_request).close(session_id)
+    except KeyError as ke:
+        raise HTTPException(status_code=404, detail=str(ke.args[0]))
+
+    return _session_response(session)
@@ -1,35 +1,52 @@
+import asyncio
+import functools
+
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Request
-import tempfile
-import os
 
-from core.models.audio.dsp_stub import BasicDSP
-from core.models.audio.asr_stub import FasterWhisperASR
+from core.models.audio.dsp_stub import AudioLimitExceeded, BasicDSP
+from core.utils.audio_cache import transcript_reusable
+from core.utils.audio_utils import analyze_audio_delivery
+from core.utils.metrics import STAGE_SECONDS
 
-from api.schemas.response_models import (
-    TextEvaluationResponse,
-    EvaluationBreakdown,
-    EvidenceSnippet,
-    AudioFeedback
-)
+from api.schemas.response_models import TextEvaluationResponse
 
 router = APIRouter(prefix="/submit_audio", tags=["Evaluation"])
 
 # --------------------------------------------------
-# Initialize DSP + ASR once (module-level singletons)
+# Initialize DSP once (module-level singleton);
+# the ASR worker pool is built at startup (app.state.asr)
 # --------------------------------------------------
-dsp = BasicDSP()
-asr = FasterWhisperASR(model_size="small", device="cpu", compute_type="int8")
+dsp = BasicDSP(streaming=True)
 
 
 @router.post("/", response_model=TextEvaluationResponse)
-def submit_audio_answer(
+async def submit_audio_answer(
     http_request: Request,
     question_id: str = Form(...),
     audio_file: UploadFile = File(...)
 ):
     """
     Evaluate an audio-based interview answer.
+
+    Blocking steps (hashing, decoding, ASR) run on the app's
+    audio executor or DSP process pool and are awaited.
     """
+    # Profiled end to end (DSP + ASR + evaluation) when selected
+    with http_request.app.state.profiler.profile(
+        question_id,
+        force=http_request.headers.get("X-Profile") == "1"
+    ) as profile_tags:
+        response = await _evaluate_audio_answer(http_request, question_id, audio_file)
+        profile_tags["stage_timings_ms"] = response.stage_timings_ms
+
+    return response
+
+
+async def _evaluate_audio_answer(
+    http_request: Request,
+    question_id: str,
+    audio_file: UploadFile
+) -> TextEvaluationResponse:
 
     orchestrator = getattr(http_request.app.state, "orchestrator", None)
     if orchestrator is None:
@@ -38,84 +55,162 @@ def submit_audio_answer(
             detail="Evaluation system not initialized"
         )
 
-    if not audio_file.filename.lower().endswith(".wav"):
+    if getattr(http_request.app.state, "asr", None) is None:
+        raise HTTPException(
+            status_code=503,
+            detail="Audio evaluation is disabled in the pipeline config"
+        )
+
+    audio_cfg = http_request.app.state.config["audio"]
+    loop = asyncio.get_running_loop()
+    audio_executor = http_request.app.state.audio_executor
+
+    def run_blocking(fn, *args, **kwargs):
+        return loop.run_in_executor(audio_executor, functools.partial(fn, *args, **kwargs))
+
+    allowed_formats = audio_cfg["allowed_formats"]
+
+    extension = audio_file.filename.rsplit(".", 1)[-1].lower()
+    if extension not in allowed_formats:
         raise HTTPException(
             status_code=400,
-            detail="Only WAV audio files are supported"
+            detail=f"Supported audio formats: {', '.join(allowed_formats)}"
         )
 
     # --------------------------------------------------
-    # Save uploaded audio temporarily
+    # Content-addressed cache: identical audio skips DSP + ASR
     # --------------------------------------------------
-    try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
-            tmp.write(audio_file.file.read())
-            tmp_path = tmp.name
+    audio_cache = getattr(http_request.app.state, "audio_cache", None)
+    cache_key = None
+    cached = None
+
+    if audio_cache is not None:
+        asr = http_request.app.state.asr
+        fast_profile = audio_cfg["asr"].get("policy", {}).get("fast_profile", "fast")
+
+        # A transcript decoded below the profile this clip would get
+        # now (e.g. fast under an earlier load spike) is a miss
+        def reusable(entry):
+            return transcript_reusable(
+                entry["asr_profile"],
+                asr.select_profile(entry["duration_sec"]),
+                fast_profile
+            )
+
+        content_hash = await run_blocking(audio_cache.hash_stream, audio_file.file)
+        cache_key = audio_cache.key(content_hash)
+        cached = await run_blocking(audio_cache.get, cache_key, accept=reusable)
 
+    if cached is not None:
+        student_answer = cached["transcript"]
+        audio_metrics = cached["delivery_metrics"]
+
+    else:
         # --------------------------------------------------
         # DSP → ASR (SINGLE execution)
+        # Decoded straight from the spooled upload stream,
+        # in the DSP process pool when one is configured
         # --------------------------------------------------
-        audio_signal = dsp.preprocess(tmp_path)
-        student_answer = asr.transcribe(audio_signal)
+        dsp_pool = getattr(http_request.app.state, "dsp_pool", None)
+
+        try:
+            with STAGE_SECONDS.time(stage="dsp"):
+                if dsp_pool is not None:
+                    pending = await run_blocking(
+                        dsp_pool.submit,
+                        audio_file.file,
+                        max_duration_sec=audio_cfg["max_duration_sec"]
+                    )
+                    audio_signal, audio_features = await asyncio.wrap_future(pending)
+                else:
+                    audio_signal, audio_features = await run_blocking(
+                        dsp.preprocess_with_features,
+                        audio_file.file,
+                        max_duration_sec=audio_cfg["max_duration_sec"]
+                    )
+
+            # Latency profile from answer length and current ASR load
+            asr = http_request.app.state.asr
+            asr_profile = asr.select_profile(audio_features.duration)
+
+            # Decode only the speech regions DSP already found
+            with STAGE_SECONDS.time(stage="asr"):
+                student_answer = await run_blocking(
+                    asr.transcribe,
+                    audio_signal,
+                    voiced_intervals=audio_features.intervals,
+                    profile=asr_profile
+                )
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Audio processing failed: {str(e)}"
-        )
+        except AudioLimitExceeded as e:
+            raise HTTPException(status_code=413, detail=str(e))
 
-    finally:
-        if "tmp_path" in locals() and os.path.exists(tmp_path):
-            os.remove(tmp_path)
+        except Exception as e:
+            raise HTTPException(
+                status_code=500,
+                detail=f"Audio processing failed: {str(e)}"
+            )
 
-    if not student_answer:
-        raise HTTPException(
-            status_code=400,
-            detail="Could not transcribe audio"
-        )
+        if not student_answer:
+            raise HTTPException(
+                status_code=400,
+                detail="Could not transcribe audio"
+            )
+
+        with STAGE_SECONDS.time(stage="delivery_metrics"):
+            audio_metrics = await run_blocking(
+                analyze_audio_delivery,
+                audio_signal,
+                transcript=student_answer,
+                features=audio_features
+            )
+
+        if audio_cache is not None:
+            await run_blocking(audio_cache.put, cache_key, {
+                "transcript": student_answer,
+                "asr_profile": asr_profile,
+                "voiced_segments": audio_features.intervals.tolist(),
+                "duration_sec": audio_features.duration,
+                "delivery_metrics": audio_metrics
+            })
 
     # --------------------------------------------------
     # Reuse Day-3 + Day-6 evaluation pipeline
     # --------------------------------------------------
     try:
-        result = orchestrator.evaluate(
+        result = await orchestrator.evaluate_async(
             question_id=question_id,
             student_answer=student_answer,
-            audio_signal=audio_signal  # ✅ Day-6 wire
+            audio_metrics=audio_metrics  # ✅ Day-6 wire (precomputed / cached)
         )
 
-        return TextEvaluationResponse(
-            question_id=result["question_id"],
-            question=result["question"],
-            student_answer=result["student_answer"],
-            final_score=result["final_score"],
-            verdict=result["verdict"],
-            score_breakdown=EvaluationBreakdown(
-                semantic=result["score_breakdown"]["semantic"],
-                keyword=result["score_breakdown"]["keyword"],
-                evidence=result["score_breakdown"]["evidence"]
-            ),
-            evidence_snippets=[
-                EvidenceSnippet(
-                    source_book=doc["source_book"],
-                    authors=doc["authors"],
-                    domain=doc["domain"],
-                    text=doc["text"]
-                )
-                for doc in result["evidence_snippets"]
-            ],
-            audio_feedback=(
-                AudioFeedback(**result["audio_feedback"])
-                if "audio_feedback" in result
-                else None
-            )
-        )
+        return TextEvaluationResponse.from_result(result)
 
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=str(ve))
 
+    except TimeoutError as te:
+        raise HTTPException(status_code=504, detail=str(te))
+
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Evaluation failed: {str(e)}"
         )
+
+
+@router.get("/stats")
+def audio_pipeline_stats(http_request: Request):
+    """
+    Queue depth and latency of the audio worker pools,
+    and audio cache hit ratio.
+    """
+    dsp_pool = getattr(http_request.app.state, "dsp_pool", None)
+    asr_pool = getattr(http_request.app.state, "asr", None)
+    audio_cache = getattr(http_request.app.state, "audio_cache", None)
+
+    return {
+        "dsp_pool": dsp_pool.stats() if dsp_pool is not None else None,
+        "asr_pool": asr_pool.stats() if asr_pool is not None else None,
+        "audio_cache": audio_cache.stats() if audio_cache is not None else None
+    }
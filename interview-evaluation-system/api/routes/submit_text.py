@@ -1,17 +1,18 @@
 from fastapi import APIRouter, HTTPException, Request
 
-from api.schemas.request_models import TextEvaluationRequest
+from api.schemas.request_models import BatchTextEvaluationRequest, TextEvaluationRequest
 from api.schemas.response_models import (
-    TextEvaluationResponse,
-    EvaluationBreakdown,
-    EvidenceSnippet
+    BatchItemResult,
+    BatchTextEvaluationResponse,
+    ErrorResponse,
+    TextEvaluationResponse
 )
 
 router = APIRouter(prefix="/submit_text", tags=["Evaluation"])
 
 
 @router.post("/", response_model=TextEvaluationResponse)
-def submit_text_answer(
+async def submit_text_answer(
     request: TextEvaluationRequest,
     http_request: Request
 ):
@@ -27,39 +28,81 @@ def submit_text_answer(
             detail="Evaluation system not initialized"
         )
 
+    profiler = http_request.app.state.profiler
+
     try:
-        result = orchestrator.evaluate(
-            question_id=request.question_id,
-            student_answer=request.student_answer
-        )
+        with profiler.profile(
+            request.question_id,
+            force=http_request.headers.get("X-Profile") == "1"
+        ) as profile_tags:
+            result = await orchestrator.evaluate_async(
+                question_id=request.question_id,
+                student_answer=request.student_answer
+            )
+            profile_tags["stage_timings_ms"] = result.get("stage_timings_ms")
 
-        return TextEvaluationResponse(
-            question_id=result["question_id"],
-            question=result["question"],
-            student_answer=result["student_answer"],
-            final_score=result["final_score"],
-            verdict=result["verdict"],
-            score_breakdown=EvaluationBreakdown(
-                semantic=result["score_breakdown"]["semantic"],
-                keyword=result["score_breakdown"]["keyword"],
-                evidence=result["score_breakdown"]["evidence"]
-            ),
-            evidence_snippets=[
-                EvidenceSnippet(
-                    source_book=doc["source_book"],
-                    authors=doc["authors"],
-                    domain=doc["domain"],
-                    text=doc["text"]
-                )
-                for doc in result["evidence_snippets"]
-            ]
-        )
+        return TextEvaluationResponse.from_result(result)
 
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=str(ve))
 
+    except TimeoutError as te:
+        raise HTTPException(status_code=504, detail=str(te))
+
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Internal evaluation error: {str(e)}"
         )
+
+
+@router.post("/batch", response_model=BatchTextEvaluationResponse)
+async def submit_text_batch(
+    request: BatchTextEvaluationRequest,
+    http_request: Request
+):
+    """
+    Evaluate many text answers with batched model calls.
+
+    Items that cannot be evaluated (unknown question_id, or a
+    model stage that failed for them) get a per-item error; the
+    rest of the batch still succeeds. Stages run on the shared
+    stage pool.
+    """
+
+    orchestrator = getattr(http_request.app.state, "orchestrator", None)
+
+    if orchestrator is None:
+        raise HTTPException(
+            status_code=500,
+            detail="Evaluation system not initialized"
+        )
+
+    try:
+        results = await orchestrator.evaluate_many_async(
+            [
+                {"question_id": item.question_id, "student_answer": item.student_answer}
+                for item in request.items
+            ]
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Internal evaluation error: {str(e)}"
+        )
+
+    return BatchTextEvaluationResponse(
+        results=[
+            BatchItemResult(
+                index=i,
+                error=ErrorResponse(error="Evaluation failed", detail=result["error"])
+            )
+            if "error" in result
+            else BatchItemResult(
+                index=i,
+                result=TextEvaluationResponse.from_result(result)
+            )
+            for i, result in enumerate(results)
+        ]
+    )
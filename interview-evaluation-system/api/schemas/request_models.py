@@ -1,5 +1,10 @@
+from typing import List, Optional
+
 from pydantic import BaseModel, Field
 
+# Largest /submit_text/batch request; bigger sets are split by the client
+MAX_BATCH_ITEMS = 256
+
 
 class TextEvaluationRequest(BaseModel):
     """
@@ -20,6 +25,31 @@ class TextEvaluationRequest(BaseModel):
     )
 
 
+class BatchTextEvaluationRequest(BaseModel):
+    """
+    Request model for evaluating many text answers in one call.
+    """
+
+    items: List[TextEvaluationRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_ITEMS,
+        description="Answers to evaluate; may span several questions"
+    )
+
+
+class SessionCreateRequest(BaseModel):
+    """
+    Request model for starting a multi-question interview.
+    """
+
+    candidate_id: Optional[str] = Field(
+        None,
+        example="STU_1023",
+        description="Candidate identifier, echoed in the final report"
+    )
+
+
 class ReportRequest(BaseModel):
     """
     Request model for future student reports (placeholder).
@@ -43,7 +43,87 @@ class TextEvaluationResponse(BaseModel):
     # Day-6 addition (optional, audio-only)
     audio_feedback: Optional[AudioFeedback] = None
 
+    # Per-stage and critical-path latency, and stages that
+    # timed out and were left out of the score
+    stage_timings_ms: Optional[Dict[str, float]] = None
+    timed_out_stages: List[str] = []
+
+    # Stages disabled in config or short-circuited (scored 0)
+    skipped_stages: List[str] = []
+
+    @classmethod
+    def from_result(cls, result: Dict[str, Any]) -> "TextEvaluationResponse":
+        """
+        Build the response from an orchestrator result dict.
+        """
+        return cls(
+            question_id=result["question_id"],
+            question=result["question"],
+            student_answer=result["student_answer"],
+            final_score=result["final_score"],
+            verdict=result["verdict"],
+            score_breakdown=EvaluationBreakdown(
+                semantic=result["score_breakdown"]["semantic"],
+                keyword=result["score_breakdown"]["keyword"],
+                evidence=result["score_breakdown"]["evidence"]
+            ),
+            evidence_snippets=[
+                EvidenceSnippet(
+                    source_book=doc["source_book"],
+                    authors=doc["authors"],
+                    domain=doc["domain"],
+                    text=doc["text"]
+                )
+                for doc in result["evidence_snippets"]
+            ],
+            audio_feedback=(
+                AudioFeedback(**result["audio_feedback"])
+                if "audio_feedback" in result
+                else None
+            ),
+            stage_timings_ms=result.get("stage_timings_ms"),
+            timed_out_stages=result.get("timed_out_stages", []),
+            skipped_stages=result.get("skipped_stages", [])
+        )
+
 
 class ErrorResponse(BaseModel):
     error: str
     detail: Any = None
+
+
+class BatchItemResult(BaseModel):
+    """
+    Outcome of one batch item: a result or an error, never both.
+    """
+
+    index: int
+    result: Optional[TextEvaluationResponse] = None
+    error: Optional[ErrorResponse] = None
+
+
+class BatchTextEvaluationResponse(BaseModel):
+    results: List[BatchItemResult]
+
+
+class SessionResponse(BaseModel):
+    session_id: str
+    candidate_id: Optional[str] = None
+    served: List[str] = []
+    answered: List[str] = []
+
+
+class SessionReportResponse(BaseModel):
+    """
+    Final report of a multi-question interview.
+    """
+
+    session_id: str
+    candidate_id: Optional[str] = None
+    created_at: float
+    questions_served: int
+    questions_answered: int
+    unanswered: List[str]
+    average_score: float
+    verdict_counts: Dict[str, int]
+    results: List[TextEvaluationResponse]
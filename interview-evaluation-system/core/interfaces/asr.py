@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List
 
 
 class ASRInterface(ABC):
@@ -19,3 +20,16 @@ class ASRInterface(ABC):
             str: Transcribed text
         """
         pass
+
+    def transcribe_batch(self, audio_signals: List, sample_rate: int = 16000) -> List[str]:
+        """
+        Transcribe many signals; returns one transcript per signal,
+        in input order.
+
+        Default: one transcribe() call per signal. Implementations
+        may override with a batched decoder.
+        """
+        return [
+            self.transcribe(signal, sample_rate)
+            for signal in audio_signals
+        ]
@@ -13,3 +13,11 @@ class ConceptScorerInterface(ABC):
             concept coverage score in range [0, 1]
         """
         pass
+
+    def score_many(self, student_answers: List[str], key_concepts: List[str]) -> List[float]:
+        """
+        Score many answers to the same question, in input order.
+
+        Default: one score() call per answer.
+        """
+        return [self.score(answer, key_concepts) for answer in student_answers]
@@ -13,7 +13,7 @@ class DSPInterface(ABC):
         Load and preprocess audio.
 
         Args:
-            audio_path (str): Path to input WAV file
+            audio_path (str): Path to input audio file (WAV, FLAC, OGG/Opus)
 
         Returns:
             np.ndarray: Cleaned mono audio signal at 16 kHz
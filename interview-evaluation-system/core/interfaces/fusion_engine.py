@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 
 class FusionEngineInterface(ABC):
@@ -26,3 +26,11 @@ class FusionEngineInterface(ABC):
             }
         """
         pass
+
+    def fuse_many(self, scores: List[Dict[str, float]]) -> List[Dict[str, Any]]:
+        """
+        Fuse many score dicts, in input order.
+
+        Default: one fuse() call per dict.
+        """
+        return [self.fuse(item) for item in scores]
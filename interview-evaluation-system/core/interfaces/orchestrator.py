@@ -1,3 +1,5 @@
+import asyncio
+import functools
 from abc import ABC, abstractmethod
 from typing import Any, Dict
 
@@ -19,3 +21,17 @@ class InterviewOrchestratorInterface(ABC):
             final evaluation result
         """
         pass
+
+    async def evaluate_async(self, *args, **kwargs) -> Dict[str, Any]:
+        """
+        Awaitable evaluate() for async callers.
+
+        Default: evaluate() on the event loop's default executor.
+        Implementations may override to offload individual stages
+        to their own executors.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(self.evaluate, *args, **kwargs)
+        )
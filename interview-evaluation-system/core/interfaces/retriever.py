@@ -13,3 +13,11 @@ class RetrieverInterface(ABC):
             list of retrieved text passages
         """
         pass
+
+    def retrieve_many(self, queries: List[str], top_k: int = 5) -> List[List[str]]:
+        """
+        One result list per query, in input order.
+
+        Default: one retrieve() call per query.
+        """
+        return [self.retrieve(query, top_k) for query in queries]
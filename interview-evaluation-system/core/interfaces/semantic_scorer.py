@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import List, Tuple
 
 class SemanticScorerInterface(ABC):
     """
@@ -12,3 +13,11 @@ class SemanticScorerInterface(ABC):
             similarity score in range [0, 1]
         """
         pass
+
+    def score_many(self, pairs: List[Tuple[str, str]]) -> List[float]:
+        """
+        Score (student_answer, ideal_answer) pairs, in input order.
+
+        Default: one score() call per pair.
+        """
+        return [self.score(student, ideal) for student, ideal in pairs]
@@ -0,0 +1,230 @@
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.interfaces.asr import ASRInterface
+from core.models.audio.asr_stub import FasterWhisperASR
+
+
+# Decode settings of the built-in profiles; config may override them
+DEFAULT_PROFILES = {
+    "fast": {
+        "model_size": "base",
+        "beam_size": 1,
+        "without_timestamps": True,
+        "condition_on_previous_text": False
+    },
+    "accurate": {
+        "model_size": "small",
+        "beam_size": 5,
+        "without_timestamps": False,
+        "condition_on_previous_text": True
+    }
+}
+
+
+class ASRProfilePolicy:
+    """
+    Picks a latency profile per request.
+
+    Short clips on an idle pool get the accurate profile. Long
+    clips, or any clip arriving while the queue is deep, get the
+    fast one, because decode time grows with clip length and
+    every queued request waits behind it.
+    """
+
+    def __init__(
+        self,
+        accurate_profile: str = "accurate",
+        fast_profile: str = "fast",
+        max_accurate_sec: float = 60.0,
+        max_queue_depth: int = 2
+    ):
+        """
+        Args:
+            max_accurate_sec: longest clip decoded with the accurate profile
+            max_queue_depth: waiting requests above which fast is forced
+        """
+        self.accurate_profile = accurate_profile
+        self.fast_profile = fast_profile
+        self.max_accurate_sec = max_accurate_sec
+        self.max_queue_depth = max_queue_depth
+
+    def select(self, duration_sec: float, queue_depth: int) -> str:
+        if duration_sec > self.max_accurate_sec or queue_depth > self.max_queue_depth:
+            return self.fast_profile
+        return self.accurate_profile
+
+
+class ASRWorkerPool(ASRInterface):
+    """
+    Concurrent Whisper transcription.
+
+    One CTranslate2 model per latency profile is loaded with
+    `workers` parallel workers sharing its weights, each with
+    its own fixed intra-op thread count, so throughput scales
+    with cores without loading N copies of a model. A single
+    semaphore in front of all profiles bounds concurrency and
+    measures queueing and utilisation; its queue depth feeds
+    the profile policy.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        cpu_threads: int = 0,
+        device: str = "cpu",
+        compute_type: str = "int8",
+        profiles: Optional[Dict[str, dict]] = None,
+        default_profile: str = "accurate",
+        policy: Optional[Dict[str, float]] = None
+    ):
+        """
+        Args:
+            workers: parallel transcriptions
+            cpu_threads: threads per worker (0 = cores // workers)
+            profiles: name -> {model_size, beam_size, without_timestamps,
+                condition_on_previous_text}
+            default_profile: used when no profile is selected,
+                and for segment-level (live) decoding
+            policy: ASRProfilePolicy arguments
+        """
+        self.workers = workers
+        self.cpu_threads = cpu_threads or max(1, (os.cpu_count() or 1) // workers)
+
+        profiles = profiles or DEFAULT_PROFILES
+        if default_profile not in profiles:
+            raise ValueError(f"Unknown default ASR profile: {default_profile}")
+
+        self.profiles = {}
+        for name, settings in profiles.items():
+            settings = dict(settings)
+            self.profiles[name] = FasterWhisperASR(
+                model_size=settings.pop("model_size", "small"),
+                device=device,
+                compute_type=compute_type,
+                cpu_threads=self.cpu_threads,
+                num_workers=workers,
+                decode_options=settings
+            )
+
+        self.default_profile = default_profile
+        self.policy = ASRProfilePolicy(**(policy or {}))
+
+        self._slots = threading.BoundedSemaphore(workers)
+        self._lock = threading.Lock()
+        self._started_at = time.monotonic()
+        self._busy = 0
+        self._waiting = 0
+        self._completed = 0
+        self._busy_seconds = 0.0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._profile_counts = {name: 0 for name in self.profiles}
+
+    # --------------------------------------------------
+    # PUBLIC API
+    # --------------------------------------------------
+    def select_profile(self, duration_sec: float) -> str:
+        """
+        Profile for a clip of this length under the current load;
+        falls back to the default if the policy names an unknown one.
+        """
+        with self._lock:
+            queue_depth = self._waiting
+
+        profile = self.policy.select(duration_sec, queue_depth)
+        return profile if profile in self.profiles else self.default_profile
+
+    def transcribe(
+        self,
+        audio_signal: np.ndarray,
+        sample_rate: int = 16000,
+        voiced_intervals: Optional[np.ndarray] = None,
+        profile: Optional[str] = None
+    ) -> str:
+        """
+        profile: None lets the policy choose from clip duration
+        and queue depth.
+        """
+        if profile is None:
+            profile = self.select_profile(len(audio_signal) / sample_rate)
+
+        with self._worker(profile) as asr:
+            return asr.transcribe(audio_signal, sample_rate, voiced_intervals)
+
+    def transcribe_segments(
+        self,
+        audio_signal: np.ndarray,
+        sample_rate: int = 16000,
+        voiced_intervals: Optional[np.ndarray] = None,
+        profile: Optional[str] = None
+    ) -> List[Tuple[float, float, str]]:
+        """
+        profile: None uses the default profile, since callers of
+        segment-level output rely on its timestamps.
+        """
+        with self._worker(profile or self.default_profile) as asr:
+            return asr.transcribe_segments(audio_signal, sample_rate, voiced_intervals)
+
+    def transcribe_batch(
+        self,
+        audio_signals: List[np.ndarray],
+        sample_rate: int = 16000,
+        profile: Optional[str] = None
+    ) -> List[str]:
+        with self._worker(profile or self.default_profile) as asr:
+            return asr.transcribe_batch(audio_signals, sample_rate)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            elapsed = time.monotonic() - self._started_at
+            return {
+                "workers": self.workers,
+                "cpu_threads_per_worker": self.cpu_threads,
+                "busy": self._busy,
+                "waiting": self._waiting,
+                "completed": self._completed,
+                "utilisation": round(self._busy_seconds / (elapsed * self.workers), 4) if elapsed > 0 else 0.0,
+                "avg_wait_ms": round(1000 * self._total_wait / self._completed, 2) if self._completed else 0.0,
+                "max_wait_ms": round(1000 * self._max_wait, 2),
+                "profiles": dict(self._profile_counts)
+            }
+
+    # --------------------------------------------------
+    # INTERNALS
+    # --------------------------------------------------
+    @contextmanager
+    def _worker(self, profile: str):
+        if profile not in self.profiles:
+            raise ValueError(f"Unknown ASR profile: {profile}")
+
+        queued_at = time.monotonic()
+        with self._lock:
+            self._waiting += 1
+
+        self._slots.acquire()
+        started_at = time.monotonic()
+        wait = started_at - queued_at
+
+        with self._lock:
+            self._waiting -= 1
+            self._busy += 1
+            self._profile_counts[profile] += 1
+
+        try:
+            yield self.profiles[profile]
+        finally:
+            busy = time.monotonic() - started_at
+            self._slots.release()
+
+            with self._lock:
+                self._busy -= 1
+                self._completed += 1
+                self._busy_seconds += busy
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
@@ -1,7 +1,90 @@
+import bisect
+from typing import Any, Dict, List, Optional, Tuple
+
 import numpy as np
-from faster_whisper import WhisperModel
+from faster_whisper import BatchedInferencePipeline, WhisperModel
 
 from core.interfaces.asr import ASRInterface
+from core.utils.audio_utils import compute_frame_features
+
+
+# Whisper decodes at most 30 s per window
+MAX_CLIP_SECONDS = 30.0
+
+# Context kept around each voiced interval when gating ASR
+SPEECH_PAD_SECONDS = 0.2
+
+
+def _pack_clips(intervals: np.ndarray, offset: int, sample_rate: int) -> List[dict]:
+    """
+    Greedily pack voiced intervals into clips no longer than one
+    Whisper window. Bounds are integer sample offsets on the batch
+    timeline, as faster-whisper's batched pipeline slices the audio
+    with them.
+    """
+    max_len = int(MAX_CLIP_SECONDS * sample_rate)
+    clips = []
+    start = end = None
+
+    for s, e in intervals:
+        s, e = int(s), int(e)
+
+        if start is not None and e - start <= max_len:
+            end = e
+            continue
+
+        if start is not None:
+            clips.append((start, end))
+
+        # A single interval longer than a window is split
+        while e - s > max_len:
+            clips.append((s, s + max_len))
+            s += max_len
+        start, end = s, e
+
+    if start is not None:
+        clips.append((start, end))
+
+    return [
+        {"start": offset + s, "end": offset + e}
+        for s, e in clips
+    ]
+
+
+class _SpeechTimeline:
+    """
+    Maps times on the concatenated-speech timeline back to the
+    original recording.
+    """
+
+    def __init__(self, intervals: np.ndarray, sample_rate: int):
+        self.starts = intervals[:, 0]
+        self.cumulative = np.cumsum(intervals[:, 1] - intervals[:, 0])
+        self.sample_rate = sample_rate
+
+    def to_original(self, seconds: float) -> float:
+        sample = seconds * self.sample_rate
+        idx = min(
+            int(np.searchsorted(self.cumulative, sample, side="right")),
+            len(self.starts) - 1
+        )
+        before = self.cumulative[idx - 1] if idx > 0 else 0
+        return float(self.starts[idx] + sample - before) / self.sample_rate
+
+
+def _padded_speech(intervals: np.ndarray, num_samples: int, sample_rate: int) -> np.ndarray:
+    """
+    Pad voiced intervals by SPEECH_PAD_SECONDS and merge overlaps.
+    """
+    pad = int(SPEECH_PAD_SECONDS * sample_rate)
+    starts = np.clip(intervals[:, 0] - pad, 0, num_samples)
+    ends = np.clip(intervals[:, 1] + pad, 0, num_samples)
+
+    breaks = np.flatnonzero(starts[1:] > ends[:-1]) + 1
+    starts = starts[np.concatenate(([0], breaks))]
+    ends = ends[np.concatenate((breaks - 1, [len(ends) - 1]))]
+
+    return np.stack([starts, ends], axis=1)
 
 
 class FasterWhisperASR(ASRInterface):
@@ -13,32 +96,140 @@ class FasterWhisperASR(ASRInterface):
         self,
         model_size: str = "small",
         device: str = "cpu",
-        compute_type: str = "int8"
+        compute_type: str = "int8",
+        cpu_threads: int = 0,
+        num_workers: int = 1,
+        decode_options: Optional[Dict[str, Any]] = None
     ):
         """
         Args:
             model_size: tiny | base | small | medium
             device: cpu | cuda
             compute_type: int8 | float16 | float32
+            cpu_threads: intra-op threads per worker (0 = CTranslate2 default)
+            num_workers: concurrent transcriptions sharing the model weights
+            decode_options: extra faster-whisper transcribe() arguments,
+                e.g. beam_size, without_timestamps,
+                condition_on_previous_text (None = library defaults)
         """
         self.model = WhisperModel(
             model_size,
             device=device,
-            compute_type=compute_type
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            num_workers=num_workers
         )
+        self.decode_options = dict(decode_options or {})
+        self._batched = None
 
-    def transcribe(self, audio_signal: np.ndarray, sample_rate: int = 16000) -> str:
+    def transcribe(
+        self,
+        audio_signal: np.ndarray,
+        sample_rate: int = 16000,
+        voiced_intervals: Optional[np.ndarray] = None
+    ) -> str:
         """
         Transcribe audio to text.
+
+        voiced_intervals: (n, 2) sample intervals from the DSP stage
+        (FrameFeatures.intervals); when given, only speech is decoded.
         """
+        segments = self.transcribe_segments(
+            audio_signal,
+            sample_rate,
+            voiced_intervals
+        )
+
+        return " ".join(text for _, _, text in segments).strip()
+
+    def transcribe_segments(
+        self,
+        audio_signal: np.ndarray,
+        sample_rate: int = 16000,
+        voiced_intervals: Optional[np.ndarray] = None
+    ) -> List[Tuple[float, float, str]]:
+        """
+        Transcribe to (start_sec, end_sec, text) segments on the
+        original recording's timeline.
+
+        With voiced_intervals, the speech regions (slightly padded)
+        are concatenated and decoded alone, so decode time follows
+        speech time rather than recording length; segment times are
+        mapped back across the removed pauses.
+        """
+        timeline = None
+
+        if voiced_intervals is not None and len(voiced_intervals):
+            speech = _padded_speech(
+                np.asarray(voiced_intervals), len(audio_signal), sample_rate
+            )
+            timeline = _SpeechTimeline(speech, sample_rate)
+            audio_signal = np.concatenate(
+                [audio_signal[s:e] for s, e in speech]
+            )
 
         segments, info = self.model.transcribe(
             audio_signal,
-            language="en"
+            language="en",
+            **self.decode_options
         )
 
         transcription = []
         for segment in segments:
-            transcription.append(segment.text)
+            start, end = segment.start, segment.end
+            if timeline is not None:
+                start, end = timeline.to_original(start), timeline.to_original(end)
+            transcription.append((start, end, segment.text))
+
+        return transcription
+
+    def transcribe_batch(
+        self,
+        audio_signals: List[np.ndarray],
+        sample_rate: int = 16000,
+        batch_size: int = 16
+    ) -> List[str]:
+        """
+        Offline bulk transcription.
+
+        Voiced segments of every file are packed into <= 30 s clips
+        on one shared timeline and decoded batch_size clips per
+        decoder call (faster-whisper's batched pipeline), so short
+        answers from different files share a batch. Segments are
+        routed back to their file by timestamp (segment times are
+        in seconds; file starts are kept in seconds for the lookup).
+        """
+        if not audio_signals:
+            return []
+
+        if self._batched is None:
+            self._batched = BatchedInferencePipeline(model=self.model)
+
+        clips = []
+        file_starts = []
+        offset = 0
+
+        for signal in audio_signals:
+            file_starts.append(offset / sample_rate)
+            intervals = compute_frame_features(signal).intervals
+            clips.extend(_pack_clips(intervals, offset, sample_rate))
+            offset += len(signal)
+
+        transcripts = [[] for _ in audio_signals]
+        if not clips:
+            return ["" for _ in audio_signals]
+
+        segments, info = self._batched.transcribe(
+            np.concatenate(audio_signals).astype(np.float32, copy=False),
+            language="en",
+            clip_timestamps=clips,
+            batch_size=batch_size,
+            **self.decode_options
+        )
+
+        for segment in segments:
+            midpoint = (segment.start + segment.end) / 2
+            file_idx = bisect.bisect_right(file_starts, midpoint) - 1
+            transcripts[max(file_idx, 0)].append(segment.text)
 
-        return " ".join(transcription).strip()
+        return [" ".join(parts).strip() for parts in transcripts]
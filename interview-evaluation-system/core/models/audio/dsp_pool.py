@@ -0,0 +1,298 @@
+import io
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.shared_memory import SharedMemory
+from typing import BinaryIO, Dict, Optional, Tuple
+
+import numpy as np
+
+from core.models.audio.dsp_stub import BasicDSP
+from core.utils.audio_utils import FrameFeatures
+
+
+# ------------------------------------------------------------
+# Worker side
+# ------------------------------------------------------------
+
+_worker_dsp: Optional[BasicDSP] = None
+
+
+def _init_worker(target_sr: int, block_seconds: float):
+    global _worker_dsp
+    _worker_dsp = BasicDSP(
+        target_sr=target_sr,
+        streaming=True,
+        block_seconds=block_seconds
+    )
+
+
+class _SharedBufferReader(io.RawIOBase):
+    """
+    Seekable, zero-copy file object over a shared-memory buffer.
+    """
+
+    def __init__(self, buffer: memoryview):
+        self._buffer = buffer
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        n = max(0, min(len(b), len(self._buffer) - self._pos))
+        b[:n] = self._buffer[self._pos:self._pos + n]
+        self._pos += n
+        return n
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._buffer)
+        self._pos = max(0, offset)
+        return self._pos
+
+    def tell(self) -> int:
+        return self._pos
+
+
+def _preprocess_task(
+    input_name: str,
+    input_size: int,
+    max_duration_sec: Optional[float]
+) -> Tuple[float, str, int, FrameFeatures]:
+    """
+    Decode the encoded audio in `input_name`; write the float32
+    signal into a new shared-memory block owned by the caller.
+    """
+    started = time.time()
+
+    shm_in = SharedMemory(name=input_name)
+    view = shm_in.buf[:input_size]
+    try:
+        audio, features = _worker_dsp.preprocess_with_features(
+            _SharedBufferReader(view),
+            max_duration_sec=max_duration_sec
+        )
+    finally:
+        view.release()
+        shm_in.close()
+
+    shm_out = SharedMemory(create=True, size=max(audio.nbytes, 1))
+    np.ndarray(audio.shape, dtype=np.float32, buffer=shm_out.buf)[:] = audio
+    shm_out.close()
+
+    return started, shm_out.name, len(audio), features
+
+
+# ------------------------------------------------------------
+# Caller side
+# ------------------------------------------------------------
+
+class DSPProcessPool:
+    """
+    Dedicated process pool for DSP (decode, resample, frame
+    features) so CPU-bound audio work never occupies the API
+    threadpool.
+
+    Encoded uploads go to workers, and decoded signals come back,
+    through shared memory; only names, sizes and the small
+    FrameFeatures cross the pipe.
+
+    A worker that dies (e.g. OOM-killed) breaks the whole executor;
+    its in-flight requests fail, and the executor is replaced so
+    later requests are served.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        target_sr: int = 16000,
+        block_seconds: float = 5.0
+    ):
+        self.workers = workers
+        self._initargs = (target_sr, block_seconds)
+
+        self._lock = threading.Lock()
+        self._executor = self._new_executor()
+        self._restarts = 0
+        self._in_flight = 0
+        self._max_queue_depth = 0
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._total_wait = 0.0
+        self._total_service = 0.0
+
+    # --------------------------------------------------
+    # PUBLIC API
+    # --------------------------------------------------
+    def submit(
+        self,
+        source: BinaryIO,
+        max_duration_sec: Optional[float] = None
+    ) -> "Future[Tuple[np.ndarray, FrameFeatures]]":
+        """
+        Copy the encoded stream into shared memory and queue it.
+        """
+        source.seek(0, io.SEEK_END)
+        size = source.tell()
+        source.seek(0)
+
+        if size == 0:
+            raise ValueError("Empty audio file")
+
+        shm_in = SharedMemory(create=True, size=size)
+        view = shm_in.buf[:size]
+        try:
+            filled = 0
+            while filled < size:
+                n = source.readinto(view[filled:]) if hasattr(source, "readinto") \
+                    else self._read_into(source, view, filled)
+                if not n:
+                    break
+                filled += n
+        finally:
+            view.release()
+
+        submitted_at = time.time()
+        with self._lock:
+            self._submitted += 1
+            self._in_flight += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queue_depth())
+
+        result: Future = Future()
+        try:
+            task, executor = self._submit(_preprocess_task, shm_in.name, filled, max_duration_sec)
+        except BaseException:
+            shm_in.close()
+            shm_in.unlink()
+            with self._lock:
+                self._in_flight -= 1
+            raise
+        task.add_done_callback(
+            lambda done: self._finish(done, result, shm_in, submitted_at, executor)
+        )
+        return result
+
+    def preprocess_with_features(
+        self,
+        source: BinaryIO,
+        max_duration_sec: Optional[float] = None
+    ) -> Tuple[np.ndarray, FrameFeatures]:
+        """
+        Blocking drop-in for BasicDSP.preprocess_with_features.
+        """
+        return self.submit(source, max_duration_sec).result()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            finished = self._completed + self._failed
+            return {
+                "workers": self.workers,
+                "in_flight": self._in_flight,
+                "queue_depth": self._queue_depth(),
+                "max_queue_depth": self._max_queue_depth,
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "failed": self._failed,
+                "restarts": self._restarts,
+                "avg_queue_wait_ms": round(1000 * self._total_wait / finished, 2) if finished else 0.0,
+                "avg_service_ms": round(1000 * self._total_service / finished, 2) if finished else 0.0
+            }
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    # --------------------------------------------------
+    # INTERNALS
+    # --------------------------------------------------
+    def _new_executor(self) -> ProcessPoolExecutor:
+        # spawn: never fork a process that holds torch/CTranslate2 threads
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=self._initargs
+        )
+
+    def _submit(self, fn, *args) -> Tuple[Future, ProcessPoolExecutor]:
+        """
+        Submit to the current executor, replacing it once if it
+        is broken. Returns the task and the executor running it.
+        """
+        executor = self._executor
+        try:
+            return executor.submit(fn, *args), executor
+        except BrokenProcessPool:
+            self._replace_executor(executor)
+            executor = self._executor
+            return executor.submit(fn, *args), executor
+
+    def _replace_executor(self, broken: ProcessPoolExecutor):
+        """
+        Swap in a new executor unless another thread already did.
+        """
+        with self._lock:
+            if self._executor is not broken:
+                return
+            self._executor = self._new_executor()
+            self._restarts += 1
+        broken.shutdown(wait=False, cancel_futures=True)
+        print(f"[DSP] Worker process died; process pool restarted ({self._restarts})")
+
+    def _queue_depth(self) -> int:
+        return max(0, self._in_flight - self.workers)
+
+    @staticmethod
+    def _read_into(source: BinaryIO, view: memoryview, offset: int) -> int:
+        data = source.read(min(len(view) - offset, 1 << 20))
+        view[offset:offset + len(data)] = data
+        return len(data)
+
+    def _finish(
+        self,
+        done: Future,
+        result: Future,
+        shm_in: SharedMemory,
+        submitted_at: float,
+        executor: ProcessPoolExecutor
+    ):
+        shm_in.close()
+        shm_in.unlink()
+
+        finished_at = time.time()
+        try:
+            started_at, output_name, length, features = done.result()
+
+            shm_out = SharedMemory(name=output_name)
+            try:
+                audio = np.ndarray((length,), dtype=np.float32, buffer=shm_out.buf).copy()
+            finally:
+                shm_out.close()
+                shm_out.unlink()
+
+            with self._lock:
+                self._completed += 1
+                self._total_wait += max(0.0, started_at - submitted_at)
+                self._total_service += max(0.0, finished_at - started_at)
+
+            result.set_result((audio, features))
+
+        except BaseException as e:
+            with self._lock:
+                self._failed += 1
+                self._total_service += finished_at - submitted_at
+            if isinstance(e, BrokenProcessPool):
+                self._replace_executor(executor)
+            result.set_exception(e)
+
+        finally:
+            with self._lock:
+                self._in_flight -= 1
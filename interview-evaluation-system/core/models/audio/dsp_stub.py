@@ -1,7 +1,38 @@
 import numpy as np
 import librosa
+import soundfile as sf
+import soxr
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator, List, Optional, Tuple, Union
 
 from core.interfaces.dsp import DSPInterface
+from core.utils.audio_utils import (
+    FrameFeatures,
+    StreamingFrameAnalyzer,
+    compute_frame_features
+)
+
+
+AudioSource = Union[str, BinaryIO]
+
+
+class AudioLimitExceeded(ValueError):
+    """
+    Raised when a recording is longer than the allowed duration.
+    """
+    pass
+
+
+@dataclass
+class AudioBlock:
+    """
+    One decoded, resampled block of a streamed recording.
+    """
+    samples: np.ndarray                    # mono float32 at target_sr
+    offset: int                            # first sample index in the stream
+    voiced_segments: List[Tuple[int, int]]  # segments closed by this block
+    expected_total: int                    # stream length at target_sr, from the header
+    features: Optional[FrameFeatures] = None  # set on the final block only
 
 
 class BasicDSP(DSPInterface):
@@ -9,10 +40,23 @@ class BasicDSP(DSPInterface):
     Basic DSP pipeline for interview audio preprocessing.
     """
 
-    def __init__(self, target_sr: int = 16000):
+    def __init__(
+        self,
+        target_sr: int = 16000,
+        streaming: bool = False,
+        block_seconds: float = 5.0
+    ):
+        """
+        Args:
+            streaming: decode/resample in fixed-size blocks instead of
+                loading the whole file at once
+            block_seconds: block size (input timeline) in streaming mode
+        """
         self.target_sr = target_sr
+        self.streaming = streaming
+        self.block_seconds = block_seconds
 
-    def preprocess(self, audio_path: str) -> np.ndarray:
+    def preprocess(self, audio_path: AudioSource) -> np.ndarray:
         """
         Steps:
         1. Load audio
@@ -21,6 +65,26 @@ class BasicDSP(DSPInterface):
         4. Trim leading/trailing silence
         5. Normalize amplitude
         """
+        audio, _ = self.preprocess_with_features(audio_path)
+        return audio
+
+    def preprocess_with_features(
+        self,
+        audio_path: AudioSource,
+        max_duration_sec: Optional[float] = None
+    ) -> Tuple[np.ndarray, FrameFeatures]:
+        """
+        Same as preprocess, but also returns the frame features
+        (computed once, used for trimming) so delivery analysis
+        can reuse them.
+
+        audio_path may also be a readable binary file object
+        (e.g. an upload stream); it is decoded in place.
+        WAV, FLAC and OGG (Vorbis/Opus) are decoded by libsndfile,
+        with no ffmpeg subprocess.
+        """
+        if self.streaming:
+            return self._preprocess_streaming(audio_path, max_duration_sec)
 
         # Load audio
         audio, sr = librosa.load(
@@ -32,12 +96,123 @@ class BasicDSP(DSPInterface):
         if audio.size == 0:
             raise ValueError("Empty audio file")
 
+        if max_duration_sec and audio.size > max_duration_sec * self.target_sr:
+            raise AudioLimitExceeded(
+                f"Audio longer than {max_duration_sec:g} seconds"
+            )
+
         # Trim silence
-        audio, _ = librosa.effects.trim(audio, top_db=20)
+        features = compute_frame_features(audio)
+        return self._trim_and_normalize(audio, features)
+
+    # --------------------------------------------------
+    # Block streaming
+    # --------------------------------------------------
+    def stream(
+        self,
+        audio_path: AudioSource,
+        max_duration_sec: Optional[float] = None
+    ) -> Iterator[AudioBlock]:
+        """
+        Decode, downmix and resample block by block.
+
+        Only one block (plus a short frame carry) is held at a time,
+        and voiced segments are reported as soon as they close, so
+        analysis can start before the file is fully decoded. The
+        last block carries the exact FrameFeatures of the stream.
+
+        max_duration_sec is checked against the header before any
+        decoding and again against the decoded length, so oversized
+        input is rejected without being decoded in full.
+        """
+        analyzer = StreamingFrameAnalyzer()
+        offset = 0
+        max_samples = (
+            int(max_duration_sec * self.target_sr) if max_duration_sec else None
+        )
+
+        with sf.SoundFile(audio_path) as f:
+            if max_duration_sec and f.frames > max_duration_sec * f.samplerate:
+                raise AudioLimitExceeded(
+                    f"Audio longer than {max_duration_sec:g} seconds"
+                )
+
+            resampler = None
+            if f.samplerate != self.target_sr:
+                resampler = soxr.ResampleStream(
+                    f.samplerate, self.target_sr, 1, dtype="float32", quality="HQ"
+                )
+
+            block_frames = max(1, int(self.block_seconds * f.samplerate))
+            expected_total = int(np.ceil(f.frames * self.target_sr / f.samplerate)) + 1
+
+            while True:
+                block = f.read(block_frames, dtype="float32", always_2d=True)
+                last = len(block) < block_frames
+
+                samples = block.mean(axis=1, dtype=np.float32)
+                if resampler is not None:
+                    samples = resampler.resample_chunk(samples, last=last)
+
+                if max_samples is not None and offset + len(samples) > max_samples:
+                    raise AudioLimitExceeded(
+                        f"Audio longer than {max_duration_sec:g} seconds"
+                    )
+
+                segments = analyzer.update(samples)
+
+                if last:
+                    closing, features = analyzer.finalize()
+                    yield AudioBlock(
+                        samples, offset, segments + closing, expected_total, features
+                    )
+                    return
+
+                yield AudioBlock(samples, offset, segments, expected_total)
+                offset += len(samples)
+
+    def _preprocess_streaming(
+        self,
+        audio_path: AudioSource,
+        max_duration_sec: Optional[float] = None
+    ) -> Tuple[np.ndarray, FrameFeatures]:
+        audio = None
+        written = 0
+        features = None
+
+        for block in self.stream(audio_path, max_duration_sec):
+            if audio is None:
+                # Resampled blocks land directly in one preallocated buffer
+                audio = np.empty(block.expected_total, dtype=np.float32)
+
+            end = block.offset + len(block.samples)
+            if end > len(audio):
+                audio = np.resize(audio, end)
+            audio[block.offset:end] = block.samples
+            written = end
+            features = block.features
+
+        if written == 0:
+            raise ValueError("Empty audio file")
+
+        return self._trim_and_normalize(audio[:written], features)
+
+    def _trim_and_normalize(
+        self,
+        audio: np.ndarray,
+        features: FrameFeatures
+    ) -> Tuple[np.ndarray, FrameFeatures]:
+        start, end = features.trim_bounds()
+        audio = audio[start:end]
+        features = features.slice(start, end)
 
         # Normalize amplitude
-        max_val = np.max(np.abs(audio))
+        max_val = max(float(audio.max()), -float(audio.min())) if audio.size else 0.0
         if max_val > 0:
-            audio = audio / max_val
+            if self.streaming:
+                audio /= max_val  # buffer is owned here; no copy
+            else:
+                audio = audio / max_val
+            features = features.scaled(1.0 / max_val)
 
-        return audio
+        return audio, features
@@ -0,0 +1,141 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+from core.utils.audio_utils import StreamingFrameAnalyzer
+
+
+@dataclass
+class TranscriptUpdate:
+    committed: str      # stable text; never revised
+    provisional: str    # tail text; may change on the next decode
+
+
+class IncrementalTranscriber:
+    """
+    Sliding-window transcription for live answers.
+
+    Audio is appended as it arrives and the uncommitted tail is
+    re-decoded every `step_seconds`. Segments ending more than
+    `holdback_seconds` before the tail end are committed and
+    their audio dropped, so each decode covers at most
+    `window_seconds` and only a short tail remains to decode
+    once the candidate stops speaking.
+    """
+
+    def __init__(
+        self,
+        asr,
+        sample_rate: int = 16000,
+        step_seconds: float = 1.0,
+        holdback_seconds: float = 1.0,
+        window_seconds: float = 15.0
+    ):
+        """
+        Args:
+            asr: any ASR exposing transcribe_segments()
+                (FasterWhisperASR, ASRWorkerPool)
+        """
+        self.asr = asr
+        self.sample_rate = sample_rate
+        self.step = int(step_seconds * sample_rate)
+        self.holdback = holdback_seconds
+        self.window = window_seconds
+
+        self.analyzer = StreamingFrameAnalyzer()
+        self._blocks: List[np.ndarray] = []
+        self._tail = np.zeros(0, dtype=np.float32)
+        self._since_decode = 0
+        self._committed: List[str] = []
+        self._provisional = ""
+        self._last_voiced = 0
+
+    @property
+    def num_samples(self) -> int:
+        return self.analyzer.num_samples
+
+    @property
+    def trailing_silence(self) -> float:
+        """
+        Seconds since the last voiced frame.
+        """
+        if self.analyzer.in_speech:
+            return 0.0
+        return (self.num_samples - self._last_voiced) / self.sample_rate
+
+    @property
+    def transcript(self) -> str:
+        return " ".join(self._committed + [self._provisional]).strip()
+
+    def feed(self, samples: np.ndarray) -> Optional[TranscriptUpdate]:
+        """
+        Append audio; returns an update when a decode ran.
+        """
+        samples = samples.astype(np.float32, copy=False)
+
+        for _, end in self.analyzer.update(samples):
+            self._last_voiced = end
+
+        self._blocks.append(samples)
+        self._tail = np.concatenate((self._tail, samples))
+        self._since_decode += len(samples)
+
+        if self._since_decode < self.step:
+            return None
+
+        self._decode(final=False)
+        return TranscriptUpdate(" ".join(self._committed), self._provisional)
+
+    def finish(self):
+        """
+        Decode the remaining tail.
+
+        Returns:
+            (transcript, full_audio, frame_features)
+        """
+        if self._tail.size:
+            self._decode(final=True)
+
+        _, features = self.analyzer.finalize()
+        audio = np.concatenate(self._blocks) if self._blocks else np.zeros(0, dtype=np.float32)
+
+        return " ".join(self._committed).strip(), audio, features
+
+    def _decode(self, final: bool):
+        self._since_decode = 0
+        segments = self.asr.transcribe_segments(self._tail, self.sample_rate)
+
+        tail_seconds = len(self._tail) / self.sample_rate
+        if final:
+            commit_before = float("inf")
+        elif tail_seconds > self.window:
+            # Window full: commit everything but the last segment,
+            # or that too if it alone spans the window (continuous
+            # speech), so no words are lost when the tail is cut
+            last_start = segments[-1][0] if segments else tail_seconds
+            commit_before = (
+                float("inf") if tail_seconds - last_start > self.window else last_start
+            )
+        else:
+            commit_before = tail_seconds - self.holdback
+
+        committed_until = 0.0
+        provisional = []
+
+        for start, end, text in segments:
+            if end <= commit_before:
+                self._committed.append(text.strip())
+                committed_until = end
+            else:
+                provisional.append(text.strip())
+
+        self._provisional = " ".join(provisional)
+
+        if final:
+            self._tail = np.zeros(0, dtype=np.float32)
+        elif committed_until > 0:
+            self._tail = self._tail[int(committed_until * self.sample_rate):]
+        elif tail_seconds > self.window:
+            # Nothing decodable (e.g. long silence): keep the window bounded
+            self._tail = self._tail[-int(self.window * self.sample_rate):]
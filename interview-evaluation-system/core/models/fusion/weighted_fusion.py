@@ -1,3 +1,5 @@
+import numpy as np
+
 from core.interfaces.fusion_engine import FusionEngineInterface
 
 class WeightedFusionEngine(FusionEngineInterface):
@@ -25,6 +27,29 @@ class WeightedFusionEngine(FusionEngineInterface):
             "breakdown": scores
         }
 
+    def fuse_many(self, scores: list) -> list:
+        """
+        Batched fuse(): weighted sums over score columns, added in
+        the same order as fuse() so results match it exactly.
+        """
+        if not scores:
+            return []
+
+        final_scores = np.zeros(len(scores))
+        for key, weight in self.weights.items():
+            final_scores += weight * np.array([item.get(key, 0.0) for item in scores])
+
+        results = []
+        for item, final_score in zip(scores, final_scores):
+            final_score = round(float(final_score) * 10, 2)
+            results.append({
+                "final_score": final_score,
+                "verdict": self._map_verdict(final_score),
+                "breakdown": item
+            })
+
+        return results
+
     def _map_verdict(self, score: float) -> str:
         if score >= 8.0:
             return "Excellent"
@@ -1,5 +1,5 @@
 import re
-from typing import List
+from typing import List, Pattern
 from core.interfaces.concept_scorer import ConceptScorerInterface
 
 class RegexConceptScorer(ConceptScorerInterface):
@@ -11,12 +11,50 @@ class RegexConceptScorer(ConceptScorerInterface):
         if not student_answer or not key_concepts:
             return 0.0
 
+        hits = self.matched_concepts(student_answer, key_concepts)
+        return len(hits) / len(key_concepts)
+
+    def matched_concepts(self, student_answer: str, key_concepts: List[str]) -> List[str]:
+        """
+        Concepts found in the answer (in key_concepts order).
+        """
+        if not student_answer:
+            return []
+
         answer = student_answer.lower()
-        hits = 0
+        hits = []
 
         for concept in key_concepts:
             pattern = r"\b" + re.escape(concept.lower()) + r"\b"
             if re.search(pattern, answer):
-                hits += 1
+                hits.append(concept)
+
+        return hits
+
+    def compile(self, key_concepts: List[str]) -> List[Pattern]:
+        """
+        Compiled matcher for one question's concepts.
+        """
+        return [
+            re.compile(r"\b" + re.escape(concept.lower()) + r"\b")
+            for concept in key_concepts
+        ]
+
+    def score_compiled(self, student_answer: str, patterns: List[Pattern]) -> float:
+        """
+        score() with a matcher from compile().
+        """
+        if not student_answer or not patterns:
+            return 0.0
+
+        answer = student_answer.lower()
+        hits = sum(1 for pattern in patterns if pattern.search(answer))
+        return hits / len(patterns)
 
-        return hits / len(key_concepts)
+    def score_many(self, student_answers: List[str], key_concepts: List[str]) -> List[float]:
+        """
+        Batched score() for one question: concept patterns are
+        compiled once and reused for every answer.
+        """
+        patterns = self.compile(key_concepts)
+        return [self.score_compiled(answer, patterns) for answer in student_answers]
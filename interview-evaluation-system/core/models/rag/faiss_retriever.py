@@ -11,7 +11,8 @@ class FAISSRetriever(RetrieverInterface):
     def __init__(self, index_path: str, corpus: list):
         self.index = faiss.read_index(index_path)
         self.corpus = corpus
-        self.model = SentenceTransformer("multi-qa-mpnet-base-dot-v1")
+        self.model_name = "multi-qa-mpnet-base-dot-v1"
+        self.model = SentenceTransformer(self.model_name)
 
     def retrieve(self, query: str, top_k: int = 5) -> list:
         if not query:
@@ -30,3 +31,70 @@ class FAISSRetriever(RetrieverInterface):
                 results.append(self.corpus[idx])
 
         return results
+
+    def candidate_pool(self, query: str, pool_size: int = 50):
+        """
+        Ids and stored vectors of the pool_size chunks nearest to
+        query (e.g. the question text), or None if the index cannot
+        reconstruct vectors.
+        """
+        if not query:
+            return None
+
+        query_embedding = self.model.encode(
+            [query], convert_to_numpy=True
+        )
+        faiss.normalize_L2(query_embedding)
+
+        _, indices = self.index.search(query_embedding, pool_size)
+        ids = np.array([idx for idx in indices[0] if idx != -1], dtype=np.int64)
+
+        try:
+            vectors = np.vstack([self.index.reconstruct(int(idx)) for idx in ids])
+        except (RuntimeError, ValueError):
+            return None
+
+        return ids, vectors
+
+    def retrieve_from_pool(self, query: str, pool, top_k: int = 5) -> list:
+        """
+        retrieve() restricted to a candidate_pool(): the query is
+        ranked against the pool's vectors instead of the full index.
+        """
+        if not query:
+            return []
+
+        ids, vectors = pool
+        query_embedding = self.model.encode(
+            [query], convert_to_numpy=True
+        )
+        faiss.normalize_L2(query_embedding)
+
+        similarities = vectors @ query_embedding[0]
+        order = np.argsort(-similarities, kind="stable")[:top_k]
+
+        return [self.corpus[ids[i]] for i in order]
+
+    def retrieve_many(self, queries: list, top_k: int = 5, batch_size: int = 64) -> list:
+        """
+        Batched retrieve(): one encode call and one index search
+        for all queries.
+        """
+        results = [[] for _ in queries]
+        positions = [i for i, query in enumerate(queries) if query]
+        if not positions:
+            return results
+
+        query_embeddings = self.model.encode(
+            [queries[i] for i in positions],
+            batch_size=batch_size,
+            convert_to_numpy=True
+        )
+        faiss.normalize_L2(query_embeddings)
+
+        _, indices = self.index.search(query_embeddings, top_k)
+
+        for position, row in zip(positions, indices):
+            results[position] = [self.corpus[idx] for idx in row if idx != -1]
+
+        return results
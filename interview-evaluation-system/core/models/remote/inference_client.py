@@ -0,0 +1,364 @@
+import itertools
+import os
+import threading
+from concurrent.futures import Future
+from multiprocessing.connection import Client
+from typing import Any, Dict, List, Optional, Tuple
+
+import faiss
+import numpy as np
+
+from core.interfaces.asr import ASRInterface
+from core.interfaces.retriever import RetrieverInterface
+from core.interfaces.semantic_scorer import SemanticScorerInterface
+
+# Encoder of FAISSRetriever; the index was built with it
+RETRIEVER_MODEL = "multi-qa-mpnet-base-dot-v1"
+
+
+def load_authkey(address: str, env_name: Optional[str] = None, create: bool = False) -> bytes:
+    """
+    Connection authkey: the env_name variable if set, else the
+    key file next to the socket (<address>.key, mode 0600),
+    generated by the server on first start (create=True).
+    """
+    if env_name and os.environ.get(env_name):
+        return os.environ[env_name].encode("utf-8")
+
+    key_path = f"{address}.key"
+    if create and not os.path.exists(key_path):
+        fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(os.urandom(32).hex().encode("ascii"))
+
+    with open(key_path, "rb") as f:
+        return f.read().strip()
+
+
+def _similarity_to_score(similarity: float) -> float:
+    # Normalize cosine similarity from [-1, 1] → [0, 1]
+    normalized = (similarity + 1.0) / 2.0
+    return max(0.0, min(1.0, normalized))
+
+
+class InferenceClient:
+    """
+    Connection to the local inference server (inference_server.py).
+
+    One Unix-socket connection per process, shared by all threads:
+    requests carry an id, a reader thread resolves the matching
+    future, so concurrent stages do not serialize on the socket.
+    The connection is opened lazily and reopened after a fork or
+    a server restart.
+    """
+
+    def __init__(self, address: str, authkey: bytes, timeout_sec: float = 60.0):
+        self.address = address
+        self.authkey = authkey
+        self.timeout_sec = timeout_sec
+
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+        self._send_lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+        self._pending: Dict[int, Future] = {}
+
+    # --------------------------------------------------
+    # PUBLIC API
+    # --------------------------------------------------
+    def call(self, method: str, timeout_sec: Optional[float] = None, **kwargs) -> Any:
+        """
+        Run `method` on the server; its exception is re-raised here.
+        Raises TimeoutError after timeout_sec (default: the client's).
+        """
+        future: Future = Future()
+
+        with self._lock:
+            conn = self._connection()
+            request_id = next(self._ids)
+            self._pending[request_id] = future
+
+        try:
+            with self._send_lock:
+                conn.send((request_id, method, kwargs))
+        except (OSError, EOFError) as e:
+            self._disconnect(conn, e)
+
+        try:
+            return future.result(timeout=timeout_sec or self.timeout_sec)
+        except TimeoutError:
+            with self._lock:
+                self._pending.pop(request_id, None)
+            raise
+
+    def encode(self, model: str, texts: List[str], normalize: bool = True) -> np.ndarray:
+        return self.call("encode", model=model, texts=list(texts), normalize=normalize)
+
+    def close(self):
+        with self._lock:
+            conn, self._conn = self._conn, None
+        if conn is not None:
+            conn.close()
+
+    # --------------------------------------------------
+    # INTERNALS
+    # --------------------------------------------------
+    def _connection(self):
+        """
+        Caller holds self._lock.
+        """
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+
+        # After a fork the inherited connection and its reader
+        # belong to the parent; start over
+        self._pending = {}
+        self._conn = Client(self.address, family="AF_UNIX", authkey=self.authkey)
+        self._pid = os.getpid()
+
+        threading.Thread(
+            target=self._read,
+            args=(self._conn,),
+            name="inference-client",
+            daemon=True
+        ).start()
+        return self._conn
+
+    def _read(self, conn):
+        while True:
+            try:
+                request_id, error, result = conn.recv()
+            except (OSError, EOFError) as e:
+                self._disconnect(conn, e)
+                return
+
+            with self._lock:
+                future = self._pending.pop(request_id, None)
+            if future is None:
+                continue  # caller already timed out
+
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def _disconnect(self, conn, cause: BaseException):
+        with self._lock:
+            if self._conn is not conn:
+                return
+            self._conn = None
+            pending, self._pending = self._pending, {}
+
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(
+                    ConnectionError(f"Inference server connection lost: {cause!r}")
+                )
+        try:
+            conn.close()
+        except OSError:
+            pass
+
+
+class RemoteSemanticScorer(SemanticScorerInterface):
+    """
+    SBERTSemanticScorer with encoding done by the inference server.
+    """
+
+    def __init__(self, client: InferenceClient, model_name: str = "all-MiniLM-L6-v2"):
+        self.client = client
+        self.model_name = model_name
+
+    def score(self, student_answer: str, ideal_answer: str) -> float:
+        if not student_answer or not ideal_answer:
+            return 0.0
+
+        emb_student, emb_ideal = self.client.encode(
+            self.model_name, [student_answer, ideal_answer]
+        )
+        return _similarity_to_score(float(np.dot(emb_student, emb_ideal)))
+
+    def encode_reference(self, ideal_answer: str) -> np.ndarray:
+        return self.client.encode(self.model_name, [ideal_answer])[0]
+
+    def score_with_reference(self, student_answer: str, reference_embedding: np.ndarray) -> float:
+        if not student_answer or reference_embedding is None:
+            return 0.0
+
+        emb_student = self.client.encode(self.model_name, [student_answer])[0]
+        return _similarity_to_score(float(np.dot(emb_student, reference_embedding)))
+
+    def score_many_with_reference(
+        self,
+        student_answers: List[str],
+        reference_embeddings: List[np.ndarray]
+    ) -> List[float]:
+        texts = sorted({answer for answer in student_answers if answer})
+        if not texts:
+            return [0.0 for _ in student_answers]
+
+        embeddings = self.client.encode(self.model_name, texts)
+        row = {text: i for i, text in enumerate(texts)}
+
+        return [
+            _similarity_to_score(float(np.dot(embeddings[row[answer]], reference)))
+            if answer and reference is not None else 0.0
+            for answer, reference in zip(student_answers, reference_embeddings)
+        ]
+
+    def score_many(self, pairs: List[Tuple[str, str]]) -> List[float]:
+        texts = sorted({
+            text
+            for student, ideal in pairs if student and ideal
+            for text in (student, ideal)
+        })
+        if not texts:
+            return [0.0 for _ in pairs]
+
+        embeddings = self.client.encode(self.model_name, texts)
+        row = {text: i for i, text in enumerate(texts)}
+
+        return [
+            _similarity_to_score(float(np.dot(embeddings[row[student]], embeddings[row[ideal]])))
+            if student and ideal else 0.0
+            for student, ideal in pairs
+        ]
+
+
+class RemoteRetriever(RetrieverInterface):
+    """
+    FAISSRetriever with query encoding done by the inference
+    server; the index and corpus stay in this process.
+    """
+
+    def __init__(
+        self,
+        index_path: str,
+        corpus: list,
+        client: InferenceClient,
+        model_name: str = RETRIEVER_MODEL
+    ):
+        self.index = faiss.read_index(index_path)
+        self.corpus = corpus
+        self.client = client
+        self.model_name = model_name
+
+    def retrieve(self, query: str, top_k: int = 5) -> list:
+        if not query:
+            return []
+        return self.retrieve_many([query], top_k)[0]
+
+    def retrieve_many(self, queries: list, top_k: int = 5) -> list:
+        results = [[] for _ in queries]
+        positions = [i for i, query in enumerate(queries) if query]
+        if not positions:
+            return results
+
+        query_embeddings = self._encode([queries[i] for i in positions])
+        _, indices = self.index.search(query_embeddings, top_k)
+
+        for position, row in zip(positions, indices):
+            results[position] = [self.corpus[idx] for idx in row if idx != -1]
+
+        return results
+
+    def candidate_pool(self, query: str, pool_size: int = 50):
+        if not query:
+            return None
+
+        _, indices = self.index.search(self._encode([query]), pool_size)
+        ids = np.array([idx for idx in indices[0] if idx != -1], dtype=np.int64)
+
+        try:
+            vectors = np.vstack([self.index.reconstruct(int(idx)) for idx in ids])
+        except (RuntimeError, ValueError):
+            return None
+
+        return ids, vectors
+
+    def retrieve_from_pool(self, query: str, pool, top_k: int = 5) -> list:
+        if not query:
+            return []
+
+        ids, vectors = pool
+        similarities = vectors @ self._encode([query])[0]
+        order = np.argsort(-similarities, kind="stable")[:top_k]
+
+        return [self.corpus[ids[i]] for i in order]
+
+    def _encode(self, queries: List[str]) -> np.ndarray:
+        # Same as encode + faiss.normalize_L2 in FAISSRetriever
+        return np.ascontiguousarray(
+            self.client.encode(self.model_name, queries), dtype=np.float32
+        )
+
+
+class RemoteASR(ASRInterface):
+    """
+    ASRWorkerPool running in the inference server; same methods.
+
+    Decode time grows with clip length (and the request may queue
+    behind other decodes), so transcription calls wait the client
+    timeout plus timeout_per_audio_sec per second of audio.
+    """
+
+    def __init__(self, client: InferenceClient, timeout_per_audio_sec: float = 3.0):
+        self.client = client
+        self.timeout_per_audio_sec = timeout_per_audio_sec
+
+    def select_profile(self, duration_sec: float) -> str:
+        return self.client.call("select_profile", duration_sec=duration_sec)
+
+    def transcribe(
+        self,
+        audio_signal: np.ndarray,
+        sample_rate: int = 16000,
+        voiced_intervals: Optional[np.ndarray] = None,
+        profile: Optional[str] = None
+    ) -> str:
+        return self.client.call(
+            "transcribe",
+            timeout_sec=self._timeout([audio_signal], sample_rate),
+            audio_signal=audio_signal,
+            sample_rate=sample_rate,
+            voiced_intervals=voiced_intervals,
+            profile=profile
+        )
+
+    def transcribe_segments(
+        self,
+        audio_signal: np.ndarray,
+        sample_rate: int = 16000,
+        voiced_intervals: Optional[np.ndarray] = None,
+        profile: Optional[str] = None
+    ) -> List[Tuple[float, float, str]]:
+        return self.client.call(
+            "transcribe_segments",
+            timeout_sec=self._timeout([audio_signal], sample_rate),
+            audio_signal=audio_signal,
+            sample_rate=sample_rate,
+            voiced_intervals=voiced_intervals,
+            profile=profile
+        )
+
+    def transcribe_batch(
+        self,
+        audio_signals: List[np.ndarray],
+        sample_rate: int = 16000,
+        profile: Optional[str] = None
+    ) -> List[str]:
+        return self.client.call(
+            "transcribe_batch",
+            timeout_sec=self._timeout(audio_signals, sample_rate),
+            audio_signals=audio_signals,
+            sample_rate=sample_rate,
+            profile=profile
+        )
+
+    def stats(self) -> Dict[str, float]:
+        return self.client.call("asr_stats")
+
+    def _timeout(self, audio_signals: List[np.ndarray], sample_rate: int) -> float:
+        audio_sec = sum(len(signal) for signal in audio_signals) / sample_rate
+        return self.client.timeout_sec + self.timeout_per_audio_sec * audio_sec
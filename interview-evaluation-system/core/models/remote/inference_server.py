@@ -0,0 +1,329 @@
+import os
+import queue
+import threading
+import time
+from multiprocessing.connection import Listener
+from multiprocessing import AuthenticationError
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+import yaml
+
+from core.models.remote.inference_client import RETRIEVER_MODEL, load_authkey
+from core.orchestration.pipeline_builder import load_pipeline_config
+
+# Server-side ASR methods clients may call (ASRWorkerPool API)
+ASR_METHODS = ("transcribe", "transcribe_segments", "transcribe_batch")
+
+Reply = Callable[[Optional[BaseException], object], None]
+
+
+class _EncodeRequest:
+    __slots__ = ("texts", "normalize", "reply")
+
+    def __init__(self, texts: List[str], normalize: bool, reply: Reply):
+        self.texts = texts
+        self.normalize = normalize
+        self.reply = reply
+
+
+class EncoderBatcher:
+    """
+    Cross-worker micro-batching for one SentenceTransformer.
+
+    Requests from every connection share one queue. The batching
+    thread takes the first request, waits at most max_wait_ms for
+    more (up to max_batch_texts texts), encodes the distinct texts
+    in one call and hands each request its rows. Under load this
+    turns many single-answer encodes from different API workers
+    into one batched forward pass.
+    """
+
+    def __init__(
+        self,
+        model,
+        max_batch_texts: int = 256,
+        max_wait_ms: float = 5.0,
+        batch_size: int = 64
+    ):
+        self.model = model
+        self.max_batch_texts = max_batch_texts
+        self.max_wait_sec = max_wait_ms / 1000.0
+        self.batch_size = batch_size
+
+        self._queue: "queue.Queue[Optional[_EncodeRequest]]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._batches = 0
+        self._requests = 0
+        self._texts = 0
+
+        self._thread = threading.Thread(target=self._run, name="encoder-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, texts: List[str], normalize: bool, reply: Reply):
+        self._queue.put(_EncodeRequest(texts, normalize, reply))
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "batches": self._batches,
+                "requests": self._requests,
+                "texts": self._texts,
+                "avg_requests_per_batch": round(self._requests / self._batches, 2) if self._batches else 0.0
+            }
+
+    def close(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    # --------------------------------------------------
+    # INTERNALS
+    # --------------------------------------------------
+    def _run(self):
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+
+            pending = [first]
+            num_texts = len(first.texts)
+            deadline = time.monotonic() + self.max_wait_sec
+            stop = False
+
+            while num_texts < self.max_batch_texts:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if request is None:
+                    stop = True
+                    break
+                pending.append(request)
+                num_texts += len(request.texts)
+
+            for normalize in (True, False):
+                group = [r for r in pending if r.normalize == normalize]
+                if group:
+                    self._encode(group, normalize)
+
+            if stop:
+                return
+
+    def _encode(self, group: List[_EncodeRequest], normalize: bool):
+        # Ideal answers and question texts repeat across workers
+        texts = list(dict.fromkeys(text for request in group for text in request.texts))
+
+        try:
+            embeddings = self.model.encode(
+                texts,
+                batch_size=self.batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=normalize
+            ) if texts else np.zeros((0, 0), dtype=np.float32)
+        except Exception as e:
+            for request in group:
+                request.reply(e, None)
+            return
+
+        row = {text: i for i, text in enumerate(texts)}
+        for request in group:
+            request.reply(None, embeddings[[row[text] for text in request.texts]])
+
+        with self._lock:
+            self._batches += 1
+            self._requests += len(group)
+            self._texts += len(texts)
+
+
+class InferenceServer:
+    """
+    Local inference process owning the encoders and Whisper.
+
+    API workers connect over a Unix socket (InferenceClient).
+    Each connection gets a reader thread; encode requests go to
+    the model's EncoderBatcher, each ASR request to its own thread
+    that waits on the ASRWorkerPool. The pool bounds concurrent
+    decodes, so its queue depth (which drives the profile policy)
+    and wait statistics see every pending request.
+    One process means one intra-op thread pool for the whole
+    host instead of one per API worker.
+    """
+
+    def __init__(
+        self,
+        address: str,
+        authkey: bytes,
+        encoders: Dict[str, EncoderBatcher],
+        asr=None
+    ):
+        self.address = address
+        self.authkey = authkey
+        self.encoders = encoders
+        self.asr = asr
+
+    def serve_forever(self):
+        if os.path.exists(self.address):
+            os.unlink(self.address)
+
+        listener = Listener(self.address, family="AF_UNIX", authkey=self.authkey)
+        os.chmod(self.address, 0o600)
+        print(f"[INFERENCE] Serving {', '.join(self.encoders) or 'no encoders'}"
+              f"{' + ASR' if self.asr is not None else ''} on {self.address}")
+
+        try:
+            while True:
+                try:
+                    conn = listener.accept()
+                except (AuthenticationError, OSError, EOFError) as e:
+                    print(f"[INFERENCE] Rejected connection: {e!r}")
+                    continue
+
+                threading.Thread(
+                    target=self._handle,
+                    args=(conn,),
+                    name="inference-conn",
+                    daemon=True
+                ).start()
+        finally:
+            listener.close()
+            for batcher in self.encoders.values():
+                batcher.close()
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "encoders": {name: b.stats() for name, b in self.encoders.items()},
+            "asr": self.asr.stats() if self.asr is not None else None
+        }
+
+    # --------------------------------------------------
+    # INTERNALS
+    # --------------------------------------------------
+    def _handle(self, conn):
+        send_lock = threading.Lock()
+
+        def reply_to(request_id: int) -> Reply:
+            def reply(error: Optional[BaseException], result: object):
+                with send_lock:
+                    try:
+                        conn.send((request_id, error, result))
+                    except (OSError, EOFError):
+                        pass  # client went away
+                    except Exception as e:
+                        # Unpicklable exception or result
+                        conn.send((request_id, RuntimeError(repr(e)), None))
+            return reply
+
+        while True:
+            try:
+                request_id, method, kwargs = conn.recv()
+            except (OSError, EOFError):
+                conn.close()
+                return
+
+            reply = reply_to(request_id)
+
+            try:
+                self._dispatch(method, kwargs, reply)
+            except Exception as e:
+                reply(e, None)
+
+    def _dispatch(self, method: str, kwargs: dict, reply: Reply):
+        if method == "encode":
+            batcher = self.encoders.get(kwargs["model"])
+            if batcher is None:
+                raise ValueError(f"Encoder not loaded in the inference server: {kwargs['model']}")
+            batcher.submit(kwargs["texts"], kwargs["normalize"], reply)
+            return
+
+        if method == "stats":
+            reply(None, self.stats())
+            return
+
+        if self.asr is None:
+            raise ValueError("ASR is not loaded in the inference server")
+
+        if method == "select_profile":
+            reply(None, self.asr.select_profile(kwargs["duration_sec"]))
+        elif method == "asr_stats":
+            reply(None, self.asr.stats())
+        elif method in ASR_METHODS:
+            threading.Thread(
+                target=self._run_asr,
+                args=(method, kwargs, reply),
+                name="inference-asr",
+                daemon=True
+            ).start()
+        else:
+            raise ValueError(f"Unknown inference method: {method}")
+
+    def _run_asr(self, method: str, kwargs: dict, reply: Reply):
+        try:
+            result = getattr(self.asr, method)(**kwargs)
+        except Exception as e:
+            reply(e, None)
+            return
+        reply(None, result)
+
+
+# =====================================================
+# ENTRY POINT
+# =====================================================
+# python -m core.models.remote.inference_server
+#
+# Loads the models the pipeline config enables and serves them
+# until killed. Start it before the API with
+# inference_server.enabled: true in config/default.yaml.
+def main():
+    base_dir = Path(__file__).resolve().parents[3]
+    with open(base_dir / "config" / "default.yaml", "r") as f:
+        system_cfg = yaml.safe_load(f)
+
+    server_cfg = system_cfg["inference_server"]
+    pipeline = load_pipeline_config(
+        str(base_dir / "config" / f"{system_cfg['system']['pipeline']}.yaml")
+    )
+
+    import torch
+    if server_cfg["torch_threads"] > 0:
+        torch.set_num_threads(server_cfg["torch_threads"])
+
+    from sentence_transformers import SentenceTransformer
+
+    model_names = []
+    if pipeline.semantic_enabled:
+        model_names.append(pipeline.semantic_model)
+    if pipeline.retriever_enabled:
+        model_names.append(RETRIEVER_MODEL)
+
+    encoders = {
+        name: EncoderBatcher(
+            SentenceTransformer(name),
+            max_batch_texts=server_cfg["max_batch_texts"],
+            max_wait_ms=server_cfg["max_wait_ms"],
+            batch_size=server_cfg["encode_batch_size"]
+        )
+        for name in dict.fromkeys(model_names)
+    }
+
+    asr = None
+    if pipeline.dsp_enabled and pipeline.asr_enabled:
+        from core.models.audio.asr_pool import ASRWorkerPool
+        asr = ASRWorkerPool(**system_cfg["audio"]["asr"])
+
+    address = str(base_dir / server_cfg["address"])
+    Path(address).parent.mkdir(parents=True, exist_ok=True)
+
+    InferenceServer(
+        address=address,
+        authkey=load_authkey(address, server_cfg["authkey_env"], create=True),
+        encoders=encoders,
+        asr=asr
+    ).serve_forever()
+
+
+if __name__ == "__main__":
+    main()
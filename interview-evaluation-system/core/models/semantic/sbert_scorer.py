@@ -1,3 +1,6 @@
+from typing import List, Tuple
+
+import numpy as np
 from sentence_transformers import SentenceTransformer, util
 from core.interfaces.semantic_scorer import SemanticScorerInterface
 
@@ -8,6 +11,7 @@ class SBERTSemanticScorer(SemanticScorerInterface):
     """
 
     def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+        self.model_name = model_name
         self.model = SentenceTransformer(model_name)
 
     def score(self, student_answer: str, ideal_answer: str) -> float:
@@ -26,3 +30,102 @@ class SBERTSemanticScorer(SemanticScorerInterface):
         # Normalize cosine similarity from [-1, 1] → [0, 1]
         normalized = (similarity + 1.0) / 2.0
         return max(0.0, min(1.0, normalized))
+
+    def encode_reference(self, ideal_answer: str) -> np.ndarray:
+        """
+        Normalized embedding of an ideal answer, for reuse across
+        many student answers.
+        """
+        return self.model.encode(
+            ideal_answer,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+
+    def score_with_reference(self, student_answer: str, reference_embedding: np.ndarray) -> float:
+        """
+        score() against a precomputed encode_reference() embedding;
+        only the student answer is encoded.
+        """
+        if not student_answer or reference_embedding is None:
+            return 0.0
+
+        emb_student = self.model.encode(
+            student_answer,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+        similarity = float(np.dot(emb_student, reference_embedding))
+
+        normalized = (similarity + 1.0) / 2.0
+        return max(0.0, min(1.0, normalized))
+
+    def score_many_with_reference(
+        self,
+        student_answers: List[str],
+        reference_embeddings: List[np.ndarray],
+        batch_size: int = 64
+    ) -> List[float]:
+        """
+        Batched score_with_reference(): the student answers are
+        encoded in one call; references are encode_reference()
+        embeddings (e.g. from the question bank).
+        """
+        texts = sorted({answer for answer in student_answers if answer})
+        if not texts:
+            return [0.0 for _ in student_answers]
+
+        embeddings = self.model.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+        row = {text: i for i, text in enumerate(texts)}
+
+        scores = []
+        for answer, reference in zip(student_answers, reference_embeddings):
+            if not answer or reference is None:
+                scores.append(0.0)
+                continue
+
+            similarity = float(np.dot(embeddings[row[answer]], reference))
+            normalized = (similarity + 1.0) / 2.0
+            scores.append(max(0.0, min(1.0, normalized)))
+
+        return scores
+
+    def score_many(self, pairs: List[Tuple[str, str]], batch_size: int = 64) -> List[float]:
+        """
+        Batched score(): every distinct text (ideal answers repeat
+        across a question's candidates) is encoded once, in one
+        encode call, and similarities are row-wise dot products
+        of normalized embeddings.
+        """
+        texts = sorted({
+            text
+            for student, ideal in pairs if student and ideal
+            for text in (student, ideal)
+        })
+        if not texts:
+            return [0.0 for _ in pairs]
+
+        embeddings = self.model.encode(
+            texts,
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        )
+        row = {text: i for i, text in enumerate(texts)}
+
+        scores = []
+        for student, ideal in pairs:
+            if not student or not ideal:
+                scores.append(0.0)
+                continue
+
+            similarity = float(np.dot(embeddings[row[student]], embeddings[row[ideal]]))
+            normalized = (similarity + 1.0) / 2.0
+            scores.append(max(0.0, min(1.0, normalized)))
+
+        return scores
@@ -1,15 +1,101 @@
+import asyncio
+import functools
+import hashlib
+import json
 import re
-from typing import Dict, Any, Optional
+import threading
+import time
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
 from core.models.semantic.sbert_scorer import SBERTSemanticScorer
 from core.models.keyword.regex_concept_scorer import RegexConceptScorer
 from core.models.rag.faiss_retriever import FAISSRetriever
 from core.models.fusion.weighted_fusion import WeightedFusionEngine
+from core.models.remote.inference_client import InferenceClient, RemoteRetriever, RemoteSemanticScorer
 
-from core.utils.audio_utils import analyze_audio_delivery
+from core.utils.audio_utils import FrameFeatures, analyze_audio_delivery
 from core.models.audio.confidence_scorer import DeliveryConfidenceScorer
-from core.utils.data_loader import QuestionDataLoader
+from core.utils.question_bank import load_question_bank
+from core.utils.metrics import EVALUATION_SECONDS, MODEL_LOAD_SECONDS, STAGE_SECONDS
+from core.utils.result_cache import EvaluationResultCache, file_digest
 from core.interfaces.orchestrator import InterviewOrchestratorInterface
+from core.orchestration.pipeline_builder import SHORT_ANSWER_SKIPS, TEXT_STAGES, PipelineConfig
+
+# Stages whose timeout degrades the result instead of failing it
+OPTIONAL_STAGES = ("evidence", "delivery")
+
+
+class StageTimeout(TimeoutError):
+    """
+    A required evaluation stage did not finish within its timeout.
+    """
+
+
+@dataclass
+class QuestionAssets:
+    """
+    Per-question state computed ahead of the answer (see prefetch).
+    A field is None when its stage is inactive.
+    """
+    question_id: str
+    concept_patterns: Optional[list] = None
+    reference_embedding: Optional[Any] = None
+    evidence_pool: Optional[Tuple[Any, Any]] = None
+
+
+@dataclass
+class _BatchPlan:
+    """
+    Stages of one evaluate_many() call and the items they cover.
+    """
+    items: List[Dict[str, str]]
+    valid: List[int]
+    cache_keys: Dict[int, Optional[str]]
+    stage_items: Dict[str, List[int]]
+    stages: Dict[str, Callable[[], Any]]
+
+
+class _StageRun:
+    """
+    One stage call on the stage pool.
+
+    Records when the stage starts executing and how long it ran,
+    so its timeout counts execution only, not time queued behind
+    other requests. Only the pool thread writes these fields; the
+    caller reads them after the stage finished or timed out.
+    """
+
+    def __init__(self, fn: Callable[[], Any], on_start: Optional[Callable[[], None]] = None):
+        self.fn = fn
+        self.on_start = on_start
+        self.started = threading.Event()
+        self.started_at: Optional[float] = None
+        self.elapsed: Optional[float] = None
+
+    def __call__(self) -> Any:
+        self.started_at = time.monotonic()
+        self.started.set()
+        if self.on_start is not None:
+            self.on_start()
+        try:
+            return self.fn()
+        finally:
+            self.elapsed = time.monotonic() - self.started_at
+
+    def remaining(self, timeout: float) -> float:
+        """
+        Seconds left of the timeout (0 if it never started, e.g.
+        cancelled).
+        """
+        if self.started_at is None:
+            return 0.0
+        return max(0.0, self.started_at + timeout - time.monotonic())
+
+    def running_for(self) -> float:
+        return time.monotonic() - self.started_at if self.started_at is not None else 0.0
+
 
 class InterviewOrchestrator(InterviewOrchestratorInterface):
     """
@@ -22,34 +108,114 @@ class InterviewOrchestrator(InterviewOrchestratorInterface):
         question_data_path: str,
         faiss_index_path: str,
         corpus_chunks: list,
-        fusion_weights: Dict[str, float]
+        fusion_weights: Dict[str, float],
+        concurrent_stages: bool = False,
+        max_workers: int = 8,
+        stage_timeouts: Optional[Dict[str, float]] = None,
+        result_cache: Optional[Dict[str, Any]] = None,
+        pipeline: Optional[PipelineConfig] = None,
+        inference_client: Optional[InferenceClient] = None,
+        compile_question_bank: bool = True
     ):
+        """
+        Args:
+            concurrent_stages: run semantic, keyword, evidence and
+                delivery stages in parallel, joined at fusion
+            max_workers: size of the stage thread pool shared by
+                all requests
+            stage_timeouts: stage name -> seconds (concurrent mode only)
+            result_cache: EvaluationResultCache settings (max_entries,
+                ttl_sec, disk_dir, max_disk_mb); None disables result caching
+            pipeline: enabled modules, retrieval top_k and short-circuit
+                rules; None runs every stage with top_k 5
+            inference_client: encode through the inference server
+                instead of loading the encoders in this process
+            compile_question_bank: rebuild a missing or stale question
+                bank artifact; False raises StaleQuestionBank instead
+        """
         # ------------------------------
-        # Data
+        # Models (only for active stages)
         # ------------------------------
-        self.data_loader = QuestionDataLoader(question_data_path)
-        self.questions = self.data_loader.load()
+        self.pipeline = pipeline or PipelineConfig()
+        self.active_stages = self.pipeline.active_stages(fusion_weights)
 
-        # ------------------------------
-        # Models
-        # ------------------------------
-        self.semantic_scorer = SBERTSemanticScorer()
-        self.concept_scorer = RegexConceptScorer()
-        self.retriever = FAISSRetriever(
-            index_path=faiss_index_path,
-            corpus=corpus_chunks
-        )
+        self.semantic_scorer = None
+        self.concept_scorer = None
+        self.retriever = None
+
+        if "semantic" in self.active_stages:
+            with MODEL_LOAD_SECONDS.time(model="sbert"):
+                self.semantic_scorer = (
+                    RemoteSemanticScorer(inference_client, self.pipeline.semantic_model)
+                    if inference_client is not None
+                    else SBERTSemanticScorer(self.pipeline.semantic_model)
+                )
+        if "keyword" in self.active_stages:
+            self.concept_scorer = RegexConceptScorer()
+        if "evidence" in self.active_stages:
+            with MODEL_LOAD_SECONDS.time(model="faiss_retriever"):
+                self.retriever = (
+                    RemoteRetriever(
+                        index_path=faiss_index_path,
+                        corpus=corpus_chunks,
+                        client=inference_client
+                    )
+                    if inference_client is not None
+                    else FAISSRetriever(
+                        index_path=faiss_index_path,
+                        corpus=corpus_chunks
+                    )
+                )
         self.fusion_engine = WeightedFusionEngine(fusion_weights)
 
         # Day-6: Delivery confidence (feedback-only)
         self.delivery_confidence_scorer = DeliveryConfidenceScorer()
 
         # ------------------------------
-        # Index questions by ID
+        # Stage execution
         # ------------------------------
-        self.question_map = {
-            q.question_id: q for q in self.questions
-        }
+        # The pool also backs evaluate_async in sequential mode
+        self.concurrent_stages = concurrent_stages
+        self.stage_pool = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="eval-stage"
+        )
+        self.stage_timeouts = dict(stage_timeouts or {})
+
+        # ------------------------------
+        # Data: compiled question bank (validated records, concept
+        # matchers, ideal-answer embeddings), rebuilt from the JSON
+        # when its hash changes
+        # ------------------------------
+        with MODEL_LOAD_SECONDS.time(model="question_bank"):
+            self.question_bank = load_question_bank(
+                question_data_path,
+                semantic_scorer=self.semantic_scorer,
+                concept_scorer=self.concept_scorer,
+                compile_stale=compile_question_bank
+            )
+        self.question_map = self.question_bank.question_map
+
+        # ------------------------------
+        # Result cache (invalidated by any fingerprint change)
+        # ------------------------------
+        self.result_cache = EvaluationResultCache(
+            fingerprint=self._fingerprint(
+                question_data_path,
+                faiss_index_path,
+                corpus_chunks,
+                fusion_weights
+            ),
+            **result_cache
+        ) if result_cache is not None else None
+
+    @property
+    def questions(self):
+        """
+        Every question (parses the whole bank; lookups by id should
+        use question_map, which parses on first use).
+        """
+        return self.question_bank.questions
 
     # --------------------------------------------------
     # PUBLIC API
@@ -58,82 +224,792 @@ class InterviewOrchestrator(InterviewOrchestratorInterface):
         self,
         question_id: str,
         student_answer: str,
-        top_k_evidence: int = 5,
-        audio_signal: Optional[Any] = None  # <-- Day-6 addition
+        top_k_evidence: Optional[int] = None,
+        audio_signal: Optional[Any] = None,  # <-- Day-6 addition
+        audio_features: Optional[FrameFeatures] = None,
+        audio_metrics: Optional[Dict[str, float]] = None,
+        assets: Optional[QuestionAssets] = None
+    ) -> Dict[str, Any]:
+
+        if top_k_evidence is None:
+            top_k_evidence = self.pipeline.top_k
+
+        cache_key = self._cache_key(
+            question_id, student_answer, top_k_evidence, audio_signal, audio_metrics, assets
+        )
+        cached = self._cached_result(cache_key, student_answer)
+        if cached is not None:
+            return cached
+
+        return self._evaluate_uncached(
+            cache_key,
+            question_id,
+            student_answer,
+            top_k_evidence,
+            audio_signal,
+            audio_features,
+            audio_metrics,
+            assets
+        )
+
+    async def evaluate_async(
+        self,
+        question_id: str,
+        student_answer: str,
+        top_k_evidence: Optional[int] = None,
+        audio_signal: Optional[Any] = None,
+        audio_features: Optional[FrameFeatures] = None,
+        audio_metrics: Optional[Dict[str, float]] = None,
+        assets: Optional[QuestionAssets] = None
     ) -> Dict[str, Any]:
+        """
+        Non-blocking evaluate(): model stages run on the stage
+        pool and are awaited, so a waiting request holds no thread.
+        In sequential mode the whole evaluation is one pool job.
+        Result cache lookups and stores (disk tier) also run on
+        the pool, never on the event loop.
+        """
+        loop = asyncio.get_running_loop()
+
+        if top_k_evidence is None:
+            top_k_evidence = self.pipeline.top_k
+
+        cache_key = self._cache_key(
+            question_id, student_answer, top_k_evidence, audio_signal, audio_metrics, assets
+        )
+        if cache_key is not None:
+            cached = await loop.run_in_executor(
+                self.stage_pool,
+                self._cached_result,
+                cache_key,
+                student_answer
+            )
+            if cached is not None:
+                return cached
 
+        if not self.concurrent_stages:
+            return await loop.run_in_executor(
+                self.stage_pool,
+                functools.partial(
+                    self._evaluate_uncached,
+                    cache_key,
+                    question_id,
+                    student_answer,
+                    top_k_evidence,
+                    audio_signal,
+                    audio_features,
+                    audio_metrics,
+                    assets
+                )
+            )
+
+        question, stages = self._plan_stages(
+            question_id,
+            student_answer,
+            top_k_evidence,
+            audio_signal,
+            audio_features,
+            audio_metrics,
+            assets
+        )
+
+        stage_started = time.perf_counter()
+        outputs, timings, timed_out = await self._run_stages_async(stages)
+        stages_elapsed = time.perf_counter() - stage_started
+
+        result = self._fuse(
+            question,
+            student_answer,
+            outputs,
+            timings,
+            timed_out,
+            stages_elapsed
+        )
+        if cache_key is None:
+            return result
+        return await loop.run_in_executor(self.stage_pool, self._store_result, cache_key, result)
+
+    def evaluate_many(
+        self,
+        items: List[Dict[str, str]],
+        top_k_evidence: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Batch evaluate() for text answers.
+
+        items: [{"question_id": ..., "student_answer": ...}]
+
+        Items are grouped by question and each stage runs once for
+        the whole batch: one semantic encode, concept patterns
+        compiled once per question, one retrieval encode + index
+        search, one fusion pass. Returns one entry per item, in
+        input order: an evaluate()-shaped result, or
+        {"error": message} for an item that could not be evaluated
+        (unknown question, or a stage that failed for its group).
+        Stage timeouts are not applied to batches.
+        """
+        results, batch = self._plan_batch(items, top_k_evidence)
+        if batch is None:
+            return results
+
+        outputs, _, _ = self._run_stages(batch.stages, timeouts={})
+        return self._fuse_batch(results, batch, outputs)
+
+    async def evaluate_many_async(
+        self,
+        items: List[Dict[str, str]],
+        top_k_evidence: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Non-blocking evaluate_many(), on the stage pool like
+        evaluate_async (planning and fusion included: both touch
+        the result cache).
+        """
+        loop = asyncio.get_running_loop()
+
+        if not self.concurrent_stages:
+            return await loop.run_in_executor(
+                self.stage_pool,
+                functools.partial(self.evaluate_many, items, top_k_evidence)
+            )
+
+        results, batch = await loop.run_in_executor(
+            self.stage_pool,
+            self._plan_batch,
+            items,
+            top_k_evidence
+        )
+        if batch is None:
+            return results
+
+        outputs, _, _ = await self._run_stages_async(batch.stages, timeouts={})
+        return await loop.run_in_executor(self.stage_pool, self._fuse_batch, results, batch, outputs)
+
+    def prefetch(self, question_id: str, pool_size: int = 50) -> QuestionAssets:
+        """
+        Gather what evaluate() needs for a question before its
+        answer arrives: the compiled concept matcher and the ideal
+        answer's embedding (from the question bank), and an
+        evidence candidate pool (the pool_size chunks nearest to
+        the question text), so evidence is ranked within the pool
+        instead of the full index.
+        """
         if question_id not in self.question_map:
             raise ValueError(f"Invalid question_id: {question_id}")
 
         question = self.question_map[question_id]
-        ideal_answer = question.ideal_answers[0]  # MVP: first ideal answer
+        assets = QuestionAssets(question_id=question_id)
+
+        if self.concept_scorer is not None:
+            assets.concept_patterns = self.question_bank.concept_patterns(question_id)
+        if self.semantic_scorer is not None:
+            assets.reference_embedding = self.question_bank.reference_embedding(question_id)
+        if self.retriever is not None:
+            assets.evidence_pool = self.retriever.candidate_pool(
+                question.question_text,
+                pool_size
+            )
 
-        # 1️⃣ Semantic Scoring
-        semantic_score = self.semantic_scorer.score(
+        return assets
+
+    def close(self):
+        """
+        Release the stage thread pool.
+        """
+        self.stage_pool.shutdown(wait=False)
+
+    # --------------------------------------------------
+    # INTERNALS
+    # --------------------------------------------------
+    def _evaluate_uncached(
+        self,
+        cache_key: Optional[str],
+        question_id: str,
+        student_answer: str,
+        top_k_evidence: int,
+        audio_signal: Optional[Any],
+        audio_features: Optional[FrameFeatures],
+        audio_metrics: Optional[Dict[str, float]],
+        assets: Optional[QuestionAssets]
+    ) -> Dict[str, Any]:
+        """
+        evaluate() after its cache lookup missed.
+        """
+        question, stages = self._plan_stages(
+            question_id,
             student_answer,
-            ideal_answer.text
+            top_k_evidence,
+            audio_signal,
+            audio_features,
+            audio_metrics,
+            assets
+        )
+
+        stage_started = time.perf_counter()
+        outputs, timings, timed_out = self._run_stages(stages)
+        stages_elapsed = time.perf_counter() - stage_started
+
+        return self._store_result(cache_key, self._fuse(
+            question,
+            student_answer,
+            outputs,
+            timings,
+            timed_out,
+            stages_elapsed
+        ))
+
+    def _plan_batch(
+        self,
+        items: List[Dict[str, str]],
+        top_k_evidence: Optional[int]
+    ) -> Tuple[List[Optional[Dict[str, Any]]], Optional["_BatchPlan"]]:
+        """
+        Per-item results known up front (errors, cache hits) and
+        the batch stages for the rest; no plan if nothing is left.
+        """
+        if top_k_evidence is None:
+            top_k_evidence = self.pipeline.top_k
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(items)
+        cache_keys: Dict[int, Optional[str]] = {}
+        groups: Dict[str, List[int]] = {}
+
+        for i, item in enumerate(items):
+            question_id = item.get("question_id")
+            if question_id not in self.question_map:
+                results[i] = {"error": f"Invalid question_id: {question_id}"}
+                continue
+
+            cache_keys[i] = self._cache_key(
+                question_id, item["student_answer"], top_k_evidence, None, None, None
+            )
+            results[i] = self._cached_result(cache_keys[i], item["student_answer"])
+            if results[i] is None:
+                groups.setdefault(question_id, []).append(i)
+
+        valid = [i for indices in groups.values() for i in indices]
+        if not valid:
+            return results, None
+
+        def answer(i):
+            return items[i]["student_answer"]
+
+        def question(i):
+            return self.question_map[items[i]["question_id"]]
+
+        # Short answers skip semantic scoring and retrieval
+        long_answers = [i for i in valid if not self.pipeline.is_short(answer(i))]
+        stage_items = {
+            "semantic": long_answers,
+            "keyword": valid,
+            "evidence": long_answers
+        }
+
+        def semantic_stage():
+            # The question bank's ideal-answer embeddings, as in
+            # evaluate(), so batch and single scores match
+            references = [
+                self.question_bank.reference_embedding(items[i]["question_id"])
+                for i in long_answers
+            ]
+            if all(reference is not None for reference in references):
+                scores = self.semantic_scorer.score_many_with_reference(
+                    [answer(i) for i in long_answers],
+                    references
+                )
+            else:
+                scores = self.semantic_scorer.score_many([
+                    (answer(i), question(i).ideal_answers[0].text) for i in long_answers
+                ])
+            return dict(zip(long_answers, scores))
+
+        def keyword_stage():
+            scores = {}
+            for question_id, indices in groups.items():
+                key_concepts = [
+                    kc.concept
+                    for kc in self.question_map[question_id].ideal_answers[0].key_concepts
+                ]
+                group_scores = self.concept_scorer.score_many(
+                    [answer(i) for i in indices],
+                    key_concepts
+                )
+                scores.update(zip(indices, group_scores))
+            return scores
+
+        stages = {
+            "semantic": semantic_stage,
+            "keyword": keyword_stage,
+            "evidence": lambda: dict(zip(long_answers, self.retriever.retrieve_many(
+                [question(i).question_text + " " + answer(i) for i in long_answers],
+                top_k=top_k_evidence
+            )))
+        }
+
+        # A failing stage fails only the items it covers
+        def contained(fn):
+            def run():
+                try:
+                    return fn()
+                except Exception as e:
+                    return e
+            return run
+
+        stages = {
+            name: contained(fn) for name, fn in stages.items()
+            if name in self.active_stages and stage_items[name]
+        }
+
+        return results, _BatchPlan(
+            items=items,
+            valid=valid,
+            cache_keys=cache_keys,
+            stage_items=stage_items,
+            stages=stages
         )
 
-        # 2️⃣ Keyword / Concept Scoring
+    def _fuse_batch(
+        self,
+        results: List[Optional[Dict[str, Any]]],
+        batch: "_BatchPlan",
+        outputs: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        failed: Dict[int, str] = {}
+        for name, output in outputs.items():
+            if isinstance(output, Exception):
+                outputs[name] = {}
+                for i in batch.stage_items[name]:
+                    failed.setdefault(i, f"Stage '{name}' failed: {output}")
+
+        semantic = outputs.get("semantic", {})
+        keyword = outputs.get("keyword", {})
+        evidence = outputs.get("evidence", {})
+
+        for i in failed:
+            results[i] = {"error": failed[i]}
+        valid = [i for i in batch.valid if i not in failed]
+
+        scores = [
+            self._text_scores(semantic.get(i), keyword.get(i), evidence.get(i))
+            for i in valid
+        ]
+        fused_results = self.fusion_engine.fuse_many(scores)
+
+        for i, item_scores, fused_result in zip(valid, scores, fused_results):
+            item = batch.items[i]
+            results[i] = self._store_result(batch.cache_keys[i], self._base_response(
+                self.question_map[item["question_id"]],
+                item["student_answer"],
+                item_scores,
+                fused_result,
+                evidence.get(i) or [],
+                skipped_stages=[
+                    name for name, indices in batch.stage_items.items()
+                    if name not in batch.stages or i not in indices
+                ]
+            ))
+
+        return results
+
+    def _plan_stages(
+        self,
+        question_id: str,
+        student_answer: str,
+        top_k_evidence: int,
+        audio_signal: Optional[Any],
+        audio_features: Optional[FrameFeatures],
+        audio_metrics: Optional[Dict[str, float]],
+        assets: Optional[QuestionAssets] = None
+    ) -> Tuple[Any, Dict[str, Callable[[], Any]]]:
+        """
+        Resolve the question and build the active stages that are
+        independent until fusion; skipped stages are left out.
+        """
+        if question_id not in self.question_map:
+            raise ValueError(f"Invalid question_id: {question_id}")
+
+        question = self.question_map[question_id]
+        ideal_answer = question.ideal_answers[0]  # MVP: first ideal answer
+
         key_concepts = [
             kc.concept for kc in ideal_answer.key_concepts
         ]
-        keyword_score = self.concept_scorer.score(
+
+        stages = {
+            # 1️⃣ Semantic Scoring
+            "semantic": lambda: self.semantic_scorer.score(
+                student_answer,
+                ideal_answer.text
+            ),
+            # 2️⃣ Keyword / Concept Scoring
+            "keyword": lambda: self.concept_scorer.score(
+                student_answer,
+                key_concepts
+            ),
+            # 3️⃣ Evidence Retrieval (RAG)
+            "evidence": lambda: self.retriever.retrieve(
+                query=question.question_text + " " + student_answer,
+                top_k=top_k_evidence
+            )
+        }
+
+        # Compiled matchers and ideal-answer embeddings come from the
+        # question bank; prefetched assets may add an evidence pool
+        if assets is None:
+            assets = QuestionAssets(
+                question_id=question_id,
+                concept_patterns=(
+                    self.question_bank.concept_patterns(question_id)
+                    if self.concept_scorer is not None else None
+                ),
+                reference_embedding=(
+                    self.question_bank.reference_embedding(question_id)
+                    if self.semantic_scorer is not None else None
+                )
+            )
+
+        # Precomputed assets replace the per-answer work they cover
+        if assets.reference_embedding is not None:
+            stages["semantic"] = lambda: self.semantic_scorer.score_with_reference(
+                student_answer,
+                assets.reference_embedding
+            )
+        if assets.concept_patterns is not None:
+            stages["keyword"] = lambda: self.concept_scorer.score_compiled(
+                student_answer,
+                assets.concept_patterns
+            )
+        if assets.evidence_pool is not None:
+            stages["evidence"] = lambda: self.retriever.retrieve_from_pool(
+                question.question_text + " " + student_answer,
+                assets.evidence_pool,
+                top_k=top_k_evidence
+            )
+
+        # Disabled / zero-weight stages never run; short answers
+        # skip the expensive ones and score 0 there
+        skipped = set(SHORT_ANSWER_SKIPS) if self.pipeline.is_short(student_answer) else set()
+        stages = {
+            name: fn for name, fn in stages.items()
+            if name in self.active_stages and name not in skipped
+        }
+
+        # Day-6: Audio delivery feedback (OPTIONAL, SAFE)
+        # audio_metrics: precomputed (e.g. cached) delivery metrics
+        if audio_signal is not None or audio_metrics is not None:
+            stages["delivery"] = lambda: self._delivery_feedback(
+                student_answer,
+                audio_signal,
+                audio_features,
+                audio_metrics
+            )
+
+        return question, stages
+
+    def _fuse(
+        self,
+        question: Any,
+        student_answer: str,
+        outputs: Dict[str, Any],
+        timings: Dict[str, float],
+        timed_out: List[str],
+        stages_elapsed: float
+    ) -> Dict[str, Any]:
+        retrieved_docs = outputs.get("evidence") or []
+
+        # 4️⃣ Fusion (TEXT-BASED ONLY)
+        fusion_started = time.perf_counter()
+        scores = self._text_scores(
+            outputs.get("semantic"),
+            outputs.get("keyword"),
+            retrieved_docs
+        )
+
+        fused_result = self.fusion_engine.fuse(scores)
+        timings["fusion"] = time.perf_counter() - fusion_started
+
+        # Wall time from stage start to fused score: the slowest
+        # stage when concurrent, the sum when sequential
+        timings["critical_path"] = stages_elapsed + timings["fusion"]
+
+        for name, seconds in timings.items():
+            if name != "critical_path":
+                STAGE_SECONDS.observe(seconds, stage=name)
+        EVALUATION_SECONDS.observe(timings["critical_path"])
+
+        response = self._base_response(
+            question,
             student_answer,
-            key_concepts
+            scores,
+            fused_result,
+            retrieved_docs,
+            skipped_stages=[name for name in TEXT_STAGES if name not in outputs]
         )
+        response["stage_timings_ms"] = {
+            name: round(1000 * seconds, 2) for name, seconds in timings.items()
+        }
+        response["timed_out_stages"] = timed_out
+
+        if outputs.get("delivery") is not None:
+            response["audio_feedback"] = outputs["delivery"]
+
+        return response
+
+    def _fingerprint(
+        self,
+        question_data_path: str,
+        faiss_index_path: str,
+        corpus_chunks: list,
+        fusion_weights: Dict[str, float]
+    ) -> Dict[str, Any]:
+        """
+        Everything that can change a result for the same answer.
+        """
+        return {
+            "semantic_model": self.semantic_scorer and self.semantic_scorer.model_name,
+            "retriever_model": self.retriever and self.retriever.model_name,
+            "faiss_index": file_digest(faiss_index_path) if self.retriever else None,
+            "corpus": hashlib.sha256(
+                json.dumps(corpus_chunks, sort_keys=True).encode("utf-8")
+            ).hexdigest(),
+            "question_bank": self.question_bank.source_sha256,
+            "fusion_weights": fusion_weights,
+            "active_stages": self.active_stages,
+            "min_answer_words": self.pipeline.min_answer_words
+        }
 
-        # 3️⃣ Evidence Retrieval (RAG)
-        retrieved_docs = self.retriever.retrieve(
-            query=question.question_text + " " + student_answer,
-            top_k=top_k_evidence
+    def _cache_key(
+        self,
+        question_id: str,
+        student_answer: str,
+        top_k_evidence: int,
+        audio_signal: Optional[Any],
+        audio_metrics: Optional[Dict[str, float]],
+        assets: Optional[QuestionAssets]
+    ) -> Optional[str]:
+        # Raw audio is not hashed; precomputed metrics are part of the key
+        if self.result_cache is None or audio_signal is not None:
+            return None
+
+        return self.result_cache.key(
+            question_id,
+            student_answer,
+            top_k_evidence=top_k_evidence,
+            audio_metrics=audio_metrics,
+            # Pool-ranked evidence may differ from a full-index search
+            evidence_pool=assets is not None and assets.evidence_pool is not None
         )
 
+    def _cached_result(self, cache_key: Optional[str], student_answer: str) -> Optional[Dict[str, Any]]:
+        if cache_key is None:
+            return None
+
+        started = time.perf_counter()
+        result = self.result_cache.get(cache_key)
+        if result is None:
+            return None
+
+        # Answers are not stored in the cache
+        result["student_answer"] = student_answer
+        result["stage_timings_ms"] = {
+            "cache_lookup": round(1000 * (time.perf_counter() - started), 2)
+        }
+        result["timed_out_stages"] = []
+        return result
+
+    def _store_result(self, cache_key: Optional[str], result: Dict[str, Any]) -> Dict[str, Any]:
+        # Degraded (timed-out) results are never cached
+        if cache_key is not None and not result.get("timed_out_stages"):
+            self.result_cache.put(cache_key, result)
+        return result
+
+    @staticmethod
+    def _text_scores(
+        semantic_score: Optional[float],
+        keyword_score: Optional[float],
+        retrieved_docs: Optional[list]
+    ) -> Dict[str, float]:
+        """
+        Fusion inputs; a stage that did not run scores 0.
+        """
         evidence_score = 0.0
         if retrieved_docs:
             evidence_score = 0.5  # MVP heuristic
 
-
-        # 4️⃣ Fusion (TEXT-BASED ONLY)
-        scores = {
-            "semantic": semantic_score,
-            "keyword": keyword_score,
+        return {
+            "semantic": semantic_score or 0.0,
+            "keyword": keyword_score or 0.0,
             "evidence": evidence_score
         }
 
-        fused_result = self.fusion_engine.fuse(scores)
-
+    @staticmethod
+    def _base_response(
+        question: Any,
+        student_answer: str,
+        scores: Dict[str, float],
+        fused_result: Dict[str, Any],
+        retrieved_docs: list,
+        skipped_stages: List[str]
+    ) -> Dict[str, Any]:
         # ------------------------------
         # Base response (text-only safe)
         # ------------------------------
-        response = {
-            "question_id": question_id,
+        return {
+            "question_id": question.question_id,
             "question": question.question_text,
             "student_answer": student_answer,
             "final_score": fused_result["final_score"],
             "verdict": fused_result["verdict"],
             "score_breakdown": scores,
-            "evidence_snippets": retrieved_docs[:3]  # limit output
+            "evidence_snippets": retrieved_docs[:3],  # limit output
+            "skipped_stages": skipped_stages
         }
 
-        # --------------------------------------------------
-        # Day-6: Audio delivery feedback (OPTIONAL, SAFE)
-        # --------------------------------------------------
-        if audio_signal is not None:
+    def _delivery_feedback(
+        self,
+        student_answer: str,
+        audio_signal: Optional[Any],
+        audio_features: Optional[FrameFeatures],
+        audio_metrics: Optional[Dict[str, float]]
+    ) -> Dict[str, Any]:
+        if audio_metrics is None:
             audio_metrics = analyze_audio_delivery(
                 audio_signal,
-                transcript=student_answer
+                transcript=student_answer,
+                features=audio_features
             )
 
-            delivery_feedback = self.delivery_confidence_scorer.score(
-                audio_metrics
-            )
+        delivery_feedback = self.delivery_confidence_scorer.score(
+            audio_metrics
+        )
 
-            response["audio_feedback"] = {
-                "delivery_stability_score": delivery_feedback["delivery_stability_score"],
-                "feedback": delivery_feedback["feedback"],
-                "bonus_eligible": delivery_feedback["bonus_eligible"],
-                "suggested_bonus": delivery_feedback["suggested_bonus"]
-            }
+        return {
+            "delivery_stability_score": delivery_feedback["delivery_stability_score"],
+            "feedback": delivery_feedback["feedback"],
+            "bonus_eligible": delivery_feedback["bonus_eligible"],
+            "suggested_bonus": delivery_feedback["suggested_bonus"]
+        }
 
-        return response
+    def _run_stages(
+        self,
+        stages: Dict[str, Callable[[], Any]],
+        timeouts: Optional[Dict[str, float]] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, float], List[str]]:
+        """
+        Run stages one after another, or concurrently on the
+        shared stage pool.
+
+        Returns (outputs, per-stage seconds, timed-out stages).
+        A timed-out optional stage yields None; a timed-out
+        required stage raises StageTimeout. Timeouts are only
+        enforced in concurrent mode and count from when a stage
+        starts executing, so time queued behind other requests
+        never times a stage out; a stage that overruns keeps its
+        pool thread until it finishes.
+
+        timeouts: overrides stage_timeouts (e.g. {} for batches)
+        """
+        if timeouts is None:
+            timeouts = self.stage_timeouts
+
+        outputs = {}
+        timings = {}
+        timed_out = []
+
+        if not self.concurrent_stages:
+            for name, fn in stages.items():
+                run = _StageRun(fn)
+                outputs[name] = run()
+                timings[name] = run.elapsed
+            return outputs, timings, timed_out
+
+        runs = {name: _StageRun(fn) for name, fn in stages.items()}
+        futures = {}
+        for name, run in runs.items():
+            futures[name] = self.stage_pool.submit(run)
+            # A cancelled or failed submission never starts
+            futures[name].add_done_callback(lambda _, run=run: run.started.set())
+
+        # Join in deadline order so each timeout fires on time
+        by_deadline = sorted(
+            futures,
+            key=lambda name: timeouts.get(name, float("inf"))
+        )
+
+        for name in by_deadline:
+            run, future = runs[name], futures[name]
+            timeout = timeouts.get(name)
+            remaining = None
+            if timeout is not None:
+                run.started.wait()
+                remaining = run.remaining(timeout)
+
+            try:
+                outputs[name] = future.result(timeout=remaining)
+                timings[name] = run.elapsed
+            except FutureTimeout:
+                future.cancel()
+                if name not in OPTIONAL_STAGES:
+                    raise StageTimeout(
+                        f"Stage '{name}' exceeded its {timeout:g}s timeout"
+                    )
+                outputs[name] = None
+                timings[name] = run.running_for()
+                timed_out.append(name)
+
+        return outputs, timings, timed_out
+
+    async def _run_stages_async(
+        self,
+        stages: Dict[str, Callable[[], Any]],
+        timeouts: Optional[Dict[str, float]] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, float], List[str]]:
+        """
+        Async counterpart of _run_stages (concurrent mode): each
+        stage is awaited on the stage pool; its timeout starts
+        when the stage starts executing, as in _run_stages.
+        """
+        if timeouts is None:
+            timeouts = self.stage_timeouts
+
+        loop = asyncio.get_running_loop()
+        outputs = {}
+        timings = {}
+        timed_out = []
+
+        async def run_stage(name, fn):
+            timeout = timeouts.get(name)
+            started = asyncio.Event()
+
+            def mark_started(*_):
+                try:
+                    loop.call_soon_threadsafe(started.set)
+                except RuntimeError:
+                    pass  # loop closed
+
+            run = _StageRun(fn, on_start=mark_started)
+            future = self.stage_pool.submit(run)
+            future.add_done_callback(mark_started)
+            result = asyncio.wrap_future(future)
+
+            if timeout is None:
+                outputs[name] = await result
+                timings[name] = run.elapsed
+                return
+
+            await started.wait()
+            try:
+                outputs[name] = await asyncio.wait_for(result, run.remaining(timeout))
+                timings[name] = run.elapsed
+            except asyncio.TimeoutError:
+                if name not in OPTIONAL_STAGES:
+                    raise StageTimeout(
+                        f"Stage '{name}' exceeded its {timeout:g}s timeout"
+                    )
+                outputs[name] = None
+                timings[name] = run.running_for()
+                timed_out.append(name)
+
+        await asyncio.gather(*(run_stage(name, fn) for name, fn in stages.items()))
+
+        return outputs, timings, timed_out
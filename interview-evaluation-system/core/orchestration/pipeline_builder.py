@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+import yaml
+
+from core.interfaces.config import ConfigInterface
+
+# Stages the orchestrator can run before fusion
+TEXT_STAGES = ("semantic", "keyword", "evidence")
+
+# Stages skipped for answers below min_answer_words
+SHORT_ANSWER_SKIPS = ("semantic", "evidence")
+
+
+@dataclass
+class PipelineConfig(ConfigInterface):
+    """
+    Which modules run, read from config/text_only.yaml or
+    config/multimodal_stub.yaml.
+    """
+
+    mode: str = "text_only"
+    dsp_enabled: bool = False
+    asr_enabled: bool = False
+    semantic_enabled: bool = True
+    semantic_model: str = "all-MiniLM-L6-v2"
+    concept_enabled: bool = True
+    retriever_enabled: bool = True
+    top_k: int = 5
+    min_answer_words: int = 0
+
+    @classmethod
+    def from_dict(cls, cfg: Dict[str, Any]) -> "PipelineConfig":
+        modules = cfg.get("modules", {})
+        short_circuit = cfg.get("short_circuit", {})
+
+        def enabled(name: str, default: bool) -> bool:
+            return bool(modules.get(name, {}).get("enabled", default))
+
+        return cls(
+            mode=cfg.get("execution", {}).get("mode", "text_only"),
+            dsp_enabled=enabled("dsp", False),
+            asr_enabled=enabled("asr", False),
+            semantic_enabled=enabled("semantic_scorer", True),
+            semantic_model=modules.get("semantic_scorer", {}).get("model", cls.semantic_model),
+            concept_enabled=enabled("concept_scorer", True),
+            retriever_enabled=enabled("retriever", True),
+            top_k=int(modules.get("retriever", {}).get("top_k", cls.top_k)),
+            min_answer_words=int(short_circuit.get("min_answer_words", 0))
+        )
+
+    def get_mode(self) -> str:
+        return self.mode
+
+    def active_stages(self, fusion_weights: Dict[str, float]) -> List[str]:
+        """
+        Text stages to build: enabled in config and with a
+        non-zero fusion weight (a zero-weight score cannot change
+        the result, so its model is never loaded).
+        """
+        enabled = {
+            "semantic": self.semantic_enabled,
+            "keyword": self.concept_enabled,
+            "evidence": self.retriever_enabled
+        }
+        return [
+            stage for stage in TEXT_STAGES
+            if enabled[stage] and fusion_weights.get(stage, 0.0) > 0.0
+        ]
+
+    def is_short(self, student_answer: str) -> bool:
+        return len(student_answer.split()) < self.min_answer_words
+
+
+def load_pipeline_config(path: str) -> PipelineConfig:
+    with open(path, "r") as f:
+        return PipelineConfig.from_dict(yaml.safe_load(f) or {})
@@ -0,0 +1,217 @@
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from core.orchestration.interview_orchestrator import InterviewOrchestrator
+
+
+@dataclass
+class InterviewSession:
+    """
+    One candidate's multi-question interview.
+    """
+    session_id: str
+    candidate_id: Optional[str]
+    created_at: float
+    last_access: float
+    served: List[str] = field(default_factory=list)
+    results: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+
+class SessionManager:
+    """
+    Tracks interviews across questions.
+
+    Serving a question starts a background prefetch of its assets
+    (compiled concept matcher, ideal-answer embedding, evidence
+    candidate pool) on the orchestrator's stage pool, so they are
+    ready when the answer arrives. Assets are per question, not
+    per session, and are shared by every interview that serves
+    the question.
+
+    Memory is bounded on both sides: sessions are an LRU capped
+    at max_sessions and expire ttl_sec after their last access;
+    question assets are an LRU capped at max_question_assets.
+    """
+
+    def __init__(
+        self,
+        orchestrator: InterviewOrchestrator,
+        max_sessions: int = 10000,
+        ttl_sec: float = 7200.0,
+        max_question_assets: int = 512,
+        evidence_pool_size: int = 50
+    ):
+        self.orchestrator = orchestrator
+        self.max_sessions = max_sessions
+        self.ttl_sec = ttl_sec
+        self.max_question_assets = max_question_assets
+        self.evidence_pool_size = evidence_pool_size
+
+        self._sessions: "OrderedDict[str, InterviewSession]" = OrderedDict()
+        self._assets: "OrderedDict[str, Future]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._evicted = 0
+        self._expired = 0
+
+    # --------------------------------------------------
+    # SESSIONS
+    # --------------------------------------------------
+    def create(self, candidate_id: Optional[str] = None) -> InterviewSession:
+        now = time.time()
+        session = InterviewSession(
+            session_id=uuid.uuid4().hex,
+            candidate_id=candidate_id,
+            created_at=now,
+            last_access=now
+        )
+
+        with self._lock:
+            self._expire(now)
+            self._sessions[session.session_id] = session
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+                self._evicted += 1
+
+        return session
+
+    def get(self, session_id: str) -> InterviewSession:
+        """
+        Look up a live session and refresh its TTL.
+        Raises KeyError if it does not exist or has expired.
+        """
+        now = time.time()
+
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                raise KeyError(f"Unknown or expired session: {session_id}")
+            if now - session.last_access > self.ttl_sec:
+                del self._sessions[session_id]
+                self._expired += 1
+                raise KeyError(f"Unknown or expired session: {session_id}")
+
+            session.last_access = now
+            self._sessions.move_to_end(session_id)
+            return session
+
+    def close(self, session_id: str) -> InterviewSession:
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is None:
+            raise KeyError(f"Unknown or expired session: {session_id}")
+        return session
+
+    # --------------------------------------------------
+    # QUESTIONS
+    # --------------------------------------------------
+    def serve_question(self, session_id: str, question_id: str) -> InterviewSession:
+        """
+        Mark a question as served and start prefetching its assets.
+        """
+        if question_id not in self.orchestrator.question_map:
+            raise ValueError(f"Invalid question_id: {question_id}")
+
+        session = self.get(session_id)
+        with self._lock:
+            if question_id not in session.served:
+                session.served.append(question_id)
+
+        self.assets(question_id)
+        return session
+
+    def assets(self, question_id: str) -> Future:
+        """
+        Future of the question's QuestionAssets; submitted on first
+        use, shared afterwards. A failed prefetch is dropped so the
+        next call retries.
+        """
+        with self._lock:
+            future = self._assets.get(question_id)
+            if future is not None and not (future.done() and future.exception() is not None):
+                self._assets.move_to_end(question_id)
+                return future
+
+            future = self.orchestrator.stage_pool.submit(
+                self.orchestrator.prefetch,
+                question_id,
+                self.evidence_pool_size
+            )
+            self._assets[question_id] = future
+            while len(self._assets) > self.max_question_assets:
+                self._assets.popitem(last=False)
+
+        return future
+
+    # --------------------------------------------------
+    # RESULTS
+    # --------------------------------------------------
+    def record(self, session_id: str, result: Dict[str, Any]) -> InterviewSession:
+        """
+        Store an answer's result; a re-answered question replaces
+        its previous result.
+        """
+        session = self.get(session_id)
+        with self._lock:
+            session.results[result["question_id"]] = result
+            if result["question_id"] not in session.served:
+                session.served.append(result["question_id"])
+        return session
+
+    def report(self, session_id: str) -> Dict[str, Any]:
+        session = self.get(session_id)
+
+        with self._lock:
+            results = [
+                session.results[qid] for qid in session.served
+                if qid in session.results
+            ]
+            served = list(session.served)
+
+        verdicts: Dict[str, int] = {}
+        for result in results:
+            verdicts[result["verdict"]] = verdicts.get(result["verdict"], 0) + 1
+
+        return {
+            "session_id": session.session_id,
+            "candidate_id": session.candidate_id,
+            "created_at": session.created_at,
+            "questions_served": len(served),
+            "questions_answered": len(results),
+            "unanswered": [qid for qid in served if qid not in session.results],
+            "average_score": (
+                round(sum(r["final_score"] for r in results) / len(results), 4)
+                if results else 0.0
+            ),
+            "verdict_counts": verdicts,
+            "results": results
+        }
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "sessions": len(self._sessions),
+                "question_assets": len(self._assets),
+                "evicted": self._evicted,
+                "expired": self._expired
+            }
+
+    # --------------------------------------------------
+    # INTERNALS
+    # --------------------------------------------------
+    def _expire(self, now: float):
+        """
+        Drop expired sessions from the LRU end (caller holds the lock).
+        Least recently used sessions are also the oldest accessed,
+        so the scan stops at the first live one.
+        """
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if now - session.last_access <= self.ttl_sec:
+                break
+            del self._sessions[session_id]
+            self._expired += 1
@@ -0,0 +1,161 @@
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Optional
+
+# Bump when the cached entry layout changes
+CACHE_SCHEMA_VERSION = 1
+
+
+class AudioResultCache:
+    """
+    Content-addressed, size-bounded disk cache for the audio stages.
+
+    Entries hold the transcript, voiced segments and delivery
+    metrics of one recording, keyed by the SHA-256 of the raw
+    upload bytes plus a fingerprint of the DSP/ASR configuration,
+    so byte-identical audio skips DSP and ASR entirely. The ASR
+    profile an entry was decoded with is stored in it; callers
+    reject entries decoded below the profile they would pick now
+    (see transcript_reusable). Least
+    recently used entries (by file mtime) are evicted once the
+    directory exceeds max_bytes.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int, config_fingerprint: Dict[str, Any]):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+        self._config_key = json.dumps(
+            {"schema": CACHE_SCHEMA_VERSION, **config_fingerprint},
+            sort_keys=True
+        )
+
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._size = sum(p.stat().st_size for p in self.cache_dir.glob("*/*.json"))
+
+    # --------------------------------------------------
+    # KEYS
+    # --------------------------------------------------
+    @staticmethod
+    def hash_stream(stream: BinaryIO, chunk_size: int = 1 << 20) -> str:
+        """
+        SHA-256 of a seekable stream; leaves it rewound.
+        """
+        digest = hashlib.sha256()
+        stream.seek(0)
+        for chunk in iter(lambda: stream.read(chunk_size), b""):
+            digest.update(chunk)
+        stream.seek(0)
+        return digest.hexdigest()
+
+    def key(self, content_hash: str) -> str:
+        return hashlib.sha256(
+            (content_hash + self._config_key).encode("utf-8")
+        ).hexdigest()
+
+    # --------------------------------------------------
+    # PUBLIC API
+    # --------------------------------------------------
+    def get(
+        self,
+        key: str,
+        accept: Optional[Callable[[Dict[str, Any]], bool]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        accept: entries it returns False for count as misses
+        """
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            entry = None
+
+        if entry is None or (accept is not None and not accept(entry)):
+            with self._lock:
+                self._misses += 1
+            return None
+
+        try:
+            os.utime(path)  # mark as recently used
+        except FileNotFoundError:
+            pass
+
+        with self._lock:
+            self._hits += 1
+        return entry
+
+    def put(self, key: str, entry: Dict[str, Any]):
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+
+        data = json.dumps(entry).encode("utf-8")
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+
+        previous = path.stat().st_size if path.exists() else 0
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._size += len(data) - previous
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+                "bytes": self._size,
+                "max_bytes": self.max_bytes
+            }
+
+    # --------------------------------------------------
+    # INTERNALS
+    # --------------------------------------------------
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _evict(self):
+        """
+        Drop least recently used entries down to 90% of the budget.
+        Called with the lock held.
+        """
+        entries = []
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        entries.sort()
+        self._size = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+
+        for _, size, path in entries:
+            if self._size <= target:
+                break
+            try:
+                path.unlink()
+                self._size -= size
+            except FileNotFoundError:
+                pass
+
+
+def transcript_reusable(cached_profile: str, selected_profile: str, fast_profile: str) -> bool:
+    """
+    A cached transcript stands in for a new decode if it used the
+    profile selected now, or if load or length degraded the
+    selection to the fast profile (anything cached is as good).
+    """
+    return cached_profile == selected_profile or selected_profile == fast_profile
@@ -1,6 +1,6 @@
 import numpy as np
-import librosa
-from typing import Dict
+from dataclasses import dataclass, replace
+from typing import Dict, List, Optional, Tuple
 
 
 # ============================================================
@@ -8,44 +8,325 @@ from typing import Dict
 # India-calibrated, non-punitive
 # ============================================================
 
+SAMPLE_RATE = 16000
 FRAME_LENGTH = int(0.025 * 16000)  # 25 ms
 HOP_LENGTH = int(0.010 * 16000)    # 10 ms
+SILENCE_TOP_DB = 20.0
+
+# Voice-activity framing (librosa.effects.split / trim defaults)
+VAD_FRAME_LENGTH = 2048
+VAD_HOP_LENGTH = 512
+
+# Absolute floor (~ -60 dBFS) for mid-stream voicing decisions,
+# before a loud reference frame has been seen
+STREAM_MIN_VOICED_RMS = 1e-3
+
+
+# ------------------------------------------------------------
+# Shared frame features (computed once per audio)
+# ------------------------------------------------------------
+
+@dataclass
+class FrameFeatures:
+    """
+    Frame-level energy features shared by trimming and
+    every delivery metric, so the signal is scanned once.
+    """
+    rms: np.ndarray          # RMS per 25 ms frame (10 ms hop)
+    db: np.ndarray           # voice-activity frame dB, relative to the loudest frame
+    intervals: np.ndarray    # (n, 2) voiced [start, end) sample intervals
+    num_samples: int
+    sample_rate: int = SAMPLE_RATE
+
+    @property
+    def duration(self) -> float:
+        return self.num_samples / self.sample_rate
+
+    @property
+    def speech_duration(self) -> float:
+        if self.intervals.size == 0:
+            return 0.0
+        speech = np.sum(self.intervals[:, 1] - self.intervals[:, 0])
+        return float(speech) / self.sample_rate
+
+    def trim_bounds(self) -> Tuple[int, int]:
+        """
+        Sample range from the first to the last voiced frame.
+        """
+        if self.intervals.size == 0:
+            return 0, self.num_samples
+        return int(self.intervals[0, 0]), int(self.intervals[-1, 1])
+
+    def slice(self, start: int, end: int) -> "FrameFeatures":
+        """
+        Features of audio[start:end], keeping the frames
+        centered inside the range.
+        """
+        intervals = np.clip(self.intervals - start, 0, end - start)
+        intervals = intervals[intervals[:, 1] > intervals[:, 0]]
+
+        return replace(
+            self,
+            rms=self.rms[-(-start // HOP_LENGTH):-(-end // HOP_LENGTH)],
+            db=self.db[-(-start // VAD_HOP_LENGTH):-(-end // VAD_HOP_LENGTH)],
+            intervals=intervals,
+            num_samples=end - start
+        )
+
+    def scaled(self, gain: float) -> "FrameFeatures":
+        """
+        Features of audio * gain (dB is relative, so unchanged).
+        """
+        return replace(self, rms=self.rms * gain)
+
+
+def _cumulative_energy(audio: np.ndarray) -> np.ndarray:
+    return np.concatenate(([0.0], np.cumsum(np.square(audio, dtype=np.float64))))
+
+
+def _centered_rms(
+    energy: np.ndarray,
+    num_samples: int,
+    frame_length: int,
+    hop_length: int
+) -> np.ndarray:
+    """
+    Centered, zero-padded frame RMS (librosa.feature.rms semantics)
+    read off a running sum of squares.
+    """
+    centers = np.arange(1 + num_samples // hop_length) * hop_length
+    lo = np.clip(centers - frame_length // 2, 0, num_samples)
+    hi = np.clip(centers - frame_length // 2 + frame_length, 0, num_samples)
+
+    mean_square = (energy[hi] - energy[lo]) / frame_length
+    return np.sqrt(np.maximum(mean_square, 0.0)).astype(np.float32)
+
+
+def voiced_intervals(db: np.ndarray, num_samples: int, top_db: float) -> np.ndarray:
+    """
+    Runs of voice-activity frames above -top_db as sample intervals
+    (librosa.effects.split semantics).
+    """
+    voiced = (db > -top_db).astype(np.int8)
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], voiced, [0]))))
+
+    edges = np.minimum(edges * VAD_HOP_LENGTH, num_samples)
+    return edges.reshape(-1, 2).astype(np.int64)
+
+
+def compute_frame_features(
+    audio: np.ndarray,
+    top_db: float = SILENCE_TOP_DB
+) -> FrameFeatures:
+    energy = _cumulative_energy(audio)
+
+    rms = _centered_rms(energy, len(audio), FRAME_LENGTH, HOP_LENGTH)
+    vad_rms = _centered_rms(energy, len(audio), VAD_FRAME_LENGTH, VAD_HOP_LENGTH)
+
+    # amplitude_to_db(ref=np.max), amin = 1e-5
+    ref = max(float(vad_rms.max()), 1e-5)
+    db = 20.0 * np.log10(np.maximum(vad_rms, 1e-5) / ref)
+
+    return FrameFeatures(
+        rms=rms,
+        db=db,
+        intervals=voiced_intervals(db, len(audio), top_db),
+        num_samples=len(audio)
+    )
+
+
+class _StreamingFrameRMS:
+    """
+    Incremental centered frame RMS: emits each frame as soon as
+    its window is fully available.
+    """
+
+    def __init__(self, frame_length: int, hop_length: int):
+        self.frame_length = frame_length
+        self.hop_length = hop_length
+        self.next_frame = 0
+        self.frames: List[np.ndarray] = []
+
+    @property
+    def needed_from(self) -> int:
+        """
+        First absolute sample still needed by a pending frame.
+        """
+        return max(0, self.next_frame * self.hop_length - self.frame_length // 2)
+
+    def update(self, energy: np.ndarray, base: int, total: int, final: bool = False) -> np.ndarray:
+        """
+        energy[i] is the running sum of squares at absolute sample base + i,
+        for samples base..total.
+        """
+        half = self.frame_length // 2
+
+        if final:
+            last = total // self.hop_length
+        else:
+            last = (total - self.frame_length + half) // self.hop_length
+
+        if last < self.next_frame:
+            return np.zeros(0, dtype=np.float32)
+
+        centers = np.arange(self.next_frame, last + 1) * self.hop_length
+        lo = np.clip(centers - half, 0, total)
+        hi = np.clip(centers - half + self.frame_length, 0, total)
+
+        mean_square = (energy[hi - base] - energy[lo - base]) / self.frame_length
+        rms = np.sqrt(np.maximum(mean_square, 0.0)).astype(np.float32)
+
+        self.next_frame = last + 1
+        self.frames.append(rms)
+        return rms
+
+
+class StreamingFrameAnalyzer:
+    """
+    Block-by-block counterpart of compute_frame_features.
+
+    Keeps only a short carry of samples between blocks plus
+    running peak / energy statistics, and reports voiced segments
+    as soon as they close. Segments reported mid-stream are
+    thresholded against the loudest frame seen so far;
+    finalize() re-derives the exact FrameFeatures (identical to
+    the batch computation) from the per-frame RMS it kept.
+    """
+
+    def __init__(self, top_db: float = SILENCE_TOP_DB):
+        self.top_db = top_db
+        self.num_samples = 0
+        self.peak = 0.0
+        self.sum_squares = 0.0
+
+        self._fine = _StreamingFrameRMS(FRAME_LENGTH, HOP_LENGTH)
+        self._vad = _StreamingFrameRMS(VAD_FRAME_LENGTH, VAD_HOP_LENGTH)
+
+        self._carry = np.zeros(0, dtype=np.float32)
+        self._carry_start = 0
+        self._vad_ref = 1e-5
+        self._vad_frame = 0
+        self._open_start: Optional[int] = None
+
+    @property
+    def in_speech(self) -> bool:
+        """
+        True while a voiced segment is open.
+        """
+        return self._open_start is not None
+
+    @property
+    def rms(self) -> float:
+        if self.num_samples == 0:
+            return 0.0
+        return float(np.sqrt(self.sum_squares / self.num_samples))
+
+    def update(self, block: np.ndarray) -> List[Tuple[int, int]]:
+        """
+        Consume the next block; returns voiced segments closed by it.
+        """
+        if block.size:
+            self.peak = max(self.peak, float(block.max()), -float(block.min()))
+            self.sum_squares += float(np.dot(block, block))
+        self.num_samples += len(block)
+
+        return self._advance(np.concatenate((self._carry, block)), final=False)
+
+    def finalize(self) -> Tuple[List[Tuple[int, int]], FrameFeatures]:
+        """
+        Flush pending frames; returns the last voiced segments and
+        the exact features of the whole stream.
+        """
+        closed = self._advance(self._carry, final=True)
+
+        if self._open_start is not None:
+            closed.append((self._open_start, self.num_samples))
+            self._open_start = None
+
+        rms = np.concatenate(self._fine.frames) if self._fine.frames else np.zeros(0, dtype=np.float32)
+        vad_rms = np.concatenate(self._vad.frames) if self._vad.frames else np.zeros(0, dtype=np.float32)
+
+        ref = max(float(vad_rms.max()) if vad_rms.size else 0.0, 1e-5)
+        db = 20.0 * np.log10(np.maximum(vad_rms, 1e-5) / ref)
+
+        features = FrameFeatures(
+            rms=rms,
+            db=db,
+            intervals=voiced_intervals(db, self.num_samples, self.top_db),
+            num_samples=self.num_samples
+        )
+        return closed, features
+
+    def _advance(self, samples: np.ndarray, final: bool) -> List[Tuple[int, int]]:
+        energy = _cumulative_energy(samples)
+
+        self._fine.update(energy, self._carry_start, self.num_samples, final)
+        vad_rms = self._vad.update(energy, self._carry_start, self.num_samples, final)
+
+        # Keep only what pending frames still need
+        keep_from = min(self._fine.needed_from, self._vad.needed_from)
+        self._carry = samples[keep_from - self._carry_start:]
+        self._carry_start = keep_from
+
+        return self._voiced_segments(vad_rms)
+
+    def _voiced_segments(self, vad_rms: np.ndarray) -> List[Tuple[int, int]]:
+        closed = []
+
+        for value in vad_rms:
+            self._vad_ref = max(self._vad_ref, float(value))
+            voiced = (
+                value > STREAM_MIN_VOICED_RMS
+                and 20.0 * np.log10(float(value) / self._vad_ref) > -self.top_db
+            )
+            position = min(self._vad_frame * VAD_HOP_LENGTH, self.num_samples)
+
+            if voiced and self._open_start is None:
+                self._open_start = position
+            elif not voiced and self._open_start is not None:
+                closed.append((self._open_start, position))
+                self._open_start = None
+
+            self._vad_frame += 1
+
+        return closed
 
 
 def rms_energy(audio: np.ndarray) -> np.ndarray:
     """
     Compute RMS energy per frame.
     """
-    return librosa.feature.rms(
-        y=audio,
-        frame_length=FRAME_LENGTH,
-        hop_length=HOP_LENGTH
-    )[0]
+    return _centered_rms(
+        _cumulative_energy(audio), len(audio), FRAME_LENGTH, HOP_LENGTH
+    )
 
 
 def silence_mask(audio: np.ndarray, threshold_db: float = 20.0) -> np.ndarray:
     """
     Identify silence frames using amplitude thresholding.
     """
-    intervals = librosa.effects.split(audio, top_db=threshold_db)
-    mask = np.zeros(len(audio), dtype=bool)
+    intervals = compute_frame_features(audio, top_db=threshold_db).intervals
 
-    for start, end in intervals:
-        mask[start:end] = True
+    delta = np.zeros(len(audio) + 1, dtype=np.int8)
+    delta[intervals[:, 0]] += 1
+    delta[intervals[:, 1]] -= 1
 
-    return mask
+    return np.cumsum(delta[:-1]) > 0
 
 
 # ------------------------------------------------------------
 # Metric computations
 # ------------------------------------------------------------
 
-def compute_rms_stability(audio: np.ndarray) -> float:
+def compute_rms_stability(
+    audio: np.ndarray,
+    features: Optional[FrameFeatures] = None
+) -> float:
     """
     RMS energy stability (coefficient of variation).
     Lower variation => more stable delivery.
     """
-    rms = rms_energy(audio)
+    rms = features.rms if features is not None else rms_energy(audio)
 
     if rms.size == 0 or np.mean(rms) == 0:
         return 0.0
@@ -61,14 +342,18 @@ def compute_rms_stability(audio: np.ndarray) -> float:
         return 0.4
 
 
-def compute_pause_ratio(audio: np.ndarray) -> float:
+def compute_pause_ratio(
+    audio: np.ndarray,
+    features: Optional[FrameFeatures] = None
+) -> float:
     """
     Ratio of silence duration to total duration.
     """
-    total_duration = len(audio) / 16000.0
+    if features is None:
+        features = compute_frame_features(audio)
 
-    silence_intervals = librosa.effects.split(audio, top_db=20)
-    speech_duration = sum((end - start) for start, end in silence_intervals) / 16000.0
+    total_duration = features.duration
+    speech_duration = features.speech_duration
     silence_duration = max(total_duration - speech_duration, 0.0)
 
     if total_duration == 0:
@@ -85,7 +370,11 @@ def compute_pause_ratio(audio: np.ndarray) -> float:
         return 0.4
 
 
-def compute_speaking_rate(transcript: str, audio: np.ndarray) -> float:
+def compute_speaking_rate(
+    transcript: str,
+    audio: np.ndarray,
+    features: Optional[FrameFeatures] = None
+) -> float:
     """
     Words per second (excluding silence).
     """
@@ -96,8 +385,9 @@ def compute_speaking_rate(transcript: str, audio: np.ndarray) -> float:
         return 0.0
 
     # Estimate speaking time (exclude silence)
-    silence_intervals = librosa.effects.split(audio, top_db=20)
-    speaking_time = sum((end - start) for start, end in silence_intervals) / 16000.0
+    if features is None:
+        features = compute_frame_features(audio)
+    speaking_time = features.speech_duration
 
     if speaking_time == 0:
         return 0.0
@@ -117,15 +407,24 @@ def compute_speaking_rate(transcript: str, audio: np.ndarray) -> float:
 # Aggregated analysis (delivery diagnostics)
 # ------------------------------------------------------------
 
-def analyze_audio_delivery(audio: np.ndarray, transcript: str) -> Dict[str, float]:
+def analyze_audio_delivery(
+    audio: np.ndarray,
+    transcript: str,
+    features: Optional[FrameFeatures] = None
+) -> Dict[str, float]:
     """
     Compute delivery-related audio diagnostics.
     This output is meant for feedback, NOT penalties.
+
+    Pass the FrameFeatures from BasicDSP.preprocess_with_features
+    to skip recomputing them.
     """
+    if features is None:
+        features = compute_frame_features(audio)
 
-    rms_stability = compute_rms_stability(audio)
-    pause_score = compute_pause_ratio(audio)
-    speaking_rate_score = compute_speaking_rate(transcript, audio)
+    rms_stability = compute_rms_stability(audio, features)
+    pause_score = compute_pause_ratio(audio, features)
+    speaking_rate_score = compute_speaking_rate(transcript, audio, features)
 
     delivery_stability = 0.6 * rms_stability + 0.4 * pause_score
 
@@ -21,9 +21,17 @@ class QuestionDataLoader:
         with open(self.json_path, "r", encoding="utf-8") as f:
             raw_questions = json.load(f)
 
+        return self.parse(raw_questions)
+
+    def parse(self, raw_questions: List[dict], validate: bool = True) -> List[Question]:
+        """
+        Build Question records; validate=False for records that
+        were validated when compiled (see question_bank.py).
+        """
         questions = []
         for q in raw_questions:
-            validate_question_schema(q)
+            if validate:
+                validate_question_schema(q)
             questions.append(self._parse_question(q))
 
         return questions
@@ -2,13 +2,13 @@ from dataclasses import dataclass
 from typing import List, Dict
 
 
-@dataclass
+@dataclass(slots=True)
 class KeyConcept:
     concept: str
     mandatory: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class IdealAnswer:
     answer_id: str
     text: str
@@ -16,14 +16,14 @@ class IdealAnswer:
     weight: float
 
 
-@dataclass
+@dataclass(slots=True)
 class EvaluationConfig:
     semantic_weight: float
     keyword_weight: float
     evidence_weight: float
 
 
-@dataclass
+@dataclass(slots=True)
 class Question:
     question_id: str
     topic: str
@@ -0,0 +1,275 @@
+import bisect
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+# Latency buckets in seconds: 1 ms .. 60 s
+DEFAULT_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class _Metric:
+    """
+    Base for labelled metrics: one child value per label tuple,
+    guarded by a single lock.
+    """
+
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], object] = {}
+
+    def _key(self, labels: Dict[str, str]) -> Tuple[str, ...]:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(labels[n]) for n in self.labelnames)
+
+    def render(self, const_labels: Optional[Dict[str, str]] = None) -> List[str]:
+        """
+        const_labels are prepended to every series (e.g. the worker).
+        """
+        const_labels = const_labels or {}
+        names = tuple(const_labels) + self.labelnames
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} {self.kind}"
+        ]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.extend(self._render_child(names, tuple(const_labels.values()) + key, value))
+        return lines
+
+    def _render_child(self, names: Tuple[str, ...], key: Tuple[str, ...], value) -> List[str]:
+        return [f"{self.name}{_format_labels(names, key)} {_format_value(value)}"]
+
+
+class Counter(_Metric):
+    """
+    Monotonically increasing count.
+    """
+
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+
+class Gauge(_Metric):
+    """
+    Value that can go up and down, set directly or read from a
+    callback at scrape time.
+    """
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def set_function(self, fn: Callable[[], float], **labels):
+        """
+        Evaluate fn on every scrape (e.g. a cache hit ratio).
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = fn
+
+    @contextmanager
+    def time(self, **labels):
+        """
+        Set the gauge to the duration of the block (e.g. model load).
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.set(time.perf_counter() - started, **labels)
+
+    def _render_child(self, names, key, value):
+        if callable(value):
+            try:
+                value = float(value())
+            except Exception:
+                return []
+        return super()._render_child(names, key, value)
+
+
+class Histogram(_Metric):
+    """
+    Cumulative-bucket latency histogram.
+
+    observe() is a bisect and three additions under a lock, so
+    it is cheap enough for every request and stage.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            child = self._values.get(key)
+            if child is None:
+                # [per-bucket counts..., +Inf count], sum
+                child = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            child[0][idx] += 1
+            child[1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def render(self, const_labels: Optional[Dict[str, str]] = None) -> List[str]:
+        const_labels = const_labels or {}
+        names = tuple(const_labels) + self.labelnames
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} {self.kind}"
+        ]
+        with self._lock:
+            items = sorted((key, (list(c[0]), c[1])) for key, c in self._values.items())
+
+        bucket_labels = names + ("le",)
+        for key, (counts, total) in items:
+            key = tuple(const_labels.values()) + key
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                labels = _format_labels(bucket_labels, key + (_format_value(bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+
+            labels = _format_labels(names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Named metrics rendered together in Prometheus text format.
+
+    Each worker process has its own registry; const_labels (set
+    per worker, see set_const_labels) tell their series apart.
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._const_labels: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def set_const_labels(self, **labels):
+        with self._lock:
+            self._const_labels = {name: str(value) for name, value in labels.items()}
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+            const_labels = dict(self._const_labels)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render(const_labels))
+        return "\n".join(lines) + "\n"
+
+
+# =====================================================
+# PROCESS-WIDE METRICS
+# =====================================================
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.register(Histogram(
+    "evaluation_stage_seconds",
+    "Duration of one pipeline stage (semantic, keyword, evidence, fusion, delivery, dsp, asr, delivery_metrics).",
+    ["stage"]
+))
+
+EVALUATION_SECONDS = REGISTRY.register(Histogram(
+    "evaluation_critical_path_seconds",
+    "Wall time from the first stage start to the fused score."
+))
+
+REQUESTS_TOTAL = REGISTRY.register(Counter(
+    "http_requests_total",
+    "HTTP requests by route template and outcome.",
+    ["route", "method", "outcome"]
+))
+
+REQUEST_SECONDS = REGISTRY.register(Histogram(
+    "http_request_seconds",
+    "HTTP request latency by route template.",
+    ["route", "method"]
+))
+
+MODEL_LOAD_SECONDS = REGISTRY.register(Gauge(
+    "model_load_seconds",
+    "Time taken to load each model at startup.",
+    ["model"]
+))
+
+CACHE_HIT_RATIO = REGISTRY.register(Gauge(
+    "cache_hit_ratio",
+    "Hits / lookups since startup, per cache.",
+    ["cache"]
+))
+
+PROCESS_MEMORY_BYTES = REGISTRY.register(Gauge(
+    "process_memory_bytes",
+    "This worker's memory from /proc/self/smaps_rollup (uss = private pages, pss, rss).",
+    ["kind"]
+))
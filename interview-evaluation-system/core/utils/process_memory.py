@@ -0,0 +1,44 @@
+from typing import Dict, Union
+
+# smaps_rollup fields, in kB
+_FIELDS = (
+    "Rss", "Pss", "Shared_Clean", "Shared_Dirty",
+    "Private_Clean", "Private_Dirty"
+)
+
+
+def read_smaps_rollup(pid: Union[int, str] = "self") -> Dict[str, int]:
+    """
+    Memory of one process in bytes: rss, pss, shared and uss
+    (unique set size: pages no other process maps, i.e. what
+    killing it would free). Linux only; {} elsewhere or if the
+    process is gone.
+    """
+    fields: Dict[str, int] = {}
+    try:
+        with open(f"/proc/{pid}/smaps_rollup", "r") as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 2 and parts[0].rstrip(":") in _FIELDS:
+                    fields[parts[0].rstrip(":")] = int(parts[1]) * 1024
+    except (FileNotFoundError, ProcessLookupError, PermissionError):
+        return {}
+
+    if not fields:
+        return {}
+
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "shared": fields.get("Shared_Clean", 0) + fields.get("Shared_Dirty", 0),
+        "uss": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0)
+    }
+
+
+def format_memory(memory: Dict[str, int]) -> str:
+    if not memory:
+        return "unavailable"
+    return "  ".join(
+        f"{kind} {memory[kind] / (1024 * 1024):.1f} MB"
+        for kind in ("uss", "pss", "rss")
+    )
@@ -0,0 +1,331 @@
+import json
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    filename = os.path.basename(code.co_filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+
+def _is_idle_worker(labels) -> bool:
+    """
+    A thread-pool worker blocked on its work queue (root-first labels).
+    """
+    for i, label in enumerate(labels[:-1]):
+        if label.startswith("_worker (thread.py"):
+            return labels[i + 1].startswith("get (queue.py")
+    return False
+
+
+class StackSampler:
+    """
+    Wall-clock stack sampler shared by every active profile.
+
+    One daemon thread snapshots sys._current_frames() every
+    interval while at least one ProfileSession is subscribed,
+    folds each thread's stack once (root;...;leaf, the input
+    format of flamegraph.pl and speedscope) and hands the
+    snapshot, keyed by thread id, to every subscriber. All
+    threads are sampled because evaluation stages run on pool
+    threads; concurrent requests therefore show up too.
+    """
+
+    def __init__(self, interval_sec: float = 0.005):
+        self.interval_sec = interval_sec
+        self._subscribers = set()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self, session: "ProfileSession"):
+        with self._cond:
+            self._subscribers.add(session)
+            # Started on first use, i.e. in the serving process
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def unsubscribe(self, session: "ProfileSession"):
+        with self._cond:
+            self._subscribers.discard(session)
+
+    def _run(self):
+        own_id = threading.get_ident()
+
+        while True:
+            with self._cond:
+                while not self._subscribers:
+                    self._cond.wait()
+
+            time.sleep(self.interval_sec)
+
+            with self._cond:
+                subscribers = list(self._subscribers)
+            if not subscribers:
+                continue
+
+            snapshot = self._snapshot(own_id)
+            for session in subscribers:
+                session.add_sample(snapshot)
+
+    @staticmethod
+    def _snapshot(own_id: int) -> Dict[int, str]:
+        """
+        thread id -> folded stack, idle pool workers left out.
+        """
+        names = {t.ident: t.name for t in threading.enumerate()}
+        snapshot = {}
+
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_id:
+                continue
+
+            labels = []
+            while frame is not None:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+
+            labels.append(names.get(thread_id, str(thread_id)))
+            labels.reverse()
+
+            if not _is_idle_worker(labels):
+                snapshot[thread_id] = ";".join(labels)
+
+        return snapshot
+
+
+class ProfileSession:
+    """
+    One profiled evaluation: receives samples from the shared
+    sampler until end(), then finish() writes <stem>.folded and a
+    <stem>.json sidecar (with per-thread sample counts).
+    """
+
+    def __init__(self, output_dir: Path, question_id: str, sampler: StackSampler, sequence: int):
+        self.output_dir = output_dir
+        self.question_id = question_id
+        self.sequence = sequence
+        self.interval_sec = sampler.interval_sec
+        self.stacks: Counter = Counter()
+        self.thread_samples: Counter = Counter()
+        self.samples = 0
+        self.started_at = time.time()
+        self._started = time.perf_counter()
+        self._elapsed: Optional[float] = None
+        self._lock = threading.Lock()
+        self._sampler = sampler
+        self._sampler.subscribe(self)
+
+    def add_sample(self, snapshot: Dict[int, str]):
+        with self._lock:
+            if self._elapsed is not None:
+                return
+            for thread_id, stack in snapshot.items():
+                self.stacks[stack] += 1
+                self.thread_samples[thread_id] += 1
+            self.samples += 1
+
+    def end(self):
+        """
+        Stop the clock and stop receiving samples.
+        """
+        self._sampler.unsubscribe(self)
+        with self._lock:
+            if self._elapsed is None:
+                self._elapsed = time.perf_counter() - self._started
+
+    def folded(self) -> str:
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.stacks.most_common()
+        )
+
+    def finish(self, stage_timings_ms: Optional[Dict[str, float]] = None, error: Optional[str] = None) -> Path:
+        self.end()
+        elapsed = self._elapsed
+
+        safe_id = "".join(c if c.isalnum() or c in "-_" else "_" for c in self.question_id)
+        stem = f"{time.strftime('%Y%m%dT%H%M%S', time.gmtime(self.started_at))}_{safe_id}_{os.getpid()}_{self.sequence}"
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        folded_path = self.output_dir / f"{stem}.folded"
+        folded_path.write_text(self.folded(), encoding="utf-8")
+
+        sidecar: Dict[str, Any] = {
+            "question_id": self.question_id,
+            "started_at": self.started_at,
+            "wall_ms": round(1000 * elapsed, 2),
+            "samples": self.samples,
+            "interval_ms": 1000 * self.interval_sec,
+            "thread_samples": {str(k): v for k, v in self.thread_samples.most_common()},
+            "stage_timings_ms": stage_timings_ms,
+            "error": error,
+            "folded": folded_path.name
+        }
+        with open(self.output_dir / f"{stem}.json", "w", encoding="utf-8") as f:
+            json.dump(sidecar, f, indent=2)
+
+        return folded_path
+
+
+class ProfilingController:
+    """
+    Decides which evaluations are profiled.
+
+    Off by default. Arm it for the next N evaluations and/or a
+    random fraction of them (admin endpoint), or force a single
+    request (X-Profile header, if allowed). When nothing is armed
+    maybe_start() is a couple of attribute reads.
+
+    All profiles share one sampler thread, and at most
+    max_concurrent run at once: a selected evaluation past the cap
+    is not profiled (and does not use up an armed count).
+    Profiles are written by a background thread, never on the
+    caller's (event loop) thread, and only the newest max_profiles
+    are kept in output_dir.
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        interval_ms: float = 5.0,
+        allow_header: bool = False,
+        max_profiles: int = 200,
+        max_concurrent: int = 4
+    ):
+        self.output_dir = Path(output_dir)
+        self.interval_sec = interval_ms / 1000.0
+        self.allow_header = allow_header
+        self.max_profiles = max_profiles
+        self.max_concurrent = max_concurrent
+
+        # Threads start on first use, i.e. in the serving process
+        self._sampler = StackSampler(self.interval_sec)
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="profile-writer")
+
+        self._lock = threading.Lock()
+        self._remaining = 0
+        self._fraction = 0.0
+        self._sessions = 0
+        self._active = 0
+
+    # --------------------------------------------------
+    # PUBLIC API
+    # --------------------------------------------------
+    def arm(self, count: int = 0, fraction: float = 0.0):
+        """
+        Profile the next `count` evaluations, plus a random
+        `fraction` of all evaluations until disarmed.
+        """
+        if count < 0 or not 0.0 <= fraction <= 1.0:
+            raise ValueError("count must be >= 0 and fraction in [0, 1]")
+
+        with self._lock:
+            self._remaining = count
+            self._fraction = fraction
+
+    def disarm(self):
+        self.arm(0, 0.0)
+
+    def maybe_start(self, question_id: str, force: bool = False) -> Optional[ProfileSession]:
+        if not (self._remaining or self._fraction or (force and self.allow_header)):
+            return None
+
+        with self._lock:
+            if self._active >= self.max_concurrent:
+                return None
+            if force and self.allow_header:
+                pass
+            elif self._remaining > 0:
+                self._remaining -= 1
+            elif not (self._fraction and random.random() < self._fraction):
+                return None
+            self._sessions += 1
+            self._active += 1
+            sequence = self._sessions
+
+        return ProfileSession(self.output_dir, question_id, self._sampler, sequence)
+
+    @contextmanager
+    def profile(self, question_id: str, force: bool = False):
+        """
+        Profile the block if this evaluation is selected.
+
+        Yields a dict the caller may fill with "stage_timings_ms"
+        for the sidecar; exceptions are recorded and re-raised.
+        """
+        tags: Dict[str, Any] = {}
+        session = self.maybe_start(question_id, force)
+
+        if session is None:
+            yield tags
+            return
+
+        error = None
+        try:
+            yield tags
+        except BaseException as e:
+            error = repr(e)
+            raise
+        finally:
+            session.end()
+            with self._lock:
+                self._active -= 1
+            self._writer.submit(self._write, session, tags.get("stage_timings_ms"), error)
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "remaining": self._remaining,
+                "fraction": self._fraction,
+                "allow_header": self.allow_header,
+                "profiles_started": self._sessions,
+                "active": self._active,
+                "max_concurrent": self.max_concurrent,
+                "max_profiles": self.max_profiles,
+                "output_dir": str(self.output_dir)
+            }
+
+    def close(self):
+        """
+        Write pending profiles.
+        """
+        self._writer.shutdown(wait=True)
+
+    # --------------------------------------------------
+    # INTERNALS
+    # --------------------------------------------------
+    def _write(self, session: ProfileSession, stage_timings_ms: Optional[Dict[str, float]], error: Optional[str]):
+        try:
+            session.finish(stage_timings_ms, error)
+            self._rotate()
+        except OSError as e:
+            print(f"[PROFILING] Could not write profile: {e!r}")
+
+    def _rotate(self):
+        """
+        Delete all but the newest max_profiles (sidecar + folded).
+        """
+        sidecars = []
+        for path in self.output_dir.glob("*.json"):
+            try:
+                sidecars.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+
+        sidecars.sort(reverse=True)
+        for _, path in sidecars[self.max_profiles:]:
+            for stale in (path, path.with_suffix(".folded")):
+                try:
+                    stale.unlink()
+                except FileNotFoundError:
+                    pass
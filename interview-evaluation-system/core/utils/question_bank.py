@@ -0,0 +1,291 @@
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Pattern
+
+import numpy as np
+
+from core.utils.data_loader import QuestionDataLoader
+from core.utils.data_models import Question
+from core.utils.result_cache import file_digest
+
+# =====================================================
+# ARTIFACT LAYOUT
+# =====================================================
+# magic (8 bytes) | header length (uint64 LE) | header JSON |
+# question records | zero padding to a 64-byte boundary |
+# float32 embedding matrix
+#
+# The header holds the question-id -> (record offset, record
+# length, first matrix row) index, the concept matcher sources per
+# ideal answer and the matrix shape. Records are the validated
+# question JSON, one after another. Both records and matrix (one
+# row per ideal answer) are mapped, not read: pages are shared by
+# every process that maps the file, including pre-forked workers,
+# and a record is only parsed when its question is first used.
+ARTIFACT_MAGIC = b"IEQBANK\x00"
+ARTIFACT_VERSION = 2
+_PREFIX = struct.Struct("<8sQ")
+_ALIGN = 64
+
+
+def default_artifact_path(json_path: str) -> str:
+    return str(Path(json_path).with_suffix(".bank"))
+
+
+class StaleQuestionBank(RuntimeError):
+    """
+    The compiled artifact is missing or out of date and compiling
+    it here is not allowed (see load_question_bank).
+    """
+
+
+class _LazyQuestionMap(Mapping):
+    """
+    question_id -> Question, parsed from the mapped record on first
+    lookup. Membership and iteration only read the index.
+    """
+
+    def __init__(self, buffer: mmap.mmap, index: Dict[str, List[int]], path: str):
+        self._buffer = buffer
+        self._index = index
+        self._loader = QuestionDataLoader(path)
+        self._parsed: Dict[str, Question] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, question_id: str) -> Question:
+        question = self._parsed.get(question_id)
+        if question is None:
+            offset, length, _ = self._index[question_id]
+            question = self._loader.parse(
+                [json.loads(self._buffer[offset:offset + length])],
+                validate=False
+            )[0]
+            with self._lock:
+                question = self._parsed.setdefault(question_id, question)
+        return question
+
+    def __contains__(self, question_id: object) -> bool:
+        return question_id in self._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+class CompiledQuestionBank:
+    """
+    Question bank loaded from a compiled artifact.
+
+    question_map builds __slots__ records from the mapped,
+    already-validated JSON on first lookup; embeddings is a
+    read-only view of the mapped matrix. Concept matchers are
+    compiled from the stored sources on first use per question.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, header_len = _PREFIX.unpack_from(self._mmap, 0)
+        if magic != ARTIFACT_MAGIC:
+            raise ValueError(f"Not a compiled question bank: {path}")
+
+        header = json.loads(self._mmap[_PREFIX.size:_PREFIX.size + header_len])
+        self.version = header["version"]
+        self.source_sha256 = header["source_sha256"]
+        self.semantic_model = header["semantic_model"]
+        self.has_concept_patterns = header["concept_patterns"] is not None
+
+        # question_id -> [record offset, record length, first matrix row]
+        self._index: Dict[str, List[int]] = header["index"]
+        self.question_map: Mapping = _LazyQuestionMap(self._mmap, self._index, path)
+        self._pattern_sources: Optional[Dict[str, List[List[str]]]] = header["concept_patterns"]
+        self._patterns: Dict[tuple, List[Pattern]] = {}
+        self._lock = threading.Lock()
+
+        rows, dim = header["matrix_shape"]
+        self.embeddings: Optional[np.ndarray] = None
+        if rows and dim:
+            self.embeddings = np.frombuffer(
+                self._mmap,
+                dtype=np.float32,
+                count=rows * dim,
+                offset=header["matrix_offset"]
+            ).reshape(rows, dim)
+
+    @property
+    def questions(self) -> List[Question]:
+        """
+        Every question, in source order (parses all records).
+        """
+        return [self.question_map[question_id] for question_id in self._index]
+
+    def reference_embedding(self, question_id: str, answer_index: int = 0) -> Optional[np.ndarray]:
+        if self.embeddings is None:
+            return None
+        return self.embeddings[self._index[question_id][2] + answer_index]
+
+    def concept_patterns(self, question_id: str, answer_index: int = 0) -> Optional[List[Pattern]]:
+        if self._pattern_sources is None:
+            return None
+
+        key = (question_id, answer_index)
+        patterns = self._patterns.get(key)
+        if patterns is None:
+            patterns = [
+                re.compile(source)
+                for source in self._pattern_sources[question_id][answer_index]
+            ]
+            with self._lock:
+                self._patterns[key] = patterns
+        return patterns
+
+    def is_current(self, source_sha256: str, semantic_model: Optional[str], concept_patterns: bool) -> bool:
+        """
+        Built from this source, with what the pipeline needs.
+        """
+        return (
+            self.version == ARTIFACT_VERSION
+            and self.source_sha256 == source_sha256
+            and (semantic_model is None or self.semantic_model == semantic_model)
+            and (not concept_patterns or self.has_concept_patterns)
+        )
+
+
+def compile_question_bank(
+    json_path: str,
+    artifact_path: str,
+    semantic_scorer=None,
+    concept_scorer=None,
+    source_sha256: Optional[str] = None
+) -> str:
+    """
+    Validate questions.json and write the artifact. Embeddings come
+    from semantic_scorer.encode_reference and matchers from
+    concept_scorer.compile; either may be None to leave them out.
+    """
+    with open(json_path, "r", encoding="utf-8") as f:
+        raw_questions = json.load(f)
+
+    # Validates every record and fails before anything is written
+    questions = QuestionDataLoader(json_path).parse(raw_questions)
+
+    rows: Dict[str, int] = {}
+    vectors = []
+    concept_patterns = {} if concept_scorer is not None else None
+
+    for question in questions:
+        rows[question.question_id] = len(vectors)
+
+        for ideal_answer in question.ideal_answers:
+            if semantic_scorer is not None:
+                vectors.append(np.asarray(
+                    semantic_scorer.encode_reference(ideal_answer.text),
+                    dtype=np.float32
+                ))
+
+        if concept_patterns is not None:
+            concept_patterns[question.question_id] = [
+                [
+                    pattern.pattern
+                    for pattern in concept_scorer.compile(
+                        [kc.concept for kc in ideal_answer.key_concepts]
+                    )
+                ]
+                for ideal_answer in question.ideal_answers
+            ]
+
+    matrix = np.vstack(vectors) if vectors else np.zeros((0, 0), dtype=np.float32)
+    records = [json.dumps(q, ensure_ascii=False).encode("utf-8") for q in raw_questions]
+
+    header: Dict[str, Any] = {
+        "version": ARTIFACT_VERSION,
+        "source_sha256": source_sha256 or file_digest(json_path),
+        "semantic_model": semantic_scorer.model_name if semantic_scorer is not None else None,
+        "index": {},
+        "concept_patterns": concept_patterns,
+        "matrix_shape": list(matrix.shape),
+        "matrix_offset": 0
+    }
+
+    # Offsets are part of the header, so size the header with
+    # fixed-width placeholders first
+    placeholder = 10 ** 12
+    header["index"] = {
+        question.question_id: [placeholder, len(record), rows[question.question_id]]
+        for question, record in zip(questions, records)
+    }
+    header["matrix_offset"] = placeholder
+    header_len = len(json.dumps(header).encode("utf-8"))
+
+    offset = _PREFIX.size + header_len
+    for question, record in zip(questions, records):
+        header["index"][question.question_id][0] = offset
+        offset += len(record)
+    header["matrix_offset"] = -(-offset // _ALIGN) * _ALIGN
+    header_bytes = json.dumps(header).encode("utf-8").ljust(header_len)
+
+    tmp_path = f"{artifact_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_PREFIX.pack(ARTIFACT_MAGIC, len(header_bytes)))
+        f.write(header_bytes)
+        for record in records:
+            f.write(record)
+        f.write(b"\0" * (header["matrix_offset"] - f.tell()))
+        f.write(np.ascontiguousarray(matrix, dtype="<f4").tobytes())
+    os.replace(tmp_path, artifact_path)
+
+    return artifact_path
+
+
+def load_question_bank(
+    json_path: str,
+    artifact_path: Optional[str] = None,
+    semantic_scorer=None,
+    concept_scorer=None,
+    compile_stale: bool = True
+) -> CompiledQuestionBank:
+    """
+    Map the compiled artifact, first rebuilding it if it is
+    missing, unreadable, from an older source (SHA-256 of the
+    JSON) or lacks what the given scorers need.
+
+    compile_stale=False raises StaleQuestionBank instead of
+    rebuilding: compiling encodes every ideal answer, which a
+    process that forks workers afterwards must not do.
+    """
+    artifact_path = artifact_path or default_artifact_path(json_path)
+    source_sha256 = file_digest(json_path)
+    semantic_model = semantic_scorer.model_name if semantic_scorer is not None else None
+
+    try:
+        bank = CompiledQuestionBank(artifact_path)
+        if bank.is_current(source_sha256, semantic_model, concept_scorer is not None):
+            return bank
+    except (FileNotFoundError, ValueError, KeyError, struct.error):
+        pass
+
+    if not compile_stale:
+        raise StaleQuestionBank(
+            f"{artifact_path} is missing or out of date for {json_path}; "
+            f"run `python -m scripts.compile_question_bank` first"
+        )
+
+    compile_question_bank(
+        json_path,
+        artifact_path,
+        semantic_scorer=semantic_scorer,
+        concept_scorer=concept_scorer,
+        source_sha256=source_sha256
+    )
+    return CompiledQuestionBank(artifact_path)
@@ -0,0 +1,220 @@
+import copy
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Bump when the cached result layout changes
+RESULT_SCHEMA_VERSION = 1
+
+
+def file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    """
+    SHA-256 of a file's bytes.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class EvaluationResultCache:
+    """
+    Idempotent cache of evaluation results.
+
+    Keyed by question id, the hash of the answer exactly as the
+    scorers see it, the call's options and a fingerprint of
+    everything that can change a score (models, index, corpus,
+    question bank, fusion weights). In memory it is an LRU with a
+    per-entry TTL; the optional disk tier keeps entries across
+    restarts under a directory named after the fingerprint, and
+    directories of other fingerprints are deleted on startup, so
+    any change in a component invalidates every old entry. The
+    disk tier is capped at max_disk_mb: past it, expired and then
+    oldest entries are deleted. The answer text itself is never
+    stored (callers echo it back on a hit).
+    """
+
+    def __init__(
+        self,
+        fingerprint: Dict[str, Any],
+        max_entries: int = 10000,
+        ttl_sec: float = 3600.0,
+        disk_dir: Optional[str] = None,
+        max_disk_mb: float = 512.0
+    ):
+        self.max_entries = max_entries
+        self.ttl_sec = ttl_sec
+        self.fingerprint = hashlib.sha256(
+            json.dumps(
+                {"schema": RESULT_SCHEMA_VERSION, **fingerprint},
+                sort_keys=True
+            ).encode("utf-8")
+        ).hexdigest()
+
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        self.disk_dir = None
+        self.max_disk_bytes = int(max_disk_mb * 1024 * 1024)
+        self._disk_bytes = 0
+        self._prune_lock = threading.Lock()
+        if disk_dir is not None:
+            root = Path(disk_dir)
+            root.mkdir(parents=True, exist_ok=True)
+            for stale in root.iterdir():
+                if stale.is_dir() and stale.name != self.fingerprint:
+                    shutil.rmtree(stale, ignore_errors=True)
+            self.disk_dir = root / self.fingerprint
+            self.disk_dir.mkdir(exist_ok=True)
+            self._prune_disk()
+
+    # --------------------------------------------------
+    # KEYS
+    # --------------------------------------------------
+    def key(self, question_id: str, student_answer: str, **options) -> str:
+        answer_hash = hashlib.sha256(student_answer.encode("utf-8")).hexdigest()
+        return hashlib.sha256(
+            json.dumps(
+                [self.fingerprint, question_id, answer_hash, options],
+                sort_keys=True,
+                default=str
+            ).encode("utf-8")
+        ).hexdigest()
+
+    # --------------------------------------------------
+    # PUBLIC API
+    # --------------------------------------------------
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, result = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return copy.deepcopy(result)
+                del self._entries[key]
+
+        result = self._disk_get(key, now)
+
+        with self._lock:
+            if result is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+
+        self._remember(key, result[0], result[1])
+        return copy.deepcopy(result[1])
+
+    def put(self, key: str, result: Dict[str, Any]):
+        expires_at = time.time() + self.ttl_sec
+        result = copy.deepcopy(result)
+        result.pop("student_answer", None)
+        self._remember(key, expires_at, result)
+
+        if self.disk_dir is not None:
+            path = self._path(key)
+            path.parent.mkdir(exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"expires_at": expires_at, "result": result}, f)
+            os.replace(tmp_path, path)
+
+            with self._lock:
+                self._disk_bytes += path.stat().st_size
+                over_cap = self._disk_bytes > self.max_disk_bytes
+            if over_cap:
+                self._prune_disk()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_ratio": round(self._hits / lookups, 4) if lookups else 0.0,
+                "fingerprint": self.fingerprint[:12]
+            }
+
+    # --------------------------------------------------
+    # INTERNALS
+    # --------------------------------------------------
+    def _remember(self, key: str, expires_at: float, result: Dict[str, Any]):
+        with self._lock:
+            self._entries[key] = (expires_at, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> Path:
+        return self.disk_dir / key[:2] / f"{key}.json"
+
+    def _disk_get(self, key: str, now: float) -> Optional[tuple]:
+        if self.disk_dir is None:
+            return None
+
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        if entry["expires_at"] <= now:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            return None
+
+        return entry["expires_at"], entry["result"]
+
+    def _prune_disk(self):
+        """
+        Delete expired entries, then the oldest, until the disk tier
+        is under 90% of its cap. Sizes are re-read from the directory,
+        which other worker processes may share.
+        """
+        if not self._prune_lock.acquire(blocking=False):
+            return  # another thread is pruning
+
+        try:
+            entries = []
+            for path in self.disk_dir.glob("*/*.json"):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            # Written at expires_at - ttl_sec: oldest expire first
+            entries.sort()
+            total = sum(size for _, size, _ in entries)
+            expired_before = time.time() - self.ttl_sec
+            target = 0.9 * self.max_disk_bytes
+
+            for mtime, size, path in entries:
+                if total <= target and mtime > expired_before:
+                    break
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                total -= size
+
+            with self._lock:
+                self._disk_bytes = total
+        finally:
+            self._prune_lock.release()
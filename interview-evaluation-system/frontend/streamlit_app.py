@@ -1,5 +1,10 @@
-import streamlit as st
+import io
+
+import numpy as np
 import requests
+import soundfile as sf
+import soxr
+import streamlit as st
 
 # -----------------------------
 # Configuration
@@ -8,6 +13,10 @@ API_BASE_URL = "http://127.0.0.1:8000"
 SUBMIT_TEXT_URL = f"{API_BASE_URL}/submit_text/"
 SUBMIT_AUDIO_URL = f"{API_BASE_URL}/submit_audio/"
 
+# WAV uploads are re-encoded to 16 kHz mono Opus before sending
+UPLOAD_SAMPLE_RATE = 16000
+COMPRESSED_FORMATS = {"flac", "ogg", "opus"}
+
 st.set_page_config(
     page_title="Interview Evaluation System",
     layout="centered"
@@ -61,13 +70,42 @@ with tab_text:
 # AUDIO INPUT
 with tab_audio:
     audio_file = st.file_uploader(
-        "Upload WAV audio file",
-        type=["wav"]
+        "Upload audio file",
+        type=["wav", "flac", "ogg", "opus"]
     )
     submit_audio = st.button("Evaluate Audio Answer")
 
 st.divider()
 
+# -----------------------------
+# Helper: Compress Audio for Upload
+# -----------------------------
+def compress_audio(uploaded) -> tuple:
+    """
+    Returns (filename, bytes, mime) to send.
+    WAV is downmixed, resampled to 16 kHz and encoded as Opus;
+    already-compressed files are sent as-is.
+    """
+    name, _, extension = uploaded.name.rpartition(".")
+    if extension.lower() in COMPRESSED_FORMATS:
+        return uploaded.name, uploaded.getvalue(), f"audio/{extension.lower()}"
+
+    data, sr = sf.read(io.BytesIO(uploaded.getvalue()), dtype="float32", always_2d=True)
+    mono = data.mean(axis=1)
+    if sr != UPLOAD_SAMPLE_RATE:
+        mono = soxr.resample(mono, sr, UPLOAD_SAMPLE_RATE)
+
+    buffer = io.BytesIO()
+    sf.write(
+        buffer,
+        np.clip(mono, -1.0, 1.0),
+        UPLOAD_SAMPLE_RATE,
+        format="OGG",
+        subtype="OPUS"
+    )
+    return f"{name}.opus", buffer.getvalue(), "audio/ogg"
+
+
 # -----------------------------
 # Helper: Render Results
 # -----------------------------
@@ -139,11 +177,11 @@ if submit_text:
 # -----------------------------
 if submit_audio:
     if audio_file is None:
-        st.warning("Please upload a WAV audio file.")
+        st.warning("Please upload an audio file.")
     else:
         with st.spinner("Processing audio..."):
             files = {
-                "audio_file": (audio_file.name, audio_file, "audio/wav")
+                "audio_file": compress_audio(audio_file)
             }
             data = {
                 "question_id": question_id
@@ -0,0 +1,120 @@
+import argparse
+import json
+import re
+import time
+from pathlib import Path
+
+import yaml
+
+from core.models.audio.dsp_stub import BasicDSP
+from core.models.audio.asr_stub import FasterWhisperASR
+
+# =====================================================
+# PATHS (MATCH REPO STRUCTURE)
+# =====================================================
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+SAMPLES_DIR = BASE_DIR / "data" / "samples"
+SAMPLE_FILES = ["harvard.wav", "firstquestion.wav", "ind_acc_sam.wav"]
+CONFIG_PATH = BASE_DIR / "config" / "default.yaml"
+
+SAMPLE_RATE = 16000
+
+# =====================================================
+# WORD ERROR RATE
+# =====================================================
+def normalize_words(text: str) -> list:
+    return re.sub(r"[^a-z0-9' ]+", " ", text.lower()).split()
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """
+    (substitutions + deletions + insertions) / reference words.
+    """
+    ref = normalize_words(reference)
+    hyp = normalize_words(hypothesis)
+    if not ref:
+        return 0.0 if not hyp else 1.0
+
+    previous = list(range(len(hyp) + 1))
+    for i, ref_word in enumerate(ref, start=1):
+        current = [i] + [0] * len(hyp)
+        for j, hyp_word in enumerate(hyp, start=1):
+            current[j] = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (ref_word != hyp_word)
+            )
+        previous = current
+
+    return previous[-1] / len(ref)
+
+# =====================================================
+# BENCHMARK
+# =====================================================
+def load_profiles() -> dict:
+    with open(CONFIG_PATH, "r") as f:
+        asr_cfg = yaml.safe_load(f)["audio"]["asr"]
+    return asr_cfg["profiles"], asr_cfg["default_profile"]
+
+
+def run_benchmark(references_path: str = None):
+    profiles, default_profile = load_profiles()
+
+    dsp = BasicDSP()
+    samples = {}
+    for name in SAMPLE_FILES:
+        signal, features = dsp.preprocess_with_features(str(SAMPLES_DIR / name))
+        samples[name] = (signal, features)
+
+    transcripts = {}
+    for profile, settings in profiles.items():
+        settings = dict(settings)
+        asr = FasterWhisperASR(
+            model_size=settings.pop("model_size", "small"),
+            decode_options=settings
+        )
+        asr.transcribe(samples[SAMPLE_FILES[0]][0][:SAMPLE_RATE])  # warm-up
+
+        transcripts[profile] = {}
+        for name, (signal, features) in samples.items():
+            started = time.perf_counter()
+            text = asr.transcribe(signal, voiced_intervals=features.intervals)
+            elapsed = time.perf_counter() - started
+            transcripts[profile][name] = (text, elapsed)
+
+    # Human references where available; otherwise the default
+    # profile's output stands in, so WER is relative to it
+    references = {}
+    if references_path:
+        with open(references_path, "r", encoding="utf-8") as f:
+            references = json.load(f)
+
+    print(f"{'profile':<10} {'file':<20} {'audio_s':>8} {'RTF':>6} {'WER':>6}  reference")
+    for profile, results in transcripts.items():
+        for name, (text, elapsed) in results.items():
+            duration = samples[name][1].duration
+            if name in references:
+                reference, source = references[name], "human"
+            else:
+                reference, source = transcripts[default_profile][name][0], default_profile
+
+            print(
+                f"{profile:<10} {name:<20} {duration:>8.1f} "
+                f"{elapsed / duration:>6.3f} {word_error_rate(reference, text):>6.1%}  {source}"
+            )
+
+# =====================================================
+# ENTRY POINT
+# =====================================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Word error rate and real-time factor per ASR latency profile"
+    )
+    parser.add_argument(
+        "--references",
+        help="JSON mapping sample file name -> reference transcript"
+    )
+    args = parser.parse_args()
+
+    run_benchmark(args.references)
@@ -0,0 +1,61 @@
+import argparse
+import time
+from pathlib import Path
+
+from core.models.audio.dsp_stub import BasicDSP
+from core.models.audio.asr_stub import FasterWhisperASR
+
+# =====================================================
+# PATHS (MATCH REPO STRUCTURE)
+# =====================================================
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+SAMPLES_DIR = BASE_DIR / "data" / "samples"
+SAMPLE_FILES = ["harvard.wav", "firstquestion.wav", "ind_acc_sam.wav"]
+
+SAMPLE_RATE = 16000
+
+# =====================================================
+# BENCHMARK
+# =====================================================
+def report(label: str, audio_seconds: float, elapsed: float):
+    print(
+        f"[{label}] {audio_seconds:.1f} audio-s in {elapsed:.1f} s "
+        f"-> {audio_seconds / elapsed:.2f} audio-s per wall-s"
+    )
+
+
+def run_benchmark(copies: int, batch_size: int, model_size: str):
+    dsp = BasicDSP()
+    signals = [
+        dsp.preprocess(str(SAMPLES_DIR / name))
+        for name in SAMPLE_FILES
+    ] * copies
+
+    audio_seconds = sum(len(s) for s in signals) / SAMPLE_RATE
+    print(f"[INFO] {len(signals)} files, {audio_seconds:.1f} s of audio")
+
+    asr = FasterWhisperASR(model_size=model_size)
+
+    started = time.perf_counter()
+    for signal in signals:
+        asr.transcribe(signal)
+    report("PER-FILE", audio_seconds, time.perf_counter() - started)
+
+    started = time.perf_counter()
+    asr.transcribe_batch(signals, batch_size=batch_size)
+    report("BATCHED ", audio_seconds, time.perf_counter() - started)
+
+# =====================================================
+# ENTRY POINT
+# =====================================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Per-file vs batched transcription throughput"
+    )
+    parser.add_argument("--copies", type=int, default=10, help="repeat the sample set")
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--model-size", default="small")
+    args = parser.parse_args()
+
+    run_benchmark(args.copies, args.batch_size, args.model_size)
@@ -0,0 +1,92 @@
+import argparse
+import io
+import time
+from pathlib import Path
+
+import numpy as np
+import requests
+import soundfile as sf
+import soxr
+
+# =====================================================
+# PATHS (MATCH REPO STRUCTURE)
+# =====================================================
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+SAMPLES_DIR = BASE_DIR / "data" / "samples"
+SAMPLE_FILES = ["harvard.wav", "firstquestion.wav", "ind_acc_sam.wav"]
+
+API_URL = "http://127.0.0.1:8000/submit_audio/"
+QUESTION_ID = "ECE_SNS_01"
+
+UPLOAD_SAMPLE_RATE = 16000
+
+# =====================================================
+# ENCODING (same as the Streamlit frontend)
+# =====================================================
+def encode(raw: bytes, fmt: str) -> tuple:
+    """
+    Returns (filename_suffix, payload, mime).
+    """
+    if fmt == "wav":
+        return "wav", raw, "audio/wav"
+
+    data, sr = sf.read(io.BytesIO(raw), dtype="float32", always_2d=True)
+    mono = data.mean(axis=1)
+    if sr != UPLOAD_SAMPLE_RATE:
+        mono = soxr.resample(mono, sr, UPLOAD_SAMPLE_RATE)
+    mono = np.clip(mono, -1.0, 1.0)
+
+    buffer = io.BytesIO()
+    if fmt == "flac":
+        sf.write(buffer, mono, UPLOAD_SAMPLE_RATE, format="FLAC")
+        return "flac", buffer.getvalue(), "audio/flac"
+
+    sf.write(buffer, mono, UPLOAD_SAMPLE_RATE, format="OGG", subtype="OPUS")
+    return "opus", buffer.getvalue(), "audio/ogg"
+
+# =====================================================
+# BENCHMARK
+# =====================================================
+def run_benchmark(api_url: str, repeats: int):
+    print(f"{'file':<20}{'format':<8}{'bytes':>12}{'ratio':>8}{'latency_s':>12}")
+
+    for name in SAMPLE_FILES:
+        raw = (SAMPLES_DIR / name).read_bytes()
+
+        for fmt in ("wav", "flac", "opus"):
+            latencies = []
+            payload = b""
+
+            for _ in range(repeats):
+                started = time.perf_counter()
+
+                # End-to-end: client-side encode + upload + evaluation
+                suffix, payload, mime = encode(raw, fmt)
+                response = requests.post(
+                    api_url,
+                    files={"audio_file": (f"{Path(name).stem}.{suffix}", payload, mime)},
+                    data={"question_id": QUESTION_ID}
+                )
+                response.raise_for_status()
+
+                latencies.append(time.perf_counter() - started)
+
+            print(
+                f"{name:<20}{fmt:<8}{len(payload):>12}"
+                f"{len(raw) / len(payload):>8.1f}"
+                f"{np.median(latencies):>12.2f}"
+            )
+
+# =====================================================
+# ENTRY POINT
+# =====================================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Bytes-on-wire and end-to-end latency per upload format"
+    )
+    parser.add_argument("--api-url", default=API_URL)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    run_benchmark(args.api_url, args.repeats)
@@ -1,4 +1,11 @@
+import argparse
+import hashlib
+import itertools
 import json
+import multiprocessing
+import os
+import struct
+import time
 import numpy as np
 import faiss
 from pathlib import Path
@@ -16,6 +23,7 @@ EMBEDDINGS_DIR = BASE_DIR / "data" / "embeddings"
 
 FAISS_INDEX_PATH = EMBEDDINGS_DIR / "faiss_index.bin"
 EMBEDDINGS_PATH = EMBEDDINGS_DIR / "doc_embeddings.npy"
+BUILD_STATE_PATH = EMBEDDINGS_DIR / "build_state.json"
 
 EMBEDDINGS_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -24,6 +32,11 @@ EMBEDDINGS_DIR.mkdir(parents=True, exist_ok=True)
 # =====================================================
 EMBEDDING_MODEL_NAME = "multi-qa-mpnet-base-dot-v1"
 
+ENCODE_BATCH_SIZE = 32
+
+# Streaming build: chunks encoded (and checkpointed) per shard
+SHARD_SIZE = 1024
+
 # =====================================================
 # LOAD CORPUS
 # =====================================================
@@ -31,10 +44,281 @@ def load_chunks():
     with open(CHUNKS_FILE, "r", encoding="utf-8") as f:
         return json.load(f)
 
+
+def iter_chunks(read_size: int = 1 << 20):
+    """
+    Lazily yield entries of the corpus JSON array without
+    materializing the whole file.
+    """
+    decoder = json.JSONDecoder()
+
+    with open(CHUNKS_FILE, "r", encoding="utf-8") as f:
+        buffer = ""
+        pos = 0
+        started = False
+        eof = False
+
+        while True:
+            # Skip whitespace and array punctuation
+            while pos < len(buffer) and buffer[pos] in " \t\r\n,[":
+                if buffer[pos] == "[":
+                    started = True
+                pos += 1
+
+            if pos < len(buffer) and buffer[pos] == "]":
+                return
+
+            if started and pos < len(buffer):
+                try:
+                    entry, end = decoder.raw_decode(buffer, pos)
+                    yield entry
+                    pos = end
+                    continue
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+
+            if eof:
+                return
+
+            data = f.read(read_size)
+            eof = not data
+            buffer = buffer[pos:] + data
+            pos = 0
+
+
+def corpus_digest(chunk_size: int = 1 << 20) -> str:
+    """
+    SHA-256 of the corpus file: a checkpoint only resumes on
+    the exact chunks it was built from.
+    """
+    digest = hashlib.sha256()
+    with open(CHUNKS_FILE, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def iter_text_shards(shard_size: int, skip: int = 0):
+    """
+    Yield lists of chunk texts, shard_size at a time,
+    starting after the first `skip` chunks.
+    """
+    texts = (
+        entry["text"]
+        for entry in itertools.islice(iter_chunks(), skip, None)
+    )
+
+    while True:
+        shard = list(itertools.islice(texts, shard_size))
+        if not shard:
+            return
+        yield shard
+
+# =====================================================
+# ENCODERS
+# =====================================================
+class LocalEncoder:
+    """
+    In-process SentenceTransformer encoding (default).
+    """
+
+    def __init__(self):
+        self.model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+
+    def dimension(self) -> int:
+        return self.model.get_sentence_embedding_dimension()
+
+    def encode(self, texts: list, show_progress_bar: bool = False) -> np.ndarray:
+        return self.model.encode(
+            texts,
+            show_progress_bar=show_progress_bar,
+            convert_to_numpy=True,
+            batch_size=ENCODE_BATCH_SIZE
+        ).astype(np.float32)
+
+    def close(self):
+        pass
+
+
+_worker_model = None
+
+
+def _init_encoder_worker(core_groups, threads_per_worker: int):
+    """
+    Pool initializer: pin this process to one core group and
+    size torch's intra-op pool to match.
+    """
+    global _worker_model
+    import torch
+
+    group = core_groups.get()
+    if group and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, group)
+
+    torch.set_num_threads(threads_per_worker)
+    _worker_model = SentenceTransformer(EMBEDDING_MODEL_NAME, device="cpu")
+
+
+def _worker_dimension() -> int:
+    return _worker_model.get_sentence_embedding_dimension()
+
+
+def _worker_encode(texts: list) -> np.ndarray:
+    return _worker_model.encode(
+        texts,
+        convert_to_numpy=True,
+        batch_size=ENCODE_BATCH_SIZE
+    ).astype(np.float32)
+
+
+class MultiProcessEncoder:
+    """
+    One encoder process per core group.
+
+    Texts are sorted by length so each batch pads to a similar
+    length, fanned out to the workers, and scattered back into
+    the original order.
+    """
+
+    def __init__(self, num_workers: int, threads_per_worker: int = None):
+        cores = sorted(os.sched_getaffinity(0)) \
+            if hasattr(os, "sched_getaffinity") \
+            else list(range(os.cpu_count() or 1))
+
+        threads_per_worker = threads_per_worker or max(1, len(cores) // num_workers)
+
+        # torch is not fork-safe once initialized
+        ctx = multiprocessing.get_context("spawn")
+        core_groups = ctx.Queue()
+        for w in range(num_workers):
+            group = cores[w * threads_per_worker:(w + 1) * threads_per_worker]
+            core_groups.put(set(group))
+
+        print(
+            f"[INFO] Starting {num_workers} encoder processes "
+            f"x {threads_per_worker} threads"
+        )
+        self.pool = ctx.Pool(
+            num_workers,
+            initializer=_init_encoder_worker,
+            initargs=(core_groups, threads_per_worker)
+        )
+
+    def dimension(self) -> int:
+        return self.pool.apply(_worker_dimension)
+
+    def encode(self, texts: list, show_progress_bar: bool = False) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, self.dimension()), dtype=np.float32)
+
+        order = np.argsort([len(t) for t in texts], kind="stable")
+
+        batches = [
+            [texts[i] for i in order[start:start + ENCODE_BATCH_SIZE]]
+            for start in range(0, len(order), ENCODE_BATCH_SIZE)
+        ]
+
+        sorted_embeddings = np.concatenate(
+            self.pool.map(_worker_encode, batches)
+        )
+
+        # Scatter back to the original order
+        embeddings = np.empty_like(sorted_embeddings)
+        embeddings[order] = sorted_embeddings
+        return embeddings
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+
+def make_encoder(workers: int = 1, threads_per_worker: int = None):
+    if workers > 1:
+        return MultiProcessEncoder(workers, threads_per_worker)
+    return LocalEncoder()
+
+
+def report_throughput(num_chunks: int, elapsed: float, label: str = "ENCODE"):
+    rate = num_chunks / elapsed if elapsed > 0 else 0.0
+    print(f"[{label}] {num_chunks} chunks in {elapsed:.1f}s ({rate:.1f} chunks/s)")
+
+# =====================================================
+# BUILD STATE (RESUMABLE STREAMING BUILD)
+# =====================================================
+def load_build_state():
+    if not BUILD_STATE_PATH.exists():
+        return None
+
+    with open(BUILD_STATE_PATH, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_build_state(state: dict):
+    # Atomic replace: a crash never leaves a half-written state file
+    tmp_path = BUILD_STATE_PATH.with_suffix(".json.tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, BUILD_STATE_PATH)
+
+# =====================================================
+# ON-DISK FLAT INDEX
+# =====================================================
+def _flat_index_layout(dim: int):
+    """
+    Serialized IndexFlatIP layout, probed from faiss itself:
+    (header bytes, offset of ntotal in it, codes-size units per
+    vector). The codes-size field and the float32 rows follow the
+    header. None if the layout is not the expected one.
+    """
+    empty = faiss.serialize_index(faiss.IndexFlatIP(dim)).tobytes()
+    probe = faiss.IndexFlatIP(dim)
+    probe.add(np.zeros((1, dim), dtype=np.float32))
+    one = faiss.serialize_index(probe).tobytes()
+
+    header = empty[:-8]
+    if len(one) != len(empty) + 4 * dim or struct.unpack_from("<Q", empty, len(header))[0] != 0:
+        return None
+
+    changed = [i for i in range(len(header)) if header[i] != one[i]]
+    if not changed:
+        return None
+    ntotal_offset = changed[0]
+    if changed[-1] >= ntotal_offset + 8 or struct.unpack_from("<q", one, ntotal_offset)[0] != 1:
+        return None
+
+    return header, ntotal_offset, struct.unpack_from("<Q", one, len(header))[0]
+
+
+def write_flat_index(embeddings: np.ndarray, path: Path, rows_per_write: int = SHARD_SIZE) -> bool:
+    """
+    Write embeddings (e.g. a memory-mapped .npy) as the IndexFlatIP
+    faiss.write_index would produce, rows_per_write rows at a time,
+    so the index is never held in memory. False if this faiss
+    version serializes flat indexes differently.
+    """
+    num_rows, dim = embeddings.shape
+    layout = _flat_index_layout(dim)
+    if layout is None:
+        return False
+
+    header, ntotal_offset, codes_per_vector = layout
+    header = bytearray(header)
+    struct.pack_into("<q", header, ntotal_offset, num_rows)
+
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(struct.pack("<Q", codes_per_vector * num_rows))
+        for start in range(0, num_rows, rows_per_write):
+            f.write(np.ascontiguousarray(embeddings[start:start + rows_per_write], dtype="<f4").tobytes())
+    os.replace(tmp_path, path)
+    return True
+
 # =====================================================
 # BUILD FAISS INDEX
 # =====================================================
-def build_faiss_index():
+def build_faiss_index(workers: int = 1, threads_per_worker: int = None):
     print("[INFO] Loading corpus chunks...")
     corpus = load_chunks()
 
@@ -42,15 +326,13 @@ def build_faiss_index():
     print(f"[INFO] Loaded {len(texts)} chunks")
 
     print("[INFO] Loading embedding model...")
-    model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+    encoder = make_encoder(workers, threads_per_worker)
 
     print("[INFO] Computing embeddings...")
-    embeddings = model.encode(
-        texts,
-        show_progress_bar=True,
-        convert_to_numpy=True,
-        batch_size=32
-    )
+    started = time.perf_counter()
+    embeddings = encoder.encode(texts, show_progress_bar=True)
+    report_throughput(len(texts), time.perf_counter() - started)
+    encoder.close()
 
     # Normalize for cosine similarity (Inner Product)
     faiss.normalize_L2(embeddings)
@@ -68,8 +350,136 @@ def build_faiss_index():
     print(f"[INDEX] {FAISS_INDEX_PATH}")
     print(f"[EMB]   {EMBEDDINGS_PATH}")
 
+
+def build_faiss_index_streaming(
+    shard_size: int = SHARD_SIZE,
+    resume: bool = True,
+    workers: int = 1,
+    threads_per_worker: int = None
+):
+    """
+    Bounded-memory build.
+
+    Chunks are read lazily and encoded one shard at a time.
+    Each shard is written to a memory-mapped .npy before the next
+    one is read, and the index file is written from that .npy
+    shard by shard at the end (write_flat_index), so only one
+    shard of texts/embeddings is resident at any point.
+    Progress is checkpointed per shard; an interrupted build
+    resumes from the last completed shard.
+    """
+    print("[INFO] Counting corpus chunks...")
+    num_chunks = sum(1 for _ in iter_chunks())
+    num_shards = (num_chunks + shard_size - 1) // shard_size
+    print(f"[INFO] Found {num_chunks} chunks ({num_shards} shards)")
+
+    print("[INFO] Loading embedding model...")
+    encoder = make_encoder(workers, threads_per_worker)
+    dim = encoder.dimension()
+
+    expected = {
+        "model": EMBEDDING_MODEL_NAME,
+        "corpus_sha256": corpus_digest(),
+        "num_chunks": num_chunks,
+        "shard_size": shard_size,
+        "dim": dim
+    }
+
+    state = load_build_state() if resume else None
+    if state and all(state.get(k) == v for k, v in expected.items()) \
+            and EMBEDDINGS_PATH.exists():
+        completed = state["completed_shards"]
+        embeddings = np.lib.format.open_memmap(EMBEDDINGS_PATH, mode="r+")
+        print(f"[INFO] Resuming after shard {completed}/{num_shards}")
+    else:
+        completed = 0
+        embeddings = np.lib.format.open_memmap(
+            EMBEDDINGS_PATH,
+            mode="w+",
+            dtype=np.float32,
+            shape=(num_chunks, dim)
+        )
+        save_build_state({**expected, "completed_shards": 0})
+
+    print("[INFO] Computing embeddings...")
+    shards = iter_text_shards(shard_size, skip=completed * shard_size)
+    encoded = 0
+    started = time.perf_counter()
+
+    for shard_idx, texts in enumerate(shards, start=completed):
+        shard_started = time.perf_counter()
+        shard_embeddings = encoder.encode(texts)
+        encoded += len(texts)
+
+        # Normalize for cosine similarity (Inner Product)
+        faiss.normalize_L2(shard_embeddings)
+
+        start = shard_idx * shard_size
+        embeddings[start:start + len(texts)] = shard_embeddings
+        embeddings.flush()
+
+        save_build_state({**expected, "completed_shards": shard_idx + 1})
+        print(f"[SHARD] {shard_idx + 1}/{num_shards}")
+        report_throughput(len(texts), time.perf_counter() - shard_started, "SHARD")
+
+    report_throughput(encoded, time.perf_counter() - started)
+    encoder.close()
+
+    print("[INFO] Writing FAISS index...")
+    if not write_flat_index(embeddings, FAISS_INDEX_PATH, rows_per_write=shard_size):
+        # Unknown serialization: fall back to an in-memory index
+        print("[WARN] Unrecognized faiss index layout; building the index in memory")
+        index = faiss.IndexFlatIP(dim)
+        for start in range(0, num_chunks, shard_size):
+            index.add(np.ascontiguousarray(embeddings[start:start + shard_size]))
+        faiss.write_index(index, str(FAISS_INDEX_PATH))
+    del embeddings
+
+    BUILD_STATE_PATH.unlink(missing_ok=True)
+
+    print("[DONE] FAISS index built successfully")
+    print(f"[INDEX] {FAISS_INDEX_PATH}")
+    print(f"[EMB]   {EMBEDDINGS_PATH}")
+
 # =====================================================
 # ENTRY POINT
 # =====================================================
 if __name__ == "__main__":
-    build_faiss_index()
+    parser = argparse.ArgumentParser(description="Build the FAISS evidence index")
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="bounded-memory, resumable shard-by-shard build"
+    )
+    parser.add_argument("--shard-size", type=int, default=SHARD_SIZE)
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="ignore any checkpoint and start the streaming build over"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="encoder processes (one per core group); 1 encodes in-process"
+    )
+    parser.add_argument(
+        "--threads-per-worker",
+        type=int,
+        default=None,
+        help="torch threads per encoder process (default: cores // workers)"
+    )
+    args = parser.parse_args()
+
+    if args.streaming:
+        build_faiss_index_streaming(
+            shard_size=args.shard_size,
+            resume=not args.no_resume,
+            workers=args.workers,
+            threads_per_worker=args.threads_per_worker
+        )
+    else:
+        build_faiss_index(
+            workers=args.workers,
+            threads_per_worker=args.threads_per_worker
+        )
@@ -0,0 +1,71 @@
+import argparse
+import time
+from pathlib import Path
+
+import yaml
+
+from core.models.keyword.regex_concept_scorer import RegexConceptScorer
+from core.orchestration.pipeline_builder import load_pipeline_config
+from core.utils.question_bank import (
+    CompiledQuestionBank,
+    compile_question_bank,
+    default_artifact_path
+)
+
+# =====================================================
+# PATHS (MATCH REPO STRUCTURE)
+# =====================================================
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+QUESTIONS_PATH = BASE_DIR / "data" / "questions" / "questions.json"
+CONFIG_PATH = BASE_DIR / "config" / "default.yaml"
+
+# =====================================================
+# COMPILE
+# =====================================================
+# The API compiles on startup when the artifact is missing or the
+# JSON changed; run this ahead of deploys to keep that off the
+# startup path. api.prefork never compiles (its parent must not
+# run inference) and refuses to start until this has been run.
+def compile_bank(output_path: str = None):
+    with open(CONFIG_PATH, "r") as f:
+        system_cfg = yaml.safe_load(f)
+    pipeline = load_pipeline_config(
+        str(BASE_DIR / "config" / f"{system_cfg['system']['pipeline']}.yaml")
+    )
+
+    semantic_scorer = None
+    if pipeline.semantic_enabled:
+        from core.models.semantic.sbert_scorer import SBERTSemanticScorer
+        semantic_scorer = SBERTSemanticScorer(pipeline.semantic_model)
+
+    output_path = output_path or default_artifact_path(str(QUESTIONS_PATH))
+
+    started = time.perf_counter()
+    compile_question_bank(
+        str(QUESTIONS_PATH),
+        output_path,
+        semantic_scorer=semantic_scorer,
+        concept_scorer=RegexConceptScorer()
+    )
+    print(f"Compiled {output_path} in {time.perf_counter() - started:.2f}s")
+
+    started = time.perf_counter()
+    bank = CompiledQuestionBank(output_path)
+    print(
+        f"Loaded {len(bank.questions)} questions "
+        f"(embeddings {None if bank.embeddings is None else bank.embeddings.shape}) "
+        f"in {1000 * (time.perf_counter() - started):.2f} ms"
+    )
+
+# =====================================================
+# ENTRY POINT
+# =====================================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Compile questions.json into the memory-mapped question bank artifact"
+    )
+    parser.add_argument("--output", help="Artifact path (default: next to questions.json)")
+    args = parser.parse_args()
+
+    compile_bank(args.output)
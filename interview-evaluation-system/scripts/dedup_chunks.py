@@ -0,0 +1,202 @@
+import argparse
+import json
+import re
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+# =====================================================
+# PATHS (MATCH REPO STRUCTURE)
+# =====================================================
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+CHUNKS_FILE = (
+    BASE_DIR / "data" / "corpus" / "processed_chunks" / "corpus_chunks.json"
+)
+DEDUP_FILE = CHUNKS_FILE.with_name("corpus_chunks.dedup.json")
+
+# The index rows are aligned with CHUNKS_FILE entries
+FAISS_INDEX_PATH = BASE_DIR / "data" / "embeddings" / "faiss_index.bin"
+
+# =====================================================
+# MINHASH / LSH CONFIG (FROZEN)
+# =====================================================
+SHINGLE_SIZE = 5        # word n-grams
+NUM_PERM = 128          # signature length
+BANDS = 16              # LSH bands (rows per band = NUM_PERM // BANDS)
+THRESHOLD = 0.8         # estimated Jaccard to count as near-duplicate
+SEED = 13
+
+# multi-qa-mpnet-base-dot-v1, float32 IndexFlatIP
+EMBEDDING_DIM = 768
+
+_TOKEN_RE = re.compile(r"\w+")
+
+_rng = np.random.default_rng(SEED)
+# Multiply-add-shift hash family: odd multipliers, 64-bit wraparound
+_PERM_A = _rng.integers(1, 2 ** 63, size=NUM_PERM, dtype=np.uint64) | np.uint64(1)
+_PERM_B = _rng.integers(0, 2 ** 63, size=NUM_PERM, dtype=np.uint64)
+
+# =====================================================
+# MINHASH
+# =====================================================
+def shingle_hashes(text: str) -> np.ndarray:
+    """
+    32-bit hashes of the word shingles of a chunk.
+    """
+    tokens = _TOKEN_RE.findall(text.lower())
+
+    if len(tokens) < SHINGLE_SIZE:
+        shingles = {" ".join(tokens)}
+    else:
+        shingles = {
+            " ".join(tokens[i:i + SHINGLE_SIZE])
+            for i in range(len(tokens) - SHINGLE_SIZE + 1)
+        }
+
+    return np.fromiter(
+        (zlib.crc32(s.encode("utf-8")) for s in shingles),
+        dtype=np.uint64,
+        count=len(shingles)
+    )
+
+
+def minhash_signature(text: str) -> np.ndarray:
+    hashes = shingle_hashes(text)[:, None]
+    with np.errstate(over="ignore"):
+        permuted = (hashes * _PERM_A + _PERM_B) >> np.uint64(32)
+    return permuted.min(axis=0)
+
+# =====================================================
+# LSH CLUSTERING
+# =====================================================
+def _find(parent: list, i: int) -> int:
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def near_duplicate_clusters(texts: list) -> list:
+    """
+    Returns, for every text, the index of its cluster representative
+    (the earliest member of the cluster).
+
+    Each LSH bucket member is only verified against the bucket's
+    first member, so the work stays linear even when one piece of
+    boilerplate repeats thousands of times.
+    """
+    rows = NUM_PERM // BANDS
+    signatures = [minhash_signature(t) for t in texts]
+    parent = list(range(len(texts)))
+
+    for band in range(BANDS):
+        buckets = {}
+        lo, hi = band * rows, (band + 1) * rows
+
+        for idx, sig in enumerate(signatures):
+            key = sig[lo:hi].tobytes()
+            anchor = buckets.setdefault(key, idx)
+            if anchor == idx:
+                continue
+
+            root_a, root_b = _find(parent, anchor), _find(parent, idx)
+            if root_a == root_b:
+                continue
+
+            similarity = np.mean(signatures[anchor] == sig)
+            if similarity >= THRESHOLD:
+                # Earliest chunk stays the representative
+                parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    return [_find(parent, i) for i in range(len(texts))]
+
+
+def dedup_chunks(chunks: list):
+    """
+    Keep one representative per near-duplicate cluster.
+
+    Returns:
+        (kept_chunks, report)
+    """
+    texts = [entry["text"] for entry in chunks]
+    representatives = near_duplicate_clusters(texts)
+
+    kept = [
+        entry for idx, entry in enumerate(chunks)
+        if representatives[idx] == idx
+    ]
+
+    removed = len(chunks) - len(kept)
+    total_chars = sum(len(t) for t in texts)
+    kept_chars = sum(len(entry["text"]) for entry in kept)
+
+    report = {
+        "chunks_before": len(chunks),
+        "chunks_after": len(kept),
+        "chunks_removed": removed,
+        "chars_removed": total_chars - kept_chars,
+        "corpus_reduction_pct": round(
+            100.0 * (total_chars - kept_chars) / total_chars, 2
+        ) if total_chars else 0.0,
+        "index_bytes_saved": removed * EMBEDDING_DIM * 4
+    }
+
+    return kept, report
+
+
+def print_report(report: dict):
+    print(
+        f"[DEDUP] Removed {report['chunks_removed']} of "
+        f"{report['chunks_before']} chunks "
+        f"({report['corpus_reduction_pct']}% of corpus text)"
+    )
+    print(
+        f"[DEDUP] Index size saved: "
+        f"{report['index_bytes_saved'] / (1024 * 1024):.1f} MiB"
+    )
+
+
+def dedup_file(input_path: Path, output_path: Path, index_path: Path = FAISS_INDEX_PATH) -> dict:
+    """
+    Dedup a chunk file into output_path.
+
+    FAISS row i is chunk i of CHUNKS_FILE, so rewriting the file
+    an index was built from would silently misalign evidence;
+    that is refused.
+    """
+    if Path(output_path).resolve() == Path(input_path).resolve() and Path(index_path).exists():
+        raise ValueError(
+            f"{input_path} is indexed by {index_path}; write the deduplicated "
+            f"chunks to a new file, then replace it and rebuild the index"
+        )
+
+    with open(input_path, "r", encoding="utf-8") as f:
+        corpus = json.load(f)
+
+    corpus, report = dedup_chunks(corpus)
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(corpus, f, indent=2)
+
+    return report
+
+# =====================================================
+# ENTRY POINT (DEDUP AN EXISTING CHUNK FILE)
+# =====================================================
+# python -m scripts.dedup_chunks [--output PATH]
+#
+# Writes a new file: move it over corpus_chunks.json and run
+# scripts.build_faiss_index before serving with it.
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Remove near-duplicate corpus chunks")
+    parser.add_argument("--input", type=Path, default=CHUNKS_FILE)
+    parser.add_argument("--output", type=Path, default=DEDUP_FILE)
+    args = parser.parse_args()
+
+    dedup_report = dedup_file(args.input, args.output)
+    print_report(dedup_report)
+
+    print(f"[OUTPUT] {args.output}")
+    print(f"[NEXT] Replace {CHUNKS_FILE.name} with it and rebuild the FAISS index")
@@ -0,0 +1,99 @@
+import argparse
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+import soxr
+import websockets
+
+# =====================================================
+# PATHS (MATCH REPO STRUCTURE)
+# =====================================================
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+SAMPLES_DIR = BASE_DIR / "data" / "samples"
+SAMPLE_FILES = ["harvard.wav", "firstquestion.wav", "ind_acc_sam.wav"]
+
+LIVE_URL = "ws://127.0.0.1:8000/live"
+QUESTION_ID = "ECE_SNS_01"
+
+SAMPLE_RATE = 16000
+FRAME_SECONDS = 0.1
+
+# =====================================================
+# AUDIO
+# =====================================================
+def load_pcm16(path: Path) -> bytes:
+    data, sr = sf.read(path, dtype="float32", always_2d=True)
+    mono = data.mean(axis=1)
+    if sr != SAMPLE_RATE:
+        mono = soxr.resample(mono, sr, SAMPLE_RATE)
+    return (np.clip(mono, -1.0, 1.0) * 32767).astype("<i2").tobytes()
+
+# =====================================================
+# REPLAY
+# =====================================================
+async def receive_updates(ws, state: dict):
+    async for raw in ws:
+        message = json.loads(raw)
+
+        if message["type"] == "partial":
+            print(
+                f"  [PARTIAL] {message['committed']} | {message['provisional']}"
+                f"  (concepts: {', '.join(message['concept_hits']) or '-'})"
+            )
+        elif message["type"] == "final":
+            state["final_at"] = time.perf_counter()
+            result = message["result"]
+            print(f"  [FINAL] {result['final_score']} / 10 ({result['verdict']})")
+            print(f"  [TRANSCRIPT] {result['student_answer']}")
+        else:
+            print(f"  [ERROR] {message['detail']}")
+
+
+async def replay(path: Path, url: str, question_id: str, speed: float):
+    pcm = load_pcm16(path)
+    frame_bytes = int(FRAME_SECONDS * SAMPLE_RATE) * 2
+    state = {}
+
+    print(f"[REPLAY] {path.name} ({len(pcm) / 2 / SAMPLE_RATE:.1f} s)")
+
+    async with websockets.connect(f"{url}/{question_id}", max_size=None) as ws:
+        receiver = asyncio.create_task(receive_updates(ws, state))
+
+        for offset in range(0, len(pcm), frame_bytes):
+            await ws.send(pcm[offset:offset + frame_bytes])
+            # Real-time pacing (speed > 1 replays faster)
+            await asyncio.sleep(FRAME_SECONDS / speed)
+
+        ended_at = time.perf_counter()
+        try:
+            await ws.send(json.dumps({"event": "end"}))
+        except websockets.ConnectionClosed:
+            pass  # server already detected end-of-speech
+
+        await receiver
+
+    if "final_at" in state:
+        print(f"[LATENCY] {state['final_at'] - ended_at:.2f} s after end of audio")
+
+# =====================================================
+# ENTRY POINT
+# =====================================================
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Stream WAV files to the live evaluation WebSocket"
+    )
+    parser.add_argument("files", nargs="*", help="audio files (default: bundled samples)")
+    parser.add_argument("--url", default=LIVE_URL)
+    parser.add_argument("--question-id", default=QUESTION_ID)
+    parser.add_argument("--speed", type=float, default=1.0)
+    args = parser.parse_args()
+
+    paths = [Path(f) for f in args.files] or [SAMPLES_DIR / name for name in SAMPLE_FILES]
+
+    for audio_path in paths:
+        asyncio.run(replay(audio_path, args.url, args.question_id, args.speed))
@@ -4,6 +4,8 @@ from pathlib import Path
 import pdfplumber
 from nltk.tokenize import word_tokenize
 
+from scripts.dedup_chunks import dedup_chunks, print_report
+
 # =====================================================
 # PATHS (MATCH REPO STRUCTURE)
 # =====================================================
@@ -86,6 +88,10 @@ def preprocess_corpus():
                 "domain": book_meta["domain"]
             })
 
+    # CHUNKS → NEAR-DUPLICATE ELIMINATION (before embedding)
+    all_chunks, dedup_report = dedup_chunks(all_chunks)
+    print_report(dedup_report)
+
     output_path = CHUNKS_DIR / "corpus_chunks.json"
     with open(output_path, "w", encoding="utf-8") as f:
         json.dump(all_chunks, f, indent=2)
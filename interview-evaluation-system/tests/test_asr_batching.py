@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("faster_whisper")
+
+from core.models.audio import asr_stub
+from core.models.audio.asr_stub import FasterWhisperASR, _pack_clips
+
+SAMPLE_RATE = 16000
+
+
+class _Segment:
+    def __init__(self, start, end, text):
+        self.start, self.end, self.text = start, end, text
+
+
+class _FakeBatchedPipeline:
+    """
+    Checks clip_timestamps the way faster-whisper's collect_chunks
+    uses them (audio[start:end]) and emits one segment per clip.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio, clip_timestamps, **kwargs):
+        self.calls.append(clip_timestamps)
+        segments = []
+        for clip in clip_timestamps:
+            assert isinstance(clip["start"], int)
+            assert isinstance(clip["end"], int)
+            assert 0 <= clip["start"] < clip["end"] <= len(audio)
+            audio[clip["start"]:clip["end"]]
+            segments.append(_Segment(
+                clip["start"] / SAMPLE_RATE,
+                clip["end"] / SAMPLE_RATE,
+                f"clip@{clip['start']}"
+            ))
+        return iter(segments), None
+
+
+def _asr_with_fake_pipeline():
+    asr = object.__new__(FasterWhisperASR)
+    asr.decode_options = {}
+    asr._batched = _FakeBatchedPipeline()
+    return asr
+
+
+def test_pack_clips_emits_integer_sample_offsets():
+    intervals = np.array([[100, 8000], [9000, 20000]])
+    clips = _pack_clips(intervals, offset=32000, sample_rate=SAMPLE_RATE)
+
+    assert clips == [{"start": 32100, "end": 52000}]
+    assert all(isinstance(v, int) for clip in clips for v in clip.values())
+
+
+def test_pack_clips_splits_intervals_longer_than_a_window():
+    window = int(asr_stub.MAX_CLIP_SECONDS * SAMPLE_RATE)
+    clips = _pack_clips(np.array([[0, 2 * window + 10]]), 0, SAMPLE_RATE)
+
+    assert [c["end"] - c["start"] for c in clips] == [window, window, 10]
+
+
+def test_transcribe_batch_routes_segments_to_files(monkeypatch):
+    class _Features:
+        def __init__(self, intervals):
+            self.intervals = intervals
+
+    # One voiced interval per file, in the middle of the clip
+    monkeypatch.setattr(
+        asr_stub,
+        "compute_frame_features",
+        lambda signal: _Features(np.array([[len(signal) // 4, 3 * len(signal) // 4]]))
+    )
+
+    asr = _asr_with_fake_pipeline()
+    signals = [np.zeros(SAMPLE_RATE * 2, dtype=np.float32), np.zeros(SAMPLE_RATE, dtype=np.float32)]
+
+    transcripts = asr.transcribe_batch(signals, SAMPLE_RATE)
+
+    assert transcripts == ["clip@8000", "clip@36000"]
+    assert len(asr._batched.calls) == 1
+
+
+def test_transcribe_batch_without_speech_skips_decoding(monkeypatch):
+    class _Features:
+        intervals = np.zeros((0, 2), dtype=np.int64)
+
+    monkeypatch.setattr(asr_stub, "compute_frame_features", lambda signal: _Features())
+
+    asr = _asr_with_fake_pipeline()
+    assert asr.transcribe_batch([np.zeros(SAMPLE_RATE)], SAMPLE_RATE) == [""]
+    assert asr._batched.calls == []
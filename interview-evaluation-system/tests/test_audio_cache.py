@@ -0,0 +1,77 @@
+import io
+import os
+import time
+
+from core.utils.audio_cache import AudioResultCache, transcript_reusable
+
+
+def _cache(tmp_path, max_bytes=1 << 20, **fingerprint):
+    return AudioResultCache(
+        cache_dir=str(tmp_path),
+        max_bytes=max_bytes,
+        config_fingerprint=fingerprint or {"asr": {"compute_type": "int8"}}
+    )
+
+
+def _entry(profile="accurate"):
+    return {"transcript": "hello", "asr_profile": profile, "duration_sec": 5.0}
+
+
+# --------------------------------------------------
+# KEYS
+# --------------------------------------------------
+def test_key_covers_content_and_config(tmp_path):
+    cache = _cache(tmp_path)
+    content_hash = cache.hash_stream(io.BytesIO(b"audio"))
+
+    assert cache.key(content_hash) == cache.key(cache.hash_stream(io.BytesIO(b"audio")))
+    assert cache.key(content_hash) != cache.key(cache.hash_stream(io.BytesIO(b"other")))
+    assert cache.key(content_hash) != _cache(
+        tmp_path, asr={"compute_type": "float32"}
+    ).key(content_hash)
+
+
+def test_hash_stream_leaves_the_stream_rewound(tmp_path):
+    stream = io.BytesIO(b"audio")
+    _cache(tmp_path).hash_stream(stream)
+
+    assert stream.read() == b"audio"
+
+
+# --------------------------------------------------
+# PROFILES
+# --------------------------------------------------
+def test_transcript_below_the_selected_profile_is_not_reused():
+    assert transcript_reusable("accurate", "accurate", "fast")
+    assert transcript_reusable("fast", "fast", "fast")
+    assert transcript_reusable("accurate", "fast", "fast")
+    assert not transcript_reusable("fast", "accurate", "fast")
+
+
+def test_rejected_entry_counts_as_a_miss(tmp_path):
+    cache = _cache(tmp_path)
+    key = cache.key("content")
+    cache.put(key, _entry("fast"))
+
+    assert cache.get(key, accept=lambda entry: entry["asr_profile"] == "accurate") is None
+    assert cache.get(key) == _entry("fast")
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["hits"] == 1
+
+
+# --------------------------------------------------
+# EVICTION
+# --------------------------------------------------
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    entry_size = len(b'{"transcript": "hello", "asr_profile": "accurate", "duration_sec": 5.0}')
+    cache = _cache(tmp_path, max_bytes=3 * entry_size)
+    keys = [cache.key(str(i)) for i in range(4)]
+
+    for i, key in enumerate(keys):
+        cache.put(key, _entry())
+        # Distinct, increasing mtimes
+        os.utime(cache._path(key), (time.time() - 60 + i, time.time() - 60 + i))
+
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[-1]) == _entry()
+    assert cache.stats()["bytes"] <= cache.max_bytes
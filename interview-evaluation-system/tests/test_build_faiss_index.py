@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+faiss = pytest.importorskip("faiss")
+pytest.importorskip("sentence_transformers")
+
+from scripts.build_faiss_index import write_flat_index
+
+
+def test_flat_index_written_from_disk_matches_faiss(tmp_path):
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((1000, 16)).astype(np.float32)
+    faiss.normalize_L2(vectors)
+
+    embeddings = np.lib.format.open_memmap(
+        tmp_path / "doc_embeddings.npy", mode="w+", dtype=np.float32, shape=vectors.shape
+    )
+    embeddings[:] = vectors
+    embeddings.flush()
+
+    path = tmp_path / "faiss_index.bin"
+    assert write_flat_index(embeddings, path, rows_per_write=64)
+
+    expected = faiss.IndexFlatIP(16)
+    expected.add(vectors)
+    assert path.read_bytes() == faiss.serialize_index(expected).tobytes()
+
+    index = faiss.read_index(str(path))
+    _, found = index.search(vectors[:5], 1)
+    assert found[:, 0].tolist() == [0, 1, 2, 3, 4]
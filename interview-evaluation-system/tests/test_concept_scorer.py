@@ -0,0 +1,37 @@
+from core.models.keyword.regex_concept_scorer import RegexConceptScorer
+
+CONCEPTS = ["time domain", "frequency domain", "C++"]
+
+
+def test_concepts_match_whole_words_case_insensitively():
+    scorer = RegexConceptScorer()
+
+    assert scorer.matched_concepts(
+        "It maps the Time Domain to the frequency-domain", CONCEPTS
+    ) == ["time domain"]
+    assert scorer.score("timedomain and frequency domains", CONCEPTS) == 0.0
+    assert scorer.score("", CONCEPTS) == 0.0
+    assert scorer.score("anything", []) == 0.0
+
+
+def test_compiled_patterns_score_like_score():
+    scorer = RegexConceptScorer()
+    patterns = scorer.compile(CONCEPTS)
+    answers = [
+        "It maps the time domain to the frequency domain",
+        "Written in C++ for the TIME DOMAIN",
+        "unrelated",
+        ""
+    ]
+
+    for answer in answers:
+        assert scorer.score_compiled(answer, patterns) == scorer.score(answer, CONCEPTS)
+    assert scorer.score_compiled("time domain", []) == 0.0
+
+
+def test_score_many_matches_score_in_input_order():
+    scorer = RegexConceptScorer()
+    answers = ["frequency domain", "time domain and frequency domain", "none"]
+
+    assert scorer.score_many(answers, CONCEPTS) == [scorer.score(a, CONCEPTS) for a in answers]
+    assert scorer.score_many([], CONCEPTS) == []
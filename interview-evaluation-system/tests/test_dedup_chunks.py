@@ -0,0 +1,63 @@
+import json
+
+import pytest
+
+from scripts.dedup_chunks import dedup_chunks, dedup_file
+
+BASE_TEXT = (
+    "The Fourier transform decomposes a signal into its constituent "
+    "frequencies and is widely used in signal processing, filtering, "
+    "spectral analysis and the design of communication systems"
+)
+
+
+def _chunk(chunk_id, text):
+    return {"chunk_id": chunk_id, "text": text}
+
+
+def test_near_duplicates_keep_the_earliest_chunk():
+    chunks = [
+        _chunk("a", BASE_TEXT),
+        _chunk("b", "Sampling converts a continuous time signal into a discrete sequence of values"),
+        _chunk("c", BASE_TEXT + " today"),
+        _chunk("d", BASE_TEXT)
+    ]
+
+    kept, report = dedup_chunks(chunks)
+
+    assert [c["chunk_id"] for c in kept] == ["a", "b"]
+    assert report["chunks_before"] == 4
+    assert report["chunks_removed"] == 2
+    assert report["chars_removed"] == len(BASE_TEXT) * 2 + len(" today")
+
+
+def test_distinct_and_short_chunks_are_kept():
+    chunks = [_chunk(str(i), text) for i, text in enumerate(["one", "two words", BASE_TEXT, ""])]
+
+    kept, report = dedup_chunks(chunks)
+
+    assert kept == chunks
+    assert report["chunks_removed"] == 0
+
+
+def test_dedup_file_writes_a_new_file(tmp_path):
+    source = tmp_path / "corpus_chunks.json"
+    source.write_text(json.dumps([_chunk("a", BASE_TEXT), _chunk("b", BASE_TEXT)]))
+    output = tmp_path / "corpus_chunks.dedup.json"
+
+    dedup_file(source, output, index_path=tmp_path / "faiss_index.bin")
+
+    assert len(json.loads(source.read_text())) == 2
+    assert [c["chunk_id"] for c in json.loads(output.read_text())] == ["a"]
+
+
+def test_dedup_file_refuses_to_rewrite_an_indexed_corpus(tmp_path):
+    source = tmp_path / "corpus_chunks.json"
+    source.write_text(json.dumps([_chunk("a", BASE_TEXT), _chunk("b", BASE_TEXT)]))
+    index = tmp_path / "faiss_index.bin"
+    index.write_bytes(b"index")
+
+    with pytest.raises(ValueError):
+        dedup_file(source, source, index_path=index)
+
+    assert len(json.loads(source.read_text())) == 2
@@ -0,0 +1,28 @@
+import io
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+pytest.importorskip("librosa")
+
+from core.models.audio.dsp_pool import DSPProcessPool
+
+
+def test_pool_is_replaced_after_a_worker_dies():
+    pool = DSPProcessPool(workers=1)
+    try:
+        # A worker dying breaks the whole executor
+        with pytest.raises(BrokenProcessPool):
+            pool._executor.submit(os._exit, 1).result(timeout=60)
+
+        # The next request is served by a new executor
+        pending = pool.submit(io.BytesIO(b"not audio"))
+        with pytest.raises(Exception) as error:
+            pending.result(timeout=60)
+
+        assert not isinstance(error.value, BrokenProcessPool)
+        assert pool.stats()["restarts"] == 1
+        assert pool.stats()["in_flight"] == 0
+    finally:
+        pool.shutdown()
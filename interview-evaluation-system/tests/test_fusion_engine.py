@@ -0,0 +1,30 @@
+from core.models.fusion.weighted_fusion import WeightedFusionEngine
+
+WEIGHTS = {"semantic": 0.6, "keyword": 0.25, "evidence": 0.15}
+
+
+def test_fuse_scales_the_weighted_sum_to_ten():
+    result = WeightedFusionEngine(WEIGHTS).fuse({"semantic": 1.0, "keyword": 0.5})
+
+    assert result["final_score"] == 7.25
+    assert result["verdict"] == "Good"
+    assert result["breakdown"] == {"semantic": 1.0, "keyword": 0.5}
+
+
+def test_verdict_thresholds_are_inclusive():
+    engine = WeightedFusionEngine({"semantic": 1.0})
+
+    assert [engine.fuse({"semantic": s})["verdict"] for s in (0.8, 0.6, 0.4, 0.39)] == [
+        "Excellent", "Good", "Fair", "Poor"
+    ]
+
+
+def test_fuse_many_matches_fuse_exactly():
+    engine = WeightedFusionEngine(WEIGHTS)
+    scores = [
+        {"semantic": 0.1 * i, "keyword": 1 - 0.07 * i, "evidence": (i % 3) / 3}
+        for i in range(11)
+    ] + [{}, {"keyword": 0.3}]
+
+    assert engine.fuse_many(scores) == [engine.fuse(item) for item in scores]
+    assert engine.fuse_many([]) == []
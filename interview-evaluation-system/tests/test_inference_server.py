@@ -0,0 +1,149 @@
+import os
+import threading
+import time
+from multiprocessing import AuthenticationError
+
+import numpy as np
+import pytest
+
+pytest.importorskip("faiss")
+
+from core.models.remote.inference_client import InferenceClient
+from core.models.remote.inference_server import EncoderBatcher, InferenceServer
+
+AUTHKEY = b"test-key"
+
+
+class _Model:
+    """
+    Encodes a text as [len(text), normalize] and records each call.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, batch_size, convert_to_numpy, normalize_embeddings):
+        self.calls.append(list(texts))
+        return np.array([[len(t), normalize_embeddings] for t in texts], dtype=np.float32)
+
+
+class _SlowASR:
+    def transcribe(self, audio_path):
+        time.sleep(0.3)
+        return f"transcript of {audio_path}"
+
+
+@pytest.fixture
+def server(tmp_path_factory):
+    # Short path: Unix socket paths are limited to ~100 bytes
+    address = str(tmp_path_factory.mktemp("inference") / "inference.sock")
+    model = _Model()
+    instance = InferenceServer(
+        address=address,
+        authkey=AUTHKEY,
+        encoders={"m": EncoderBatcher(model, max_wait_ms=1.0)},
+        asr=_SlowASR()
+    )
+    threading.Thread(target=instance.serve_forever, daemon=True).start()
+
+    deadline = time.monotonic() + 5
+    while not os.path.exists(address) and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    return address, model
+
+
+# --------------------------------------------------
+# ROUND TRIP
+# --------------------------------------------------
+def test_encode_round_trip(server):
+    address, model = server
+    client = InferenceClient(address, authkey=AUTHKEY)
+
+    embeddings = client.encode("m", ["ab", "abcd", "ab"], normalize=False)
+
+    assert embeddings.tolist() == [[2, 0], [4, 0], [2, 0]]
+    assert model.calls == [["ab", "abcd"]]
+    client.close()
+
+
+def test_server_errors_are_raised_in_the_client(server):
+    address, _ = server
+    client = InferenceClient(address, authkey=AUTHKEY)
+
+    with pytest.raises(ValueError, match="Encoder not loaded"):
+        client.encode("other", ["text"])
+    with pytest.raises(ValueError, match="Unknown inference method"):
+        client.call("nope")
+    client.close()
+
+
+# --------------------------------------------------
+# AUTHENTICATION AND TIMEOUTS
+# --------------------------------------------------
+def test_wrong_authkey_is_rejected_and_the_server_keeps_serving(server):
+    address, _ = server
+
+    with pytest.raises(AuthenticationError):
+        InferenceClient(address, authkey=b"wrong").encode("m", ["text"])
+
+    client = InferenceClient(address, authkey=AUTHKEY)
+    assert client.encode("m", ["text"]).shape == (1, 2)
+    client.close()
+
+
+def test_slow_call_times_out_without_blocking_the_connection(server):
+    address, _ = server
+    client = InferenceClient(address, authkey=AUTHKEY)
+
+    with pytest.raises(TimeoutError):
+        client.call("transcribe", timeout_sec=0.05, audio_path="a.wav")
+
+    # Other requests on the same connection are not held up
+    assert client.encode("m", ["text"]).shape == (1, 2)
+    assert client.call("transcribe", timeout_sec=5, audio_path="b.wav") == "transcript of b.wav"
+    assert client._pending == {}
+    client.close()
+
+
+# --------------------------------------------------
+# MICRO-BATCHING
+# --------------------------------------------------
+def test_concurrent_requests_are_encoded_in_one_batch():
+    model = _Model()
+    batcher = EncoderBatcher(model, max_batch_texts=100, max_wait_ms=200.0)
+    replies = {}
+    done = threading.Event()
+
+    def reply_for(name):
+        def reply(error, result):
+            replies[name] = (error, result)
+            if len(replies) == 3:
+                done.set()
+        return reply
+
+    batcher.submit(["a", "bb"], True, reply_for("first"))
+    batcher.submit(["bb"], True, reply_for("second"))
+    batcher.submit(["ccc"], True, reply_for("third"))
+
+    assert done.wait(5)
+    batcher.close()
+
+    assert model.calls == [["a", "bb", "ccc"]]
+    assert replies["first"][1][:, 0].tolist() == [1, 2]
+    assert replies["second"][1][:, 0].tolist() == [2]
+    assert batcher.stats()["avg_requests_per_batch"] == 3
+
+
+def test_batch_is_cut_at_max_batch_texts():
+    model = _Model()
+    batcher = EncoderBatcher(model, max_batch_texts=2, max_wait_ms=200.0)
+    done = threading.Semaphore(0)
+
+    for text in ("a", "bb", "ccc"):
+        batcher.submit([text], False, lambda error, result: done.release())
+    for _ in range(3):
+        assert done.acquire(timeout=5)
+    batcher.close()
+
+    assert model.calls == [["a", "bb"], ["ccc"]]
@@ -0,0 +1,100 @@
+import pytest
+
+from core.utils.metrics import Counter, Gauge, Histogram, MetricsRegistry
+
+
+def _registry(*metrics):
+    registry = MetricsRegistry()
+    for metric in metrics:
+        registry.register(metric)
+    return registry
+
+
+# --------------------------------------------------
+# HISTOGRAMS
+# --------------------------------------------------
+def test_bucket_upper_bounds_are_inclusive():
+    histogram = Histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+
+    for value in (0.1, 0.5, 1.0, 1.5):
+        histogram.observe(value)
+
+    assert histogram.render()[2:] == [
+        'latency_seconds_bucket{le="0.1"} 1',
+        'latency_seconds_bucket{le="1"} 3',
+        'latency_seconds_bucket{le="+Inf"} 4',
+        "latency_seconds_sum 3.1",
+        "latency_seconds_count 4"
+    ]
+
+
+def test_buckets_are_sorted():
+    histogram = Histogram("latency_seconds", "Latency.", buckets=(1.0, 0.1))
+    histogram.observe(0.05)
+
+    assert histogram.render()[2] == 'latency_seconds_bucket{le="0.1"} 1'
+
+
+# --------------------------------------------------
+# LABELS
+# --------------------------------------------------
+def test_labels_must_match_the_declared_names():
+    counter = Counter("requests_total", "Requests.", ["route"])
+
+    with pytest.raises(ValueError):
+        counter.inc()
+    with pytest.raises(ValueError):
+        counter.inc(route="/a", method="GET")
+
+
+def test_label_values_are_escaped():
+    gauge = Gauge("info", "Info.", ["name"])
+    gauge.set(1, name='a "quoted"\\path\nline')
+
+    assert gauge.render()[2] == 'info{name="a \\"quoted\\"\\\\path\\nline"} 1'
+
+
+def test_registry_rejects_duplicate_names():
+    registry = _registry(Counter("requests_total", "Requests."))
+
+    with pytest.raises(ValueError):
+        registry.register(Counter("requests_total", "Again."))
+
+
+# --------------------------------------------------
+# RENDERING
+# --------------------------------------------------
+def test_registry_renders_prometheus_text():
+    counter = Counter("requests_total", "Requests.", ["route"])
+    gauge = Gauge("hit_ratio", "Hit ratio.", ["cache"])
+    registry = _registry(counter, gauge)
+
+    counter.inc(route="/b")
+    counter.inc(2, route="/a")
+    gauge.set_function(lambda: 0.25, cache="results")
+    gauge.set_function(lambda: 1 / 0, cache="broken")
+
+    assert registry.render() == (
+        "# HELP requests_total Requests.\n"
+        "# TYPE requests_total counter\n"
+        'requests_total{route="/a"} 2\n'
+        'requests_total{route="/b"} 1\n'
+        "# HELP hit_ratio Hit ratio.\n"
+        "# TYPE hit_ratio gauge\n"
+        'hit_ratio{cache="results"} 0.25\n'
+    )
+
+
+def test_const_labels_prefix_every_series():
+    histogram = Histogram("latency_seconds", "Latency.", ["stage"], buckets=(1.0,))
+    registry = _registry(histogram)
+    registry.set_const_labels(worker=2, pid=42)
+
+    histogram.observe(0.5, stage="asr")
+
+    assert registry.render().splitlines()[2:] == [
+        'latency_seconds_bucket{worker="2",pid="42",stage="asr",le="1"} 1',
+        'latency_seconds_bucket{worker="2",pid="42",stage="asr",le="+Inf"} 1',
+        'latency_seconds_sum{worker="2",pid="42",stage="asr"} 0.5',
+        'latency_seconds_count{worker="2",pid="42",stage="asr"} 1'
+    ]
@@ -0,0 +1,345 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("sentence_transformers")
+pytest.importorskip("faiss")
+
+from core.orchestration.interview_orchestrator import InterviewOrchestrator, StageTimeout
+
+
+def _orchestrator(stage_timeouts, max_workers=1):
+    orchestrator = object.__new__(InterviewOrchestrator)
+    orchestrator.concurrent_stages = True
+    orchestrator.stage_pool = ThreadPoolExecutor(max_workers=max_workers)
+    orchestrator.stage_timeouts = stage_timeouts
+    return orchestrator
+
+
+def _occupy(pool, seconds):
+    """
+    Keep the pool's only thread busy, as another request would.
+    """
+    release = threading.Event()
+    pool.submit(release.wait, seconds)
+    return release
+
+
+# --------------------------------------------------
+# STAGE TIMEOUTS
+# --------------------------------------------------
+def test_queue_time_does_not_count_against_the_stage_timeout():
+    orchestrator = _orchestrator({"keyword": 0.2})
+    _occupy(orchestrator.stage_pool, 0.4)
+
+    outputs, timings, timed_out = orchestrator._run_stages({"keyword": lambda: 0.5})
+
+    assert outputs == {"keyword": 0.5}
+    assert timed_out == []
+    assert timings["keyword"] < 0.2
+
+
+def test_slow_required_stage_raises():
+    orchestrator = _orchestrator({"keyword": 0.05})
+
+    with pytest.raises(StageTimeout):
+        orchestrator._run_stages({"keyword": lambda: time.sleep(0.3)})
+
+
+def test_slow_optional_stage_degrades():
+    orchestrator = _orchestrator({"evidence": 0.05}, max_workers=2)
+
+    outputs, timings, timed_out = orchestrator._run_stages({
+        "keyword": lambda: 0.5,
+        "evidence": lambda: time.sleep(0.3)
+    })
+
+    assert outputs == {"keyword": 0.5, "evidence": None}
+    assert timed_out == ["evidence"]
+    assert timings["evidence"] >= 0.05
+
+
+def test_explicit_empty_timeouts_disable_them():
+    orchestrator = _orchestrator({"keyword": 0.01})
+
+    outputs, _, timed_out = orchestrator._run_stages(
+        {"keyword": lambda: time.sleep(0.05) or 0.5},
+        timeouts={}
+    )
+
+    assert outputs == {"keyword": 0.5}
+    assert timed_out == []
+
+
+def test_async_queue_time_does_not_count_against_the_stage_timeout():
+    orchestrator = _orchestrator({"keyword": 0.2})
+    _occupy(orchestrator.stage_pool, 0.4)
+
+    outputs, _, timed_out = asyncio.run(
+        orchestrator._run_stages_async({"keyword": lambda: 0.5})
+    )
+
+    assert outputs == {"keyword": 0.5}
+    assert timed_out == []
+
+
+def test_async_slow_stages_time_out_from_their_start():
+    orchestrator = _orchestrator({"keyword": 0.05, "evidence": 0.05}, max_workers=2)
+
+    outputs, _, timed_out = asyncio.run(
+        orchestrator._run_stages_async({"evidence": lambda: time.sleep(0.3)})
+    )
+    assert outputs == {"evidence": None}
+    assert timed_out == ["evidence"]
+
+    with pytest.raises(StageTimeout):
+        asyncio.run(orchestrator._run_stages_async({"keyword": lambda: time.sleep(0.3)}))
+
+
+# --------------------------------------------------
+# RESULT CACHE
+# --------------------------------------------------
+def test_sequential_evaluate_async_looks_the_cache_up_once():
+    from core.orchestration.pipeline_builder import PipelineConfig
+    from core.utils.result_cache import EvaluationResultCache
+
+    orchestrator = _orchestrator({})
+    orchestrator.concurrent_stages = False
+    orchestrator.pipeline = PipelineConfig()
+    orchestrator.result_cache = EvaluationResultCache(fingerprint={})
+    orchestrator._evaluate_uncached = lambda cache_key, *args: orchestrator._store_result(
+        cache_key, {"final_score": 0.5, "timed_out_stages": []}
+    )
+
+    first = asyncio.run(orchestrator.evaluate_async("q1", "answer"))
+    assert orchestrator.result_cache.stats()["misses"] == 1
+
+    second = asyncio.run(orchestrator.evaluate_async("q1", "answer"))
+    assert orchestrator.result_cache.stats()["hits"] == 1
+    assert orchestrator.result_cache.stats()["misses"] == 1
+    assert second["final_score"] == first["final_score"]
+    assert second["student_answer"] == "answer"
+
+
+def test_cache_io_runs_off_the_event_loop():
+    from core.orchestration.pipeline_builder import PipelineConfig
+    from core.utils.result_cache import EvaluationResultCache
+
+    threads = []
+
+    class _RecordingCache(EvaluationResultCache):
+        def get(self, key):
+            threads.append(threading.current_thread())
+            return super().get(key)
+
+        def put(self, key, result):
+            threads.append(threading.current_thread())
+            super().put(key, result)
+
+    orchestrator = _orchestrator({})
+    orchestrator.pipeline = PipelineConfig()
+    orchestrator.result_cache = _RecordingCache(fingerprint={})
+    orchestrator._plan_stages = lambda *args: (None, {"keyword": lambda: 0.5})
+    orchestrator._fuse = lambda question, answer, outputs, *args: {
+        "final_score": outputs["keyword"], "timed_out_stages": []
+    }
+
+    async def evaluate():
+        loop_thread = threading.current_thread()
+        await orchestrator.evaluate_async("q1", "answer")
+        await orchestrator.evaluate_async("q1", "answer")
+        return loop_thread
+
+    loop_thread = asyncio.run(evaluate())
+
+    assert len(threads) == 3  # miss, store, hit
+    assert loop_thread not in threads
+
+
+# --------------------------------------------------
+# BATCHES
+# --------------------------------------------------
+class _Question:
+    def __init__(self, question_id):
+        from types import SimpleNamespace
+        self.question_id = question_id
+        self.question_text = "What is a transform?"
+        self.ideal_answers = [SimpleNamespace(
+            text="It maps a signal to the frequency domain",
+            key_concepts=[SimpleNamespace(concept="frequency")]
+        )]
+
+
+class _ConceptScorer:
+    def score(self, answer, key_concepts):
+        return self.score_many([answer], key_concepts)[0]
+
+    def score_many(self, answers, key_concepts):
+        return [1.0 if "frequency" in answer else 0.0 for answer in answers]
+
+
+class _FailingSemanticScorer:
+    def score_many(self, pairs):
+        raise RuntimeError("encoder unavailable")
+
+
+class _Bank:
+    def __init__(self, reference=None):
+        self.reference = reference
+
+    def reference_embedding(self, question_id):
+        return self.reference
+
+    def concept_patterns(self, question_id):
+        return None
+
+
+class _ReferenceScorer:
+    """
+    Scores against reference embeddings only, as the compiled bank
+    provides them.
+    """
+
+    def __init__(self):
+        self.references = []
+
+    def score_with_reference(self, answer, reference):
+        self.references.append(reference)
+        return reference[0] * len(answer.split()) / 10
+
+    def score_many_with_reference(self, answers, references):
+        return [self.score_with_reference(a, r) for a, r in zip(answers, references)]
+
+
+def _batch_orchestrator(concurrent_stages):
+    from core.models.fusion.weighted_fusion import WeightedFusionEngine
+    from core.orchestration.pipeline_builder import PipelineConfig
+
+    orchestrator = _orchestrator({"semantic": 0.01, "keyword": 0.01}, max_workers=2)
+    orchestrator.concurrent_stages = concurrent_stages
+    orchestrator.pipeline = PipelineConfig(min_answer_words=3)
+    orchestrator.active_stages = ["semantic", "keyword"]
+    orchestrator.question_map = {"q1": _Question("q1")}
+    orchestrator.question_bank = _Bank()
+    orchestrator.result_cache = None
+    orchestrator.semantic_scorer = _FailingSemanticScorer()
+    orchestrator.concept_scorer = _ConceptScorer()
+    orchestrator.fusion_engine = WeightedFusionEngine({"semantic": 0.5, "keyword": 0.5})
+    return orchestrator
+
+
+@pytest.mark.parametrize("concurrent_stages", [False, True])
+def test_failed_batch_stage_fails_only_its_items(concurrent_stages):
+    orchestrator = _batch_orchestrator(concurrent_stages)
+    items = [
+        {"question_id": "q1", "student_answer": "it shows the frequency content"},
+        {"question_id": "q1", "student_answer": "frequency"},
+        {"question_id": "nope", "student_answer": "anything at all here"}
+    ]
+
+    results = asyncio.run(orchestrator.evaluate_many_async(items))
+
+    assert "encoder unavailable" in results[0]["error"]
+    # Short answer: semantic scoring skipped, keyword still scored
+    assert results[1]["score_breakdown"]["keyword"] == 1.0
+    assert "semantic" in results[1]["skipped_stages"]
+    assert "Invalid question_id" in results[2]["error"]
+
+
+@pytest.mark.parametrize("concurrent_stages", [False, True])
+def test_batch_semantic_scores_match_single_evaluations(concurrent_stages):
+    orchestrator = _batch_orchestrator(concurrent_stages)
+    orchestrator.question_bank = _Bank(reference=[0.5])
+    orchestrator.semantic_scorer = _ReferenceScorer()
+    answer = "it shows the frequency content"
+
+    batch = asyncio.run(orchestrator.evaluate_many_async(
+        [{"question_id": "q1", "student_answer": answer}]
+    ))
+    single = orchestrator.evaluate("q1", answer)
+
+    assert orchestrator.semantic_scorer.references == [[0.5], [0.5]]
+    assert batch[0]["score_breakdown"]["semantic"] == single["score_breakdown"]["semantic"]
+
+
+def test_batches_ignore_stage_timeouts():
+    orchestrator = _batch_orchestrator(concurrent_stages=True)
+    orchestrator.semantic_scorer = None
+    orchestrator.active_stages = ["keyword"]
+    scorer = orchestrator.concept_scorer
+    orchestrator.concept_scorer = type("Slow", (), {
+        "score_many": lambda self, *args: time.sleep(0.05) or scorer.score_many(*args)
+    })()
+
+    results = asyncio.run(orchestrator.evaluate_many_async(
+        [{"question_id": "q1", "student_answer": "frequency"}]
+    ))
+
+    assert results[0]["score_breakdown"]["keyword"] == 1.0
+
+
+# --------------------------------------------------
+# SHORT-CIRCUITING
+# --------------------------------------------------
+class _CountingScorer:
+    def __init__(self, score):
+        self.calls = 0
+        self._score = score
+
+    def score(self, *args, **kwargs):
+        self.calls += 1
+        return self._score
+
+    def retrieve(self, *args, **kwargs):
+        self.calls += 1
+        return ["snippet"]
+
+
+def _short_circuit_orchestrator():
+    from core.models.fusion.weighted_fusion import WeightedFusionEngine
+    from core.orchestration.pipeline_builder import PipelineConfig
+
+    orchestrator = _orchestrator({}, max_workers=3)
+    orchestrator.pipeline = PipelineConfig(min_answer_words=3)
+    orchestrator.active_stages = ["semantic", "keyword", "evidence"]
+    orchestrator.question_map = {"q1": _Question("q1")}
+    orchestrator.result_cache = None
+    orchestrator.semantic_scorer = _CountingScorer(0.8)
+    orchestrator.concept_scorer = _CountingScorer(1.0)
+    orchestrator.retriever = _CountingScorer(None)
+    orchestrator.fusion_engine = WeightedFusionEngine({"semantic": 0.6, "keyword": 0.25, "evidence": 0.15})
+    return orchestrator
+
+
+@pytest.mark.parametrize("concurrent_stages", [False, True])
+def test_short_answers_skip_semantic_scoring_and_retrieval(concurrent_stages):
+    from core.orchestration.interview_orchestrator import QuestionAssets
+
+    orchestrator = _short_circuit_orchestrator()
+    orchestrator.concurrent_stages = concurrent_stages
+
+    result = orchestrator.evaluate("q1", "frequency", assets=QuestionAssets("q1"))
+
+    assert orchestrator.semantic_scorer.calls == 0
+    assert orchestrator.retriever.calls == 0
+    assert orchestrator.concept_scorer.calls == 1
+    assert result["skipped_stages"] == ["semantic", "evidence"]
+    assert result["score_breakdown"] == {"semantic": 0.0, "keyword": 1.0, "evidence": 0.0}
+
+
+def test_long_answers_run_every_active_stage():
+    from core.orchestration.interview_orchestrator import QuestionAssets
+
+    orchestrator = _short_circuit_orchestrator()
+    orchestrator.active_stages = ["semantic", "keyword"]
+
+    result = orchestrator.evaluate(
+        "q1", "it shows the frequency content", assets=QuestionAssets("q1")
+    )
+
+    assert orchestrator.semantic_scorer.calls == 1
+    assert orchestrator.retriever.calls == 0
+    assert result["skipped_stages"] == ["evidence"]
@@ -0,0 +1,62 @@
+from pathlib import Path
+
+from core.orchestration.pipeline_builder import PipelineConfig, load_pipeline_config
+
+CONFIG_DIR = Path(__file__).resolve().parent.parent / "config"
+
+WEIGHTS = {"semantic": 0.6, "keyword": 0.25, "evidence": 0.15}
+
+
+def test_defaults_run_every_text_stage():
+    config = PipelineConfig.from_dict({})
+
+    assert config.active_stages(WEIGHTS) == ["semantic", "keyword", "evidence"]
+    assert config.top_k == 5
+    assert not config.is_short("a")
+
+
+def test_disabled_and_zero_weight_stages_are_inactive():
+    config = PipelineConfig.from_dict({
+        "modules": {"retriever": {"enabled": False}}
+    })
+
+    assert config.active_stages(WEIGHTS) == ["semantic", "keyword"]
+    assert config.active_stages({**WEIGHTS, "semantic": 0.0}) == ["keyword"]
+    assert config.active_stages({"keyword": 1.0}) == ["keyword"]
+
+
+def test_module_settings_are_read():
+    config = PipelineConfig.from_dict({
+        "execution": {"mode": "multimodal_stub"},
+        "modules": {
+            "dsp": {"enabled": True},
+            "asr": {"enabled": True},
+            "semantic_scorer": {"model": "paraphrase-MiniLM-L3-v2"},
+            "retriever": {"top_k": "3"}
+        },
+        "short_circuit": {"min_answer_words": 4}
+    })
+
+    assert config.get_mode() == "multimodal_stub"
+    assert config.dsp_enabled and config.asr_enabled
+    assert config.semantic_model == "paraphrase-MiniLM-L3-v2"
+    assert config.top_k == 3
+    assert config.min_answer_words == 4
+
+
+def test_short_answers_are_counted_in_words():
+    config = PipelineConfig(min_answer_words=3)
+
+    assert config.is_short("too  short")
+    assert config.is_short("")
+    assert not config.is_short("long enough answer")
+
+
+def test_shipped_configs_load():
+    text_only = load_pipeline_config(str(CONFIG_DIR / "text_only.yaml"))
+    multimodal = load_pipeline_config(str(CONFIG_DIR / "multimodal_stub.yaml"))
+
+    assert text_only.get_mode() == "text_only"
+    assert not (text_only.dsp_enabled or text_only.asr_enabled)
+    assert multimodal.dsp_enabled and multimodal.asr_enabled
+    assert text_only.min_answer_words == multimodal.min_answer_words == 3
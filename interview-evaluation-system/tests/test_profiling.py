@@ -0,0 +1,68 @@
+import json
+import threading
+import time
+
+from core.utils.profiling import ProfilingController
+
+
+def _busy(seconds):
+    until = time.perf_counter() + seconds
+    while time.perf_counter() < until:
+        pass
+
+
+def _controller(tmp_path, **kwargs):
+    return ProfilingController(output_dir=str(tmp_path), interval_ms=1, **kwargs)
+
+
+# --------------------------------------------------
+# SHARED SAMPLER
+# --------------------------------------------------
+def test_concurrent_profiles_share_one_sampler_thread(tmp_path):
+    profiler = _controller(tmp_path)
+    profiler.arm(count=2)
+
+    with profiler.profile("q1"), profiler.profile("q2"):
+        _busy(0.05)
+        samplers = [t for t in threading.enumerate() if t.name == "stack-sampler"]
+
+    profiler.close()
+
+    assert len(samplers) == 1
+    sidecars = [json.loads(p.read_text()) for p in tmp_path.glob("*.json")]
+    assert sorted(s["question_id"] for s in sidecars) == ["q1", "q2"]
+    for sidecar in sidecars:
+        assert sidecar["samples"] > 0
+        assert str(threading.get_ident()) in sidecar["thread_samples"]
+
+
+def test_samples_stop_at_the_end_of_the_profile(tmp_path):
+    profiler = _controller(tmp_path)
+    profiler.arm(count=1)
+    session = profiler.maybe_start("q1")
+
+    _busy(0.02)
+    session.end()
+    samples = session.samples
+    _busy(0.02)
+
+    assert samples > 0
+    assert session.samples == samples
+
+
+# --------------------------------------------------
+# LIMITS
+# --------------------------------------------------
+def test_profiles_past_the_concurrency_cap_are_skipped(tmp_path):
+    profiler = _controller(tmp_path, max_concurrent=1)
+    profiler.arm(count=3)
+
+    with profiler.profile("q1"):
+        with profiler.profile("q2"):
+            assert profiler.status()["active"] == 1
+    profiler.close()
+
+    # The skipped evaluation did not use up an armed count
+    assert profiler.status()["remaining"] == 2
+    assert profiler.status()["active"] == 0
+    assert len(list(tmp_path.glob("*.json"))) == 1
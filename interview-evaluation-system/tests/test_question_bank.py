@@ -0,0 +1,123 @@
+import json
+import mmap
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from core.models.keyword.regex_concept_scorer import RegexConceptScorer
+from core.utils.data_loader import QuestionDataLoader
+from core.utils.question_bank import (
+    CompiledQuestionBank,
+    StaleQuestionBank,
+    compile_question_bank,
+    load_question_bank
+)
+
+QUESTIONS_PATH = Path(__file__).resolve().parent.parent / "data" / "questions" / "questions.json"
+
+
+class _Encoder:
+    model_name = "fake-encoder"
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode_reference(self, text):
+        self.calls += 1
+        return np.full(4, len(text), dtype=np.float32)
+
+
+@pytest.fixture
+def questions_path(tmp_path):
+    return Path(shutil.copy(QUESTIONS_PATH, tmp_path / "questions.json"))
+
+
+# --------------------------------------------------
+# ROUND TRIP
+# --------------------------------------------------
+def test_compiled_bank_matches_the_source(questions_path, tmp_path):
+    artifact = str(tmp_path / "questions.bank")
+    compile_question_bank(
+        str(questions_path),
+        artifact,
+        semantic_scorer=_Encoder(),
+        concept_scorer=RegexConceptScorer()
+    )
+
+    bank = CompiledQuestionBank(artifact)
+    source = QuestionDataLoader(str(questions_path)).load()
+
+    assert bank.questions == source
+    for question in source:
+        assert bank.question_map[question.question_id] == question
+        assert bank.reference_embedding(question.question_id)[0] == len(question.ideal_answers[0].text)
+        assert [p.pattern for p in bank.concept_patterns(question.question_id)] == [
+            p.pattern for p in RegexConceptScorer().compile(
+                [kc.concept for kc in question.ideal_answers[0].key_concepts]
+            )
+        ]
+
+
+def test_records_are_parsed_on_first_lookup(questions_path, tmp_path):
+    artifact = str(tmp_path / "questions.bank")
+    compile_question_bank(str(questions_path), artifact)
+    question_id = json.loads(questions_path.read_text())[0]["question_id"]
+
+    bank = CompiledQuestionBank(artifact)
+
+    assert question_id in bank.question_map
+    assert bank.question_map._parsed == {}
+    assert bank.question_map[question_id] is bank.question_map[question_id]
+    assert "missing" not in bank.question_map
+
+
+def test_embeddings_are_mapped_read_only(questions_path, tmp_path):
+    artifact = str(tmp_path / "questions.bank")
+    compile_question_bank(str(questions_path), artifact, semantic_scorer=_Encoder())
+
+    bank = CompiledQuestionBank(artifact)
+    answers = sum(len(q["ideal_answers"]) for q in json.loads(questions_path.read_text()))
+
+    # The matrix is a view of the mapping, not a copy
+    base = bank.embeddings
+    while isinstance(base, np.ndarray):
+        base = base.base
+    assert isinstance(base, memoryview) and base.obj is bank._mmap
+    assert isinstance(bank._mmap, mmap.mmap)
+    assert bank.embeddings.shape == (answers, 4)
+    assert not bank.embeddings.flags.writeable
+
+
+# --------------------------------------------------
+# INVALIDATION
+# --------------------------------------------------
+def test_changed_source_is_recompiled(questions_path):
+    encoder = _Encoder()
+    load_question_bank(str(questions_path), semantic_scorer=encoder)
+    compiled = encoder.calls
+
+    load_question_bank(str(questions_path), semantic_scorer=encoder)
+    assert encoder.calls == compiled
+
+    raw = json.loads(questions_path.read_text())
+    raw[0]["question_text"] += " Give an example."
+    questions_path.write_text(json.dumps(raw))
+
+    bank = load_question_bank(str(questions_path), semantic_scorer=encoder)
+    assert encoder.calls == 2 * compiled
+    assert bank.question_map[raw[0]["question_id"]].question_text.endswith("Give an example.")
+
+
+def test_stale_bank_fails_when_compiling_is_not_allowed(questions_path):
+    encoder = _Encoder()
+
+    with pytest.raises(StaleQuestionBank):
+        load_question_bank(str(questions_path), semantic_scorer=encoder, compile_stale=False)
+    assert encoder.calls == 0
+
+    load_question_bank(str(questions_path), semantic_scorer=encoder)
+    assert load_question_bank(
+        str(questions_path), semantic_scorer=encoder, compile_stale=False
+    ).semantic_model == "fake-encoder"
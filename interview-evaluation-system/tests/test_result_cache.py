@@ -0,0 +1,93 @@
+import os
+import time
+
+from core.utils.result_cache import EvaluationResultCache
+
+
+def _cache(tmp_path=None, **kwargs):
+    return EvaluationResultCache(
+        fingerprint={"model": "m"},
+        disk_dir=str(tmp_path) if tmp_path is not None else None,
+        **kwargs
+    )
+
+
+# --------------------------------------------------
+# KEYS
+# --------------------------------------------------
+def test_key_covers_the_exact_answer_text():
+    cache = _cache()
+
+    assert cache.key("q1", "machine learning") == cache.key("q1", "machine learning")
+    assert cache.key("q1", "machine  learning") != cache.key("q1", "machine learning")
+    assert cache.key("q1", " machine learning") != cache.key("q1", "machine learning")
+
+
+def test_key_covers_question_options_and_fingerprint():
+    cache = _cache()
+    key = cache.key("q1", "answer", top_k_evidence=5)
+
+    assert cache.key("q2", "answer", top_k_evidence=5) != key
+    assert cache.key("q1", "answer", top_k_evidence=3) != key
+    assert EvaluationResultCache(fingerprint={"model": "other"}).key(
+        "q1", "answer", top_k_evidence=5
+    ) != key
+
+
+# --------------------------------------------------
+# LOOKUPS
+# --------------------------------------------------
+def test_get_returns_a_copy_and_counts_hits_and_misses():
+    cache = _cache()
+    key = cache.key("q1", "answer")
+
+    assert cache.get(key) is None
+    cache.put(key, {"score": 0.5})
+    result = cache.get(key)
+    result["score"] = 1.0
+
+    assert cache.get(key) == {"score": 0.5}
+    assert cache.stats()["hits"] == 2
+    assert cache.stats()["misses"] == 1
+
+
+def test_disk_tier_survives_a_restart(tmp_path):
+    key = _cache(tmp_path).key("q1", "answer")
+    _cache(tmp_path).put(key, {"score": 0.5})
+
+    assert _cache(tmp_path).get(key) == {"score": 0.5}
+
+
+def test_disk_tier_is_pruned_oldest_first_past_its_cap(tmp_path):
+    cache = _cache(tmp_path, max_disk_mb=0.01)
+    keys = [cache.key("q1", f"answer {i}") for i in range(60)]
+
+    for i, key in enumerate(keys):
+        cache.put(key, {"feedback": "x" * 300})
+        # Distinct, increasing mtimes
+        os.utime(cache._path(key), (time.time() - 60 + i, time.time() - 60 + i))
+
+    files = list(cache.disk_dir.glob("*/*.json"))
+    assert sum(path.stat().st_size for path in files) <= cache.max_disk_bytes
+    assert cache._path(keys[-1]).exists()
+    assert not cache._path(keys[0]).exists()
+
+
+def test_expired_disk_entries_are_pruned_on_startup(tmp_path):
+    cache = _cache(tmp_path, ttl_sec=60)
+    key = cache.key("q1", "answer")
+    cache.put(key, {"score": 0.5})
+    os.utime(cache._path(key), (time.time() - 120, time.time() - 120))
+
+    _cache(tmp_path, ttl_sec=60)
+
+    assert not cache._path(key).exists()
+
+
+def test_answers_are_not_stored(tmp_path):
+    cache = _cache(tmp_path)
+    key = cache.key("q1", "my private answer")
+    cache.put(key, {"score": 0.5, "student_answer": "my private answer"})
+
+    assert "my private answer" not in cache._path(key).read_text()
+    assert cache.get(key) == {"score": 0.5}
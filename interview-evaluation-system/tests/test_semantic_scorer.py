@@ -0,0 +1,76 @@
+import hashlib
+
+import numpy as np
+import pytest
+
+pytest.importorskip("sentence_transformers")
+
+from core.models.semantic.sbert_scorer import SBERTSemanticScorer
+
+
+class _Model:
+    """
+    Deterministic stand-in for SentenceTransformer.encode.
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def encode(self, texts, convert_to_numpy=True, normalize_embeddings=False, batch_size=32):
+        self.calls += 1
+        single = isinstance(texts, str)
+        vectors = np.array([
+            np.frombuffer(hashlib.sha256(text.encode()).digest()[:16], dtype=np.uint8) - 127.5
+            for text in ([texts] if single else texts)
+        ], dtype=np.float32)
+        if normalize_embeddings:
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors[0] if single else vectors
+
+
+def _scorer():
+    scorer = object.__new__(SBERTSemanticScorer)
+    scorer.model_name = "fake"
+    scorer.model = _Model()
+    return scorer
+
+
+PAIRS = [
+    ("the fourier transform", "it maps time to frequency"),
+    ("sampling", "it maps time to frequency"),
+    ("", "it maps time to frequency"),
+    ("the fourier transform", "")
+]
+
+
+def test_score_many_matches_reference_scoring():
+    scorer = _scorer()
+
+    expected = [
+        scorer.score_with_reference(student, scorer.encode_reference(ideal)) if ideal else 0.0
+        for student, ideal in PAIRS
+    ]
+
+    assert scorer.score_many(PAIRS) == pytest.approx(expected)
+    assert all(0.0 <= score <= 1.0 for score in expected)
+
+
+def test_score_many_encodes_once():
+    scorer = _scorer()
+    scorer.score_many(PAIRS)
+
+    assert scorer.model.calls == 1
+    assert scorer.score_many([("", "")]) == [0.0]
+    assert scorer.model.calls == 1
+
+
+def test_score_many_with_reference_matches_score_with_reference():
+    scorer = _scorer()
+    reference = scorer.encode_reference("it maps time to frequency")
+    answers = ["the fourier transform", "", "sampling"]
+
+    scores = scorer.score_many_with_reference(answers, [reference, reference, None])
+
+    assert scores == pytest.approx([
+        scorer.score_with_reference("the fourier transform", reference), 0.0, 0.0
+    ])
@@ -0,0 +1,120 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("sentence_transformers")
+pytest.importorskip("faiss")
+
+from core.orchestration.session_manager import SessionManager
+
+
+class _Orchestrator:
+    def __init__(self, fail_first=0):
+        self.question_map = {"q1": object(), "q2": object()}
+        self.stage_pool = ThreadPoolExecutor(max_workers=1)
+        self.prefetches = 0
+        self._fail_first = fail_first
+
+    def prefetch(self, question_id, pool_size):
+        self.prefetches += 1
+        if self.prefetches <= self._fail_first:
+            raise RuntimeError("encoder unavailable")
+        return (question_id, pool_size)
+
+
+def _result(question_id, score, verdict):
+    return {"question_id": question_id, "final_score": score, "verdict": verdict}
+
+
+# --------------------------------------------------
+# SESSIONS
+# --------------------------------------------------
+def test_idle_sessions_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("core.orchestration.session_manager.time.time", lambda: now[0])
+    sessions = SessionManager(_Orchestrator(), ttl_sec=60)
+
+    idle = sessions.create()
+    active = sessions.create()
+    now[0] += 40
+    sessions.get(active.session_id)
+    now[0] += 40
+
+    with pytest.raises(KeyError):
+        sessions.get(idle.session_id)
+    assert sessions.get(active.session_id) is active
+    assert sessions.stats()["expired"] == 1
+
+
+def test_least_recently_used_sessions_are_evicted():
+    sessions = SessionManager(_Orchestrator(), max_sessions=2)
+
+    first = sessions.create()
+    second = sessions.create()
+    sessions.get(first.session_id)
+    sessions.create()
+
+    with pytest.raises(KeyError):
+        sessions.get(second.session_id)
+    assert sessions.get(first.session_id) is first
+    assert sessions.stats() == {"sessions": 2, "question_assets": 0, "evicted": 1, "expired": 0}
+
+
+# --------------------------------------------------
+# PREFETCH
+# --------------------------------------------------
+def test_question_assets_are_prefetched_once_and_shared():
+    orchestrator = _Orchestrator()
+    sessions = SessionManager(orchestrator, evidence_pool_size=7)
+
+    for _ in range(2):
+        sessions.serve_question(sessions.create().session_id, "q1")
+
+    assert sessions.assets("q1").result() == ("q1", 7)
+    assert orchestrator.prefetches == 1
+
+
+def test_failed_prefetch_is_retried():
+    orchestrator = _Orchestrator(fail_first=1)
+    sessions = SessionManager(orchestrator)
+
+    with pytest.raises(RuntimeError):
+        sessions.assets("q1").result()
+
+    assert sessions.assets("q1").result() == ("q1", 50)
+    assert orchestrator.prefetches == 2
+
+
+def test_unknown_question_is_rejected():
+    sessions = SessionManager(_Orchestrator())
+
+    with pytest.raises(ValueError):
+        sessions.serve_question(sessions.create().session_id, "nope")
+
+
+# --------------------------------------------------
+# REPORT
+# --------------------------------------------------
+def test_report_follows_serving_order_and_keeps_the_last_answer():
+    sessions = SessionManager(_Orchestrator())
+    session = sessions.create(candidate_id="c1")
+    sessions.serve_question(session.session_id, "q2")
+    sessions.serve_question(session.session_id, "q1")
+
+    sessions.record(session.session_id, _result("q2", 0.2, "Weak"))
+    sessions.record(session.session_id, _result("q2", 0.8, "Strong"))
+    report = sessions.report(session.session_id)
+
+    assert report["candidate_id"] == "c1"
+    assert report["questions_served"] == 2
+    assert report["questions_answered"] == 1
+    assert report["unanswered"] == ["q1"]
+    assert report["average_score"] == 0.8
+    assert report["verdict_counts"] == {"Strong": 1}
+
+    sessions.record(session.session_id, _result("q1", 0.4, "Weak"))
+    report = sessions.report(session.session_id)
+
+    assert [r["question_id"] for r in report["results"]] == ["q2", "q1"]
+    assert report["average_score"] == 0.6
+    assert report["verdict_counts"] == {"Strong": 1, "Weak": 1}
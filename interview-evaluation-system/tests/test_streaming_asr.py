@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("librosa")
+
+from core.models.audio.streaming_asr import IncrementalTranscriber
+
+SAMPLE_RATE = 16000
+
+
+class _ContinuousSpeechASR:
+    """
+    One segment spanning the whole clip (no pause to split on);
+    its words are the second markers found in the audio.
+    """
+
+    def transcribe_segments(self, audio, sample_rate):
+        if not len(audio):
+            return []
+        markers = dict.fromkeys(int(round(v * 100)) for v in audio[::sample_rate // 4])
+        text = " ".join(f"s{m}" for m in markers)
+        return [(0.0, len(audio) / sample_rate, text)]
+
+
+def _second(i):
+    # Loud enough to count as speech; the value marks the second
+    return np.full(SAMPLE_RATE, (i + 1) / 100, dtype=np.float32)
+
+
+def test_segment_longer_than_the_window_is_committed_not_dropped():
+    transcriber = IncrementalTranscriber(
+        _ContinuousSpeechASR(),
+        sample_rate=SAMPLE_RATE,
+        step_seconds=1.0,
+        holdback_seconds=1.0,
+        window_seconds=2.0
+    )
+
+    for i in range(7):
+        transcriber.feed(_second(i))
+        # The decoded tail never grows past the window plus one step
+        assert len(transcriber._tail) <= 3 * SAMPLE_RATE
+
+    transcript, audio, _ = transcriber.finish()
+
+    assert transcript.split() == [f"s{i + 1}" for i in range(7)]
+    assert len(audio) == 7 * SAMPLE_RATE
+
+
+def test_provisional_text_is_held_back_until_final():
+    transcriber = IncrementalTranscriber(
+        _ContinuousSpeechASR(),
+        sample_rate=SAMPLE_RATE,
+        window_seconds=15.0
+    )
+
+    update = transcriber.feed(_second(0))
+
+    assert update.committed == ""
+    assert update.provisional == "s1"
+    assert transcriber.finish()[0] == "s1"
@@ -0,0 +1,68 @@
+import io
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from api.middleware import UploadSizeLimitMiddleware
+
+MAX_BYTES = 1024
+
+
+def _client():
+    app = FastAPI()
+    app.add_middleware(UploadSizeLimitMiddleware, max_bytes=MAX_BYTES, path_prefix="/submit_audio")
+
+    @app.post("/submit_audio/")
+    async def upload(request: Request):
+        return {"received": len(await request.body())}
+
+    @app.post("/submit_text/")
+    async def text(request: Request):
+        return {"received": len(await request.body())}
+
+    return TestClient(app)
+
+
+def _chunks(total, size=256):
+    for _ in range(total // size):
+        yield b"x" * size
+
+
+def test_upload_within_the_limit_passes():
+    response = _client().post("/submit_audio/", content=b"x" * MAX_BYTES)
+
+    assert response.status_code == 200
+    assert response.json() == {"received": MAX_BYTES}
+
+
+def test_declared_oversized_upload_is_refused():
+    response = _client().post("/submit_audio/", content=b"x" * (MAX_BYTES + 1))
+
+    assert response.status_code == 413
+    assert "limit" in response.json()["detail"]
+
+
+def test_streamed_upload_is_aborted_past_the_limit():
+    # Chunked: no Content-Length, counted as it arrives
+    response = _client().post("/submit_audio/", content=_chunks(4 * MAX_BYTES))
+
+    assert response.status_code == 413
+
+
+def test_multipart_audio_upload_is_limited():
+    response = _client().post(
+        "/submit_audio/",
+        files={"audio_file": ("a.wav", io.BytesIO(b"x" * 2 * MAX_BYTES), "audio/wav")}
+    )
+
+    assert response.status_code == 413
+
+
+def test_other_paths_are_not_limited():
+    response = _client().post("/submit_text/", content=b"x" * (4 * MAX_BYTES))
+
+    assert response.status_code == 200